@@ -7,12 +7,16 @@ Following Dependency Inversion Principle (DIP).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from src.infrastructure.persistence.models.event import Event
     from src.infrastructure.persistence.models.event_schema import EventSchema
     from src.infrastructure.persistence.models.subject import Subject
+    from src.infrastructure.persistence.repositories.event_schema_repo import ActiveSchemaView
     from src.presentation.api.v1.schemas.event import EventCreate
 
 
@@ -23,6 +27,10 @@ class IEventRepository(Protocol):
         """Get the hash of the most recent event for a subject within a tenant"""
         ...
 
+    async def get_chain_tip(self, subject_id: str, tenant_id: str) -> tuple[str, datetime] | None:
+        """Get (hash, event_time) of the most recent event for a subject within a tenant"""
+        ...
+
     async def get_last_event(self, subject_id: str, tenant_id: str) -> Event | None:
         """Get the most recent event for a subject within a tenant"""
         ...
@@ -37,6 +45,16 @@ class IEventRepository(Protocol):
         """Create a new event with computed hash"""
         ...
 
+    async def create_events(
+        self,
+        tenant_id: str,
+        items: list[EventCreate],
+        hashes: list[str],
+        previous_hash: str | None,
+    ) -> list[Event]:
+        """Create a chain of events with precomputed hashes"""
+        ...
+
     async def get_by_id(self, event_id: str) -> Event | None:
         """Get event by ID"""
         ...
@@ -85,10 +103,24 @@ class IEventSchemaRepository(Protocol):
         """Get specific schema version"""
         ...
 
-    async def get_active_schema(self, tenant_id: str, event_type: str) -> EventSchema | None:
+    async def get_by_versions(
+        self, tenant_id: str, keys: Sequence[tuple[str, int]]
+    ) -> dict[tuple[str, int], EventSchema]:
+        """Get several schema versions, keyed by (event_type, version)"""
+        ...
+
+    async def get_active_schema(
+        self, tenant_id: str, event_type: str
+    ) -> ActiveSchemaView | None:
         """Get active schema for event type and tenant"""
         ...
 
+    async def get_active_schemas_bulk(
+        self, tenant_id: str, event_types: list[str]
+    ) -> dict[str, ActiveSchemaView]:
+        """Get active schemas for several event types, keyed by event type"""
+        ...
+
     async def get_all_for_event_type(self, tenant_id: str, event_type: str) -> list[EventSchema]:
         """Get all schema versions for event type"""
         ...
@@ -96,3 +128,15 @@ class IEventSchemaRepository(Protocol):
     async def get_next_version(self, tenant_id: str, event_type: str) -> int:
         """Get the next version number for an event_type"""
         ...
+
+    async def create_next_version(
+        self,
+        tenant_id: str,
+        event_type: str,
+        schema_definition: dict[str, Any],
+        *,
+        is_active: bool = True,
+        created_by: str | None = None,
+    ) -> EventSchema:
+        """Create a schema as the next version of its event_type"""
+        ...
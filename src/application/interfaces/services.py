@@ -7,6 +7,7 @@ Following Dependency Inversion Principle (DIP).
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -30,6 +31,14 @@ class IHashService(Protocol):
         """Compute hash for event data"""
         ...
 
+    def compute_hashes_chain(
+        self,
+        previous_hash: str | None,
+        records: Sequence[tuple[str, str, int, datetime, dict[str, Any]]],
+    ) -> list[str]:
+        """Compute chained hashes for a batch of events"""
+        ...
+
 
 class IEventService(Protocol):
     """Protocol for event service (DIP)"""
@@ -9,8 +9,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, or_, select
-
 from src.domain.exceptions import PermissionDeniedError
 
 if TYPE_CHECKING:
@@ -36,42 +34,26 @@ class AuthorizationService:
         self.settings = get_settings()
         self.cache_ttl = self.settings.cache_ttl_permissions
 
-    async def get_user_permissions(self, user_id: str, tenant_id: str) -> set[str]:
+    async def get_user_permissions(self, user_id: str, tenant_id: str) -> frozenset[str]:
         """
         Get all permissions for a user (aggregated from all roles)
         Returns: Set of permission codes like {'event:create', 'subject:read'}
 
         Uses Redis cache to avoid repeated queries (5 min TTL)
         """
-        from src.infrastructure.persistence.models.permission import (
-            Permission, RolePermission, UserRole)
-        from src.infrastructure.persistence.models.role import Role
+        from src.infrastructure.persistence.repositories.permission_repo import \
+            PermissionRepository
 
         # Try cache first
         cache_key = f"permissions:{tenant_id}:{user_id}"
         if self.cache and self.cache.is_available():
             cached = await self.cache.get(cache_key)
             if cached is not None:
-                return set(cached)  # Convert list back to set
-
-        # Cache miss - query database
-        query = (
-            select(Permission.code)
-            .select_from(UserRole)
-            .join(RolePermission, RolePermission.role_id == UserRole.role_id)
-            .join(Permission, Permission.id == RolePermission.permission_id)
-            .join(Role, Role.id == UserRole.role_id)
-            .where(
-                UserRole.user_id == user_id,
-                UserRole.tenant_id == tenant_id,
-                Role.is_active.is_(True),
-                # Handle role expiration
-                or_(UserRole.expires_at.is_(None), UserRole.expires_at > func.now()),
-            )
-        )
-
-        result = await self.db.execute(query)
-        permissions = {row[0] for row in result.fetchall()}
+                return frozenset(cached)  # Convert list back to set
+
+        # Cache miss - single joined query over roles and role permissions
+        repo = PermissionRepository(self.db, enable_audit=False)
+        permissions = await repo.get_user_permissions(user_id, tenant_id)
 
         # Cache for future requests (convert set to list for JSON serialization)
         if self.cache and self.cache.is_available():
@@ -8,9 +8,13 @@ New hash algorithms can be added without modifying this class.
 import hashlib
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+# (subject_id, event_type, schema_version, event_time, payload)
+HashRecord = tuple[str, str, int, datetime, dict[str, Any]]
+
 
 class HashAlgorithm(ABC):
     """Abstract base class for hash algorithms (OCP)"""
@@ -84,3 +88,52 @@ class HashService:
             "previous_hash": previous_hash,
         }
         return self.algorithm.hash(self.canonical_json(hash_content))
+
+    def compute_hashes_chain(
+        self, previous_hash: str | None, records: Sequence[HashRecord]
+    ) -> list[str]:
+        """
+        Compute chained hashes for a batch of events in one pass.
+
+        Produces exactly the same digests as calling compute_hash() per record
+        with each result fed forward as the next previous_hash. Every record is
+        serialized up front around the previous_hash slot (canonical key order
+        places it between payload and schema_version), so the serial chain loop
+        only splices in the prior digest instead of rebuilding and re-encoding
+        a dict per event.
+
+        Args:
+            previous_hash: Hash of the event preceding the batch (None for genesis)
+            records: (subject_id, event_type, schema_version, event_time, payload)
+                tuples in chain order
+
+        Returns:
+            Hex digests in the same order as records
+        """
+        dumps = json.dumps
+        serialized = [
+            (
+                '{"event_time":'
+                + dumps(event_time.isoformat())
+                + ',"event_type":'
+                + dumps(event_type)
+                + ',"payload":'
+                + self.canonical_json(payload)
+                + ',"previous_hash":',
+                ',"schema_version":'
+                + dumps(schema_version)
+                + ',"subject_id":'
+                + dumps(subject_id)
+                + "}",
+            )
+            for subject_id, event_type, schema_version, event_time, payload in records
+        ]
+
+        hash_fn = self.algorithm.hash
+        hashes: list[str] = []
+        prev = dumps(previous_hash)
+        for head, tail in serialized:
+            digest = hash_fn(head + prev + tail)
+            hashes.append(digest)
+            prev = '"' + digest + '"'
+        return hashes
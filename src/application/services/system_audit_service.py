@@ -7,7 +7,8 @@ using the proper EventSchema infrastructure for validation and consistency.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import select
@@ -29,6 +30,26 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Entity fields never copied into audit payloads
+SENSITIVE_FIELDS = frozenset(
+    {
+        "password",
+        "hashed_password",
+        "secret",
+        "api_key",
+        "token",
+        "credentials",
+        "credentials_encrypted",
+        "client_secret",
+        "client_secret_encrypted",
+        "refresh_token",
+        "access_token",
+    }
+)
+
+# Values of these exact types are stored as-is (the common case for audit columns)
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class SystemAuditService:
     """
@@ -136,6 +157,103 @@ class SystemAuditService:
 
         return event
 
+    async def emit_audit_events_bulk(
+        self,
+        tenant_id: str,
+        entity_type: str,
+        action: AuditAction,
+        entities: list[tuple[str, dict[str, Any]]],
+        actor_id: str | None = None,
+        actor_type: ActorType = ActorType.SYSTEM,
+    ) -> list["Event"]:
+        """
+        Emit system audit events for many entities of one type in a single batch.
+
+        The audit chain tip is read once and the batch is hashed in one pass.
+        Events get strictly increasing event_time values (1µs apart) so the
+        chain order is unambiguous. Like emit_audit_event, events are only
+        added to the session; the caller's flush inserts them together.
+
+        Args:
+            tenant_id: The tenant context
+            entity_type: Type of entity (e.g., "subject", "workflow", "user")
+            action: The action performed on every entity
+            entities: (entity_id, entity_data) pairs in chain order
+            actor_id: ID of the user/system that performed the action
+            actor_type: Type of actor (user, system, external)
+
+        Returns:
+            The created audit Events (empty if audit infrastructure not available)
+        """
+        from src.infrastructure.persistence.models.event import Event
+
+        if not entities:
+            return []
+
+        system_subject_id = await self._get_system_subject(tenant_id)
+        if not system_subject_id:
+            logger.warning(
+                "Audit subject not found for tenant %s. "
+                "Ensure tenant was properly initialized.",
+                tenant_id,
+            )
+            return []
+
+        base_time = utc_now()
+        event_times = [base_time + timedelta(microseconds=i) for i in range(len(entities))]
+        payloads = [
+            self._build_audit_payload(
+                entity_type=entity_type,
+                entity_id=entity_id,
+                action=action,
+                actor_id=actor_id,
+                actor_type=actor_type,
+                entity_data=entity_data,
+                metadata=None,
+                timestamp=event_time,
+            )
+            for (entity_id, entity_data), event_time in zip(entities, event_times, strict=True)
+        ]
+
+        previous_hash = await self._get_latest_hash(system_subject_id)
+        hashes = Event.compute_hashes_chain(
+            previous_hash,
+            [
+                (
+                    system_subject_id,
+                    SYSTEM_AUDIT_EVENT_TYPE,
+                    SYSTEM_AUDIT_SCHEMA_VERSION,
+                    event_time,
+                    payload,
+                )
+                for event_time, payload in zip(event_times, payloads, strict=True)
+            ],
+        )
+
+        events = []
+        for event_time, payload, computed_hash in zip(event_times, payloads, hashes, strict=True):
+            events.append(
+                Event(
+                    tenant_id=tenant_id,
+                    subject_id=system_subject_id,
+                    event_type=SYSTEM_AUDIT_EVENT_TYPE,
+                    schema_version=SYSTEM_AUDIT_SCHEMA_VERSION,
+                    event_time=event_time,
+                    payload=payload,
+                    previous_hash=previous_hash,
+                    hash=computed_hash,
+                )
+            )
+            previous_hash = computed_hash
+
+        self.db.add_all(events)
+
+        logger.debug(
+            "Emitted %d audit events for %s.%s", len(events), entity_type, action.value
+        )
+
+        return events
+
     async def _get_system_subject(self, tenant_id: str) -> str | None:
         """
         Get the system audit subject ID for a tenant.
@@ -214,26 +332,17 @@ class SystemAuditService:
 
         Removes sensitive fields and handles non-serializable types.
         """
-        sensitive_fields = {
-            "password",
-            "hashed_password",
-            "secret",
-            "api_key",
-            "token",
-            "credentials",
-            "credentials_encrypted",
-            "client_secret",
-            "client_secret_encrypted",
-            "refresh_token",
-            "access_token",
-        }
-
         sanitized = {}
         for key, value in data.items():
-            if key.lower() in sensitive_fields:
+            if key.lower() in SENSITIVE_FIELDS:
                 sanitized[key] = "[REDACTED]"
+            elif type(value) in _JSON_SCALAR_TYPES:
+                sanitized[key] = value
             elif isinstance(value, datetime):
                 sanitized[key] = value.isoformat()
+            elif isinstance(value, Enum):
+                # str-mixin enums are not exact str; store the value, not the repr
+                sanitized[key] = value.value
             elif hasattr(value, "__dict__") and not isinstance(value, dict):
                 # Handle SQLAlchemy models or other objects
                 sanitized[key] = str(value)
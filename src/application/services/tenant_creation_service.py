@@ -74,7 +74,7 @@ class TenantCreationService:
         tenant = Tenant(
             code=code,
             name=name,
-            status=TenantStatus.ACTIVE.value,
+            status=TenantStatus.ACTIVE,
         )
         created_tenant = await self.tenant_repo.create(tenant)
 
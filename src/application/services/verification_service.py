@@ -117,18 +117,9 @@ class VerificationService:
                 event_results=[],
             )
 
-        event_results: list[VerificationResult] = []
-        valid_count = 0
-        invalid_count = 0
-
-        for i, event in enumerate(events):
-            result = self._verify_event(event, events[i - 1] if i > 0 else None, i)
-            event_results.append(result)
-
-            if result.is_valid:
-                valid_count += 1
-            else:
-                invalid_count += 1
+        event_results = self._verify_chain(events)
+        valid_count = sum(1 for result in event_results if result.is_valid)
+        invalid_count = len(event_results) - valid_count
 
         return ChainVerificationResult(
             subject_id=subject_id,
@@ -154,10 +145,14 @@ class VerificationService:
         Returns:
             ChainVerificationResult aggregated across all subjects
         """
-        # Get all events for tenant in chronological order
-        events = await self.event_repo.get_by_tenant(tenant_id, limit=limit or 100)
+        # Stream the tenant's events, grouping by subject for chain verification
+        events_by_subject: dict[str, list["Event"]] = {}
+        total_events = 0
+        async for event in self.event_repo.iter_by_tenant(tenant_id, limit=limit or 100):
+            events_by_subject.setdefault(event.subject_id, []).append(event)
+            total_events += 1
 
-        if not events:
+        if not total_events:
             return ChainVerificationResult(
                 subject_id=None,
                 tenant_id=tenant_id,
@@ -169,13 +164,6 @@ class VerificationService:
                 event_results=[],
             )
 
-        # Group events by subject for proper chain verification
-        events_by_subject: dict[str, list["Event"]] = {}
-        for event in events:
-            if event.subject_id not in events_by_subject:
-                events_by_subject[event.subject_id] = []
-            events_by_subject[event.subject_id].append(event)
-
         # Sort each subject's events chronologically (oldest first) for verification
         for subject_id in events_by_subject:
             events_by_subject[subject_id] = sorted(
@@ -183,24 +171,18 @@ class VerificationService:
             )
 
         all_results: list[VerificationResult] = []
-        valid_count = 0
-        invalid_count = 0
 
         # Verify each subject's chain
         for _, subject_events in events_by_subject.items():
-            for i, event in enumerate(subject_events):
-                result = self._verify_event(event, subject_events[i - 1] if i > 0 else None, i)
-                all_results.append(result)
+            all_results.extend(self._verify_chain(subject_events))
 
-                if result.is_valid:
-                    valid_count += 1
-                else:
-                    invalid_count += 1
+        valid_count = sum(1 for result in all_results if result.is_valid)
+        invalid_count = len(all_results) - valid_count
 
         return ChainVerificationResult(
             subject_id=None,  # Multiple subjects
             tenant_id=tenant_id,
-            total_events=len(events),
+            total_events=total_events,
             valid_events=valid_count,
             invalid_events=invalid_count,
             is_chain_valid=(invalid_count == 0),
@@ -208,6 +190,49 @@ class VerificationService:
             event_results=all_results,
         )
 
+    def _verify_chain(self, events: list[Event]) -> list[VerificationResult]:
+        """
+        Verify one subject's chain (events oldest first).
+
+        Fast path: check all previous_hash links in one comparison, then
+        recompute the whole chain in a single batched pass. Only when that
+        fails are events re-checked one by one to pinpoint the errors.
+
+        Args:
+            events: Subject's events in chronological order
+
+        Returns:
+            VerificationResult per event, in chain order
+        """
+        stored_hashes = [event.hash for event in events]
+        links_intact = [event.previous_hash for event in events] == [None, *stored_hashes[:-1]]
+
+        if links_intact and stored_hashes == self.hash_service.compute_hashes_chain(
+            None,
+            [
+                (e.subject_id, e.event_type, e.schema_version, e.event_time, e.payload)
+                for e in events
+            ],
+        ):
+            return [
+                VerificationResult(
+                    event_id=event.id,
+                    event_type=event.event_type,
+                    event_time=event.event_time,
+                    sequence=i,
+                    is_valid=True,
+                    expected_hash=event.hash,
+                    actual_hash=event.hash,
+                    previous_hash=event.previous_hash,
+                )
+                for i, event in enumerate(events)
+            ]
+
+        return [
+            self._verify_event(event, events[i - 1] if i > 0 else None, i)
+            for i, event in enumerate(events)
+        ]
+
     def _verify_event(
         self, event: Event, previous_event: Event | None, sequence: int
     ) -> VerificationResult:
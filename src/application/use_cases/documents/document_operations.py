@@ -141,10 +141,10 @@ class DocumentService:
         file_data.seek(0)
 
         # Check for duplicates (per tenant)
-        existing = await self.document_repo.get_by_checksum(tenant_id, checksum)
-        if existing:
+        existing_id = await self.document_repo.get_id_by_checksum(tenant_id, checksum)
+        if existing_id:
             raise ValueError(
-                f"Document with checksum {checksum} already exists (ID: {existing.id})"
+                f"Document with checksum {checksum} already exists (ID: {existing_id})"
             )
 
         # Determine version
@@ -123,3 +123,14 @@ class PermissionDeniedError(TimelineException):
         if action:
             details["action"] = action
         super().__init__(message, "PERMISSION_DENIED", details)
+
+
+class UnknownProviderError(TimelineException):
+    """Raised when an OAuth provider type has no known configuration."""
+
+    def __init__(self, provider_type: str):
+        super().__init__(
+            f"Unknown OAuth provider: {provider_type}",
+            "UNKNOWN_PROVIDER",
+            {"provider_type": provider_type},
+        )
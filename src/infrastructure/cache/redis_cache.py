@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 from src.infrastructure.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Keys removed per DEL command when invalidating by pattern
+DELETE_BATCH_SIZE = 500
+
 
 class CacheService:
     """
@@ -96,7 +99,7 @@ class CacheService:
             value = await redis_client.get(key)
             if value:
                 logger.debug(f"Cache HIT: {key}")
-                return json.loads(value)
+                return orjson.loads(value)
             logger.debug(f"Cache MISS: {key}")
             return None
         except Exception as e:
@@ -109,7 +112,7 @@ class CacheService:
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (JSON serialized with orjson; datetimes become ISO 8601)
             ttl: Time-to-live in seconds (default: 300 = 5 minutes)
 
         Returns:
@@ -120,7 +123,7 @@ class CacheService:
 
         redis_client = self.redis
         try:
-            serialized = json.dumps(value)
+            serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             await redis_client.setex(key, ttl, serialized)
             logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
             return True
@@ -128,6 +131,60 @@ class CacheService:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
 
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """
+        Get many values from cache in one round-trip (Redis MGET)
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in key order; None for misses, or for every key if unavailable
+        """
+        if not keys:
+            return []
+        if not self.is_available() or self.redis is None:
+            return [None] * len(keys)
+
+        redis_client = self.redis
+        try:
+            values = await redis_client.mget(keys)
+            logger.debug(
+                f"Cache MGET: {len(keys)} keys ({sum(v is not None for v in values)} hits)"
+            )
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache mget error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 300) -> bool:
+        """
+        Set many values with the same TTL in one round-trip (pipelined SETEX)
+
+        Args:
+            items: Mapping of cache key to value (JSON serialized)
+            ttl: Time-to-live in seconds (default: 300 = 5 minutes)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not items:
+            return True
+        if not self.is_available() or self.redis is None:
+            return False
+
+        redis_client = self.redis
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+                await pipe.execute()
+            logger.debug(f"Cache SET: {len(items)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache
@@ -150,6 +207,28 @@ class CacheService:
             logger.error(f"Cache delete error for key {key}: {e}")
             return False
 
+    async def delete_many(self, keys: list[str]) -> int:
+        """
+        Delete several keys with one DEL command
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        if not keys or not self.is_available() or self.redis is None:
+            return 0
+
+        redis_client = self.redis
+        try:
+            deleted = await redis_client.delete(*keys)
+            logger.debug(f"Cache DELETE: {len(keys)} keys")
+            return deleted
+        except Exception as e:
+            logger.error(f"Cache delete error for {len(keys)} keys: {e}")
+            return 0
+
     async def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching pattern
@@ -165,11 +244,19 @@ class CacheService:
 
         redis_client = self.redis
         try:
-            # Scan for matching keys (cursor-based for large datasets)
+            # Scan for matching keys (cursor-based for large datasets) and
+            # delete them in batches, one DEL per DELETE_BATCH_SIZE keys
             deleted = 0
-            async for key in redis_client.scan_iter(match=pattern):
-                await redis_client.delete(key)
-                deleted += 1
+            batch: list[str] = []
+            async for key in redis_client.scan_iter(match=pattern, count=DELETE_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= DELETE_BATCH_SIZE:
+                    await redis_client.delete(*batch)
+                    deleted += len(batch)
+                    batch.clear()
+            if batch:
+                await redis_client.delete(*batch)
+                deleted += len(batch)
 
             if deleted > 0:
                 logger.info(f"Cache INVALIDATE: {pattern} ({deleted} keys deleted)")
@@ -178,6 +265,59 @@ class CacheService:
             logger.error(f"Cache delete pattern error for {pattern}: {e}")
             return 0
 
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a pub/sub channel
+
+        Args:
+            channel: Channel name
+            message: Message payload
+
+        Returns:
+            Number of subscribers that received the message
+        """
+        if not self.is_available() or self.redis is None:
+            return 0
+
+        redis_client = self.redis
+        try:
+            return await redis_client.publish(channel, message)
+        except Exception as e:
+            logger.error(f"Cache publish error on {channel}: {e}")
+            return 0
+
+    async def listen(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        on_subscribed: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Subscribe to a pub/sub channel and pass each message to handler
+
+        Runs until cancelled or the subscription fails (errors are logged);
+        run it as a background task.
+
+        Args:
+            channel: Channel name
+            handler: Called with each message payload
+            on_subscribed: Called after subscribing, before the first message
+        """
+        if not self.is_available() or self.redis is None:
+            return
+
+        redis_client = self.redis
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(channel)
+                if on_subscribed is not None:
+                    on_subscribed()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        handler(message["data"])
+        except Exception as e:
+            logger.error(f"Cache subscription error on {channel}: {e}")
+
     async def clear_all(self) -> bool:
         """
         Clear entire cache (use with caution!)
@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from pydantic import model_validator
+from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     # Database
     database_url: str = ""  # Loaded from environment, validated in model_validator
     database_echo: bool = False
+    use_pgbouncer: bool = False  # Transaction-pooling PgBouncer in front of PostgreSQL
 
     # Security
     secret_key: str = ""  # Loaded from environment, validated in model_validator
@@ -61,6 +62,21 @@ class Settings(BaseSettings):
     telemetry_sample_rate: float = 1.0  # Sampling rate (0.0-1.0, 1.0 = 100%)
     telemetry_environment: str = "development"  # deployment environment tag
 
+    @field_validator("database_url")
+    @classmethod
+    def use_asyncpg_driver(cls, value: str) -> str:
+        """
+        Pin PostgreSQL URLs to the asyncpg driver.
+
+        Hosting providers hand out postgres:// or postgresql:// URLs, which
+        would resolve to the sync psycopg2 dialect; the async engine needs
+        asyncpg. URLs that already name a driver are left as they are.
+        """
+        for scheme in ("postgres://", "postgresql://"):
+            if value.startswith(scheme):
+                return "postgresql+asyncpg://" + value.removeprefix(scheme)
+        return value
+
     @model_validator(mode="after")
     def validate_storage_config(self) -> "Settings":
         """Validate storage backend and required configuration"""
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+
 from src.application.interfaces.storage import IStorageService
 from src.infrastructure.external.storage.local_storage import LocalStorageService
 from src.infrastructure.config.settings import Settings
@@ -32,7 +35,12 @@ class StorageFactory:
                 raise ValueError("STORAGE_ROOT required for local backend")
             return LocalStorageService(
                 storage_root=settings.storage_root,
-                base_url=settings.storage_base_url
+                base_url=settings.storage_base_url,
+                # Dedicated key so download tokens never share key material
+                # with the JWTs signed by secret_key
+                signing_key=hmac.new(
+                    settings.secret_key.encode(), b"storage-download-token", hashlib.sha256
+                ).digest(),
             )
 
         elif backend == "s3":
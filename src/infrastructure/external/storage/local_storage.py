@@ -2,15 +2,21 @@
 Local filesystem storage implementation with enterprise security features.
 
 Security Features:
-- Path traversal protection (resolve + prefix validation)
+- Path traversal protection (lexical normpath + prefix validation). Symlinks
+  are resolved and checked only on writes (upload, delete); reads do not
+  detect a link inside the storage root that points outside it.
 - Atomic writes (temp file + atomic rename)
 - Checksum validation (SHA-256)
 - File permissions (0o640 files, 0o750 dirs)
 - Idempotent operations
 """
 
+import asyncio
+import base64
+import binascii
+import errno
 import hashlib
-import json
+import hmac
 import os
 import secrets
 import tempfile
@@ -21,6 +27,7 @@ from typing import Any, BinaryIO, cast
 
 import aiofiles
 import aiofiles.os
+import orjson
 
 from src.infrastructure.exceptions import (
     StorageAlreadyExistsError,
@@ -34,6 +41,77 @@ from src.infrastructure.exceptions import (
 from src.shared.utils import from_timestamp_utc, utc_now
 
 
+def _sync_compute_checksum(file_path: Path) -> str:
+    """Hash a file in one worker-thread hop (OpenSSL-driven read loop)."""
+    with open(file_path, "rb") as f:
+        # Linux fast path: ask the kernel for aggressive readahead so device
+        # reads overlap with hashing
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _sync_write_and_hash(temp_fd: int, content: bytes) -> str:
+    """Write payload to the temp descriptor and hash it from the same buffer."""
+    with os.fdopen(temp_fd, "wb") as f:
+        # Preallocate so block allocation doesn't interleave with the data write
+        if content and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(temp_fd, 0, len(content))
+            except OSError as e:
+                # Filesystem without fallocate support: write normally
+                if e.errno not in (errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL):
+                    raise
+        f.write(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def _sync_sendfile(out_fd: int, file_path: Path, offset: int, count: int | None) -> int:
+    """Copy a file range to out_fd inside the kernel; returns bytes sent."""
+    with open(file_path, "rb") as f:
+        in_fd = f.fileno()
+        remaining = os.fstat(in_fd).st_size - offset if count is None else count
+        sent_total = 0
+        while remaining > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+            sent_total += sent
+        return sent_total
+
+
+def _sync_write_metadata(metadata_path: Path, metadata: dict[str, Any]) -> None:
+    """Write a metadata sidecar (created 0o640) with one write in one thread hop."""
+    fd = os.open(metadata_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o640)
+    try:
+        os.write(fd, orjson.dumps(metadata))
+    finally:
+        os.close(fd)
+
+
+def _sync_read_metadata(metadata_path: Path) -> Any:
+    """Read and parse a metadata sidecar in one worker-thread hop."""
+    try:
+        with open(metadata_path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+
+
+def _sync_remove_empty_parents(parent: Path, storage_root: Path) -> None:
+    """Remove empty directories from parent up to storage_root in one thread hop."""
+    while parent != storage_root:
+        try:
+            if any(parent.iterdir()):
+                break
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+
+
 class LocalStorageService:
     """
     Local filesystem storage with atomic writes and path traversal protection.
@@ -52,10 +130,14 @@ class LocalStorageService:
 
     CHUNK_SIZE = 64 * 1024  # 64KB chunks for streaming
 
-    # Token storage: {token: (storage_ref, expires_at)}
-    _download_tokens: dict[str, tuple[str, datetime]] = {}
+    TOKEN_SIGNATURE_SIZE = hashlib.sha256().digest_size
 
-    def __init__(self, storage_root: str, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        storage_root: str,
+        base_url: str | None = None,
+        signing_key: bytes | None = None,
+    ) -> None:
         """
         Initialize local storage service.
 
@@ -63,19 +145,31 @@ class LocalStorageService:
             storage_root: Base directory for all file storage
             base_url: Base URL for download endpoints (e.g., "https://api.example.com")
                      If None, returns relative path
+            signing_key: HMAC key for stateless download tokens. Share it across
+                     workers so any worker can validate a token. If None, a
+                     random per-process key is used.
         """
         self.storage_root = Path(storage_root).resolve()
+        self._root_str = str(self.storage_root)
+        self._root_prefix = os.path.join(self._root_str, "")
         self.base_url = base_url.rstrip("/") if base_url else None
+        self._signing_key = signing_key or secrets.token_bytes(32)
 
         # Create storage root if it doesn't exist
         self.storage_root.mkdir(parents=True, exist_ok=True, mode=0o750)
 
-    def _get_full_path(self, storage_ref: str) -> Path:
+    def _get_full_path(self, storage_ref: str, strict: bool = False) -> Path:
         """
         Get full filesystem path with security validation.
 
+        Validation is lexical (normpath + prefix check) so it costs no
+        syscalls, but it does not see symlinks: a link inside the storage
+        root that points outside it passes. Pass strict=True to also resolve
+        symlinks; upload and delete do, reads rely on the lexical check.
+
         Args:
             storage_ref: Relative storage path (e.g., "tenants/acme/documents/...")
+            strict: Resolve symlinks and validate the real path as well
 
         Returns:
             Path: Validated absolute path
@@ -83,16 +177,39 @@ class LocalStorageService:
         Raises:
             StoragePermissionError: If path traversal detected
         """
-        # Resolve full path
-        full_path = (self.storage_root / storage_ref).resolve()
+        full_path = os.path.normpath(os.path.join(self._root_str, storage_ref))
 
         # Security check: ensure path is within storage root
-        try:
-            full_path.relative_to(self.storage_root)
-        except ValueError as e:
-            raise StoragePermissionError(storage_ref, "path_validation") from e
+        if not full_path.startswith(self._root_prefix) and full_path != self._root_str:
+            raise StoragePermissionError(storage_ref, "path_validation")
+
+        if strict:
+            try:
+                Path(full_path).resolve().relative_to(self.storage_root)
+            except ValueError as e:
+                raise StoragePermissionError(storage_ref, "path_validation") from e
+
+        return Path(full_path)
+
+    @staticmethod
+    def _meta_path(file_path: Path) -> Path:
+        """Get the metadata sidecar path for a data file."""
+        return file_path.with_name(file_path.name + ".meta.json")
+
+    async def _try_stat(self, file_path: Path) -> os.stat_result | None:
+        """
+        Stat a file in one syscall.
+
+        Args:
+            file_path: Path to file
 
-        return full_path
+        Returns:
+            os.stat_result | None: Stat result, or None if file doesn't exist
+        """
+        try:
+            return await asyncio.to_thread(os.stat, file_path)
+        except FileNotFoundError:
+            return None
 
     async def _compute_checksum(self, file_path: Path) -> str:
         """
@@ -104,16 +221,7 @@ class LocalStorageService:
         Returns:
             str: Hexadecimal checksum (64 characters)
         """
-        sha256 = hashlib.sha256()
-
-        async with aiofiles.open(file_path, "rb") as f:
-            while True:
-                chunk = await f.read(self.CHUNK_SIZE)
-                if not chunk:
-                    break
-                sha256.update(chunk)
-
-        return sha256.hexdigest()
+        return await asyncio.to_thread(_sync_compute_checksum, file_path)
 
     async def _write_metadata(self, file_path: Path, metadata: dict[str, Any]) -> None:
         """
@@ -123,13 +231,10 @@ class LocalStorageService:
             file_path: Path to data file
             metadata: Metadata dictionary
         """
-        metadata_path = file_path.with_suffix(file_path.suffix + ".meta.json")
+        metadata_path = self._meta_path(file_path)
 
-        async with aiofiles.open(metadata_path, "w") as f:
-            await f.write(json.dumps(metadata, indent=2))
-
-        # Set permissions
-        os.chmod(metadata_path, 0o640)
+        # Open (with mode), write and close in a single thread hop
+        await asyncio.to_thread(_sync_write_metadata, metadata_path, metadata)
 
     async def _read_metadata(self, file_path: Path) -> dict[str, Any]:
         """
@@ -141,17 +246,12 @@ class LocalStorageService:
         Returns:
             dict: Metadata or empty dict if not found
         """
-        metadata_path = file_path.with_suffix(file_path.suffix + ".meta.json")
+        metadata_path = self._meta_path(file_path)
 
-        if not metadata_path.exists():
+        result = await asyncio.to_thread(_sync_read_metadata, metadata_path)
+        if not isinstance(result, dict):
             return {}
-
-        async with aiofiles.open(metadata_path, "r") as f:
-            content = await f.read()
-            result = json.loads(content)
-            if not isinstance(result, dict):
-                return {}
-            return cast(dict[str, Any], result)
+        return cast(dict[str, Any], result)
 
     async def upload(
         self,
@@ -166,7 +266,8 @@ class LocalStorageService:
 
         Implementation:
         1. Validate path (no traversal)
-        2. Check if file exists with same checksum (idempotency)
+        2. Check if file exists with same checksum (idempotency, answered
+           from the sidecar when its size/mtime fingerprint is current)
         3. Write to temp file
         4. Compute checksum
         5. Validate checksum
@@ -189,20 +290,30 @@ class LocalStorageService:
             StorageUploadError: If upload fails
         """
         try:
-            # Validate path
-            target_path = self._get_full_path(storage_ref)
+            # Validate path (strict: never write through a symlink out of the root)
+            target_path = self._get_full_path(storage_ref, strict=True)
 
             # Check if file already exists
-            if target_path.exists():
-                existing_checksum = await self._compute_checksum(target_path)
+            existing_stat = await self._try_stat(target_path)
+            if existing_stat is not None:
+                existing_metadata = await self._read_metadata(target_path)
+                existing_checksum = existing_metadata.get("checksum")
+
+                # Trust the sidecar checksum only while size and mtime still
+                # match the data file; otherwise re-hash the file
+                if (
+                    existing_checksum is None
+                    or existing_metadata.get("size") != existing_stat.st_size
+                    or existing_metadata.get("mtime_ns") != existing_stat.st_mtime_ns
+                ):
+                    existing_checksum = await self._compute_checksum(target_path)
 
                 if existing_checksum == expected_checksum:
                     # Idempotent: file already exists with same checksum
-                    existing_metadata = await self._read_metadata(target_path)
                     return {
                         "storage_ref": storage_ref,
                         "checksum": existing_checksum,
-                        "size": target_path.stat().st_size,
+                        "size": existing_stat.st_size,
                         "uploaded_at": existing_metadata.get(
                             "uploaded_at", utc_now().isoformat()
                         ),
@@ -224,16 +335,15 @@ class LocalStorageService:
             )
 
             try:
-                # Write content
-                async with aiofiles.open(temp_path, "wb") as f:
-                    await f.write(file_content)
+                # Write content and compute checksum in one pass over the
+                # in-memory buffer (no second read of the temp file)
+                computed_checksum = await asyncio.to_thread(
+                    _sync_write_and_hash, temp_fd, file_content
+                )
 
                 # Set file permissions
                 os.chmod(temp_path, 0o640)
 
-                # Compute checksum
-                computed_checksum = await self._compute_checksum(Path(temp_path))
-
                 # Validate checksum
                 if computed_checksum != expected_checksum:
                     raise StorageChecksumMismatchError(
@@ -250,6 +360,7 @@ class LocalStorageService:
                     "storage_ref": storage_ref,
                     "checksum": computed_checksum,
                     "size": file_size,
+                    "mtime_ns": target_path.stat().st_mtime_ns,
                     "content_type": content_type,
                     "uploaded_at": utc_now().isoformat(),
                     "custom": metadata or {},
@@ -266,7 +377,6 @@ class LocalStorageService:
             finally:
                 # Clean up temp file if it still exists
                 if Path(temp_path).exists():
-                    os.close(temp_fd)
                     os.unlink(temp_path)
 
         except (
@@ -295,21 +405,63 @@ class LocalStorageService:
         try:
             file_path = self._get_full_path(storage_ref)
 
-            if not file_path.exists():
-                raise StorageNotFoundError(f"File not found: {storage_ref}")
+            try:
+                f = await aiofiles.open(file_path, "rb")
+            except FileNotFoundError as e:
+                raise StorageNotFoundError(f"File not found: {storage_ref}") from e
 
-            async with aiofiles.open(file_path, "rb") as f:
+            try:
                 while True:
                     chunk = await f.read(self.CHUNK_SIZE)
                     if not chunk:
                         break
                     yield chunk
+            finally:
+                await f.close()
 
         except StorageNotFoundError:
             raise
         except Exception as e:
             raise StorageDownloadError(storage_ref, f"Download failed: {str(e)}") from e
 
+    async def sendfile_to(
+        self,
+        storage_ref: str,
+        out_fd: int,
+        offset: int = 0,
+        count: int | None = None,
+    ) -> int:
+        """
+        Copy file content to a file descriptor with os.sendfile.
+
+        Data is copied inside the kernel, so no Python buffers are allocated
+        per chunk. Use when the consumer owns a real descriptor (socket,
+        pipe or file); ASGI responses should keep using download().
+
+        Args:
+            storage_ref: Storage path
+            out_fd: Destination file descriptor
+            offset: Byte offset to start from
+            count: Number of bytes to send (default: to end of file)
+
+        Returns:
+            int: Number of bytes sent
+
+        Raises:
+            StorageNotFoundError: If file doesn't exist
+            StorageDownloadError: If transfer fails
+        """
+        file_path = self._get_full_path(storage_ref)
+
+        try:
+            return await asyncio.to_thread(
+                _sync_sendfile, out_fd, file_path, offset, count
+            )
+        except FileNotFoundError as e:
+            raise StorageNotFoundError(f"File not found: {storage_ref}") from e
+        except Exception as e:
+            raise StorageDownloadError(storage_ref, f"Sendfile failed: {str(e)}") from e
+
     async def delete(self, storage_ref: str) -> bool:
         """
         Delete file from storage.
@@ -324,30 +476,32 @@ class LocalStorageService:
             StorageDeleteError: If deletion fails
         """
         try:
-            file_path = self._get_full_path(storage_ref)
-
-            if not file_path.exists():
-                return False
+            file_path = self._get_full_path(storage_ref, strict=True)
+
+            # Delete data and metadata files concurrently
+            metadata_path = self._meta_path(file_path)
+            results: list[BaseException | None] = await asyncio.gather(
+                aiofiles.os.remove(file_path),
+                aiofiles.os.remove(metadata_path),
+                return_exceptions=True,
+            )
+            data_result, metadata_result = results
 
-            # Delete data file
-            await aiofiles.os.remove(file_path)
+            # Metadata sidecar is optional
+            if isinstance(metadata_result, BaseException) and not isinstance(
+                metadata_result, FileNotFoundError
+            ):
+                raise metadata_result
 
-            # Delete metadata file if exists
-            metadata_path = file_path.with_suffix(file_path.suffix + ".meta.json")
-            if metadata_path.exists():
-                await aiofiles.os.remove(metadata_path)
+            if isinstance(data_result, FileNotFoundError):
+                return False
+            if isinstance(data_result, BaseException):
+                raise data_result
 
             # Clean up empty parent directories
-            parent = file_path.parent
-            while parent != self.storage_root:
-                try:
-                    if not any(parent.iterdir()):
-                        parent.rmdir()
-                        parent = parent.parent
-                    else:
-                        break
-                except OSError:
-                    break
+            await asyncio.to_thread(
+                _sync_remove_empty_parents, file_path.parent, self.storage_root
+            )
 
             return True
 
@@ -366,7 +520,7 @@ class LocalStorageService:
         """
         try:
             file_path = self._get_full_path(storage_ref)
-            return file_path.exists()
+            return await self._try_stat(file_path) is not None
         except Exception as e:
             raise StorageNotFoundError(f"File not found: {storage_ref}") from e
 
@@ -385,10 +539,10 @@ class LocalStorageService:
         """
         file_path = self._get_full_path(storage_ref)
 
-        if not file_path.exists():
+        stat = await self._try_stat(file_path)
+        if stat is None:
             raise StorageNotFoundError(f"File not found: {storage_ref}")
 
-        stat = file_path.stat()
         stored_metadata = await self._read_metadata(file_path)
 
         return {
@@ -421,15 +575,11 @@ class LocalStorageService:
         if not await self.exists(storage_ref):
             raise StorageNotFoundError(f"File not found: {storage_ref}")
 
-        # Generate secure token
-        token = secrets.token_urlsafe(32)
+        # Generate signed token: payload = "{expires_ts}:{storage_ref}"
         expires_at = utc_now() + expiration
-
-        # Store token mapping
-        self._download_tokens[token] = (storage_ref, expires_at)
-
-        # Clean expired tokens
-        self._cleanup_expired_tokens()
+        payload = f"{int(expires_at.timestamp())}:{storage_ref}".encode()
+        signature = hmac.new(self._signing_key, payload, hashlib.sha256).digest()
+        token = base64.urlsafe_b64encode(payload + signature).decode().rstrip("=")
 
         # Return URL
         path = f"/api/storage/download/{token}"
@@ -437,17 +587,6 @@ class LocalStorageService:
             return f"{self.base_url}{path}"
         return path
 
-    def _cleanup_expired_tokens(self) -> None:
-        """Remove expired download tokens."""
-        now = utc_now()
-        expired = [
-            token
-            for token, (_, expires_at) in self._download_tokens.items()
-            if expires_at <= now
-        ]
-        for token in expired:
-            del self._download_tokens[token]
-
     def validate_download_token(self, token: str) -> str | None:
         """
         Validate download token and return storage_ref if valid.
@@ -458,14 +597,28 @@ class LocalStorageService:
         Returns:
             str | None: Storage reference if valid, None if invalid/expired
         """
-        if token not in self._download_tokens:
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (binascii.Error, ValueError):
+            return None
+
+        if len(raw) <= self.TOKEN_SIGNATURE_SIZE:
             return None
 
-        storage_ref, expires_at = self._download_tokens[token]
+        payload = raw[: -self.TOKEN_SIGNATURE_SIZE]
+        signature = raw[-self.TOKEN_SIGNATURE_SIZE :]
+        expected = hmac.new(self._signing_key, payload, hashlib.sha256).digest()
+        if not hmac.compare_digest(signature, expected):
+            return None
+
+        try:
+            expires_ts, storage_ref = payload.decode().split(":", 1)
+            expires_at = int(expires_ts)
+        except ValueError:
+            return None
 
         # Check if expired
-        if utc_now() > expires_at:
-            del self._download_tokens[token]
+        if utc_now().timestamp() > expires_at:
             return None
 
         return storage_ref
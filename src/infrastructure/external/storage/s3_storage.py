@@ -15,12 +15,17 @@ Compatible with:
 - Any S3-compatible storage
 """
 
+import asyncio
+import base64
 import hashlib
+import os
 from collections.abc import AsyncIterator
-from datetime import timedelta
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from typing import Any, BinaryIO
 
 import aioboto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from src.infrastructure.exceptions import (
@@ -31,6 +36,7 @@ from src.infrastructure.exceptions import (
     StorageNotFoundError,
     StorageUploadError,
 )
+from src.shared.utils import utc_now
 
 
 class S3StorageService:
@@ -48,6 +54,8 @@ class S3StorageService:
     """
 
     CHUNK_SIZE = 64 * 1024  # 64KB chunks for streaming
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024  # Larger uploads stream as multipart
+    MULTIPART_CONCURRENCY = 8
 
     def __init__(
         self,
@@ -79,6 +87,41 @@ class S3StorageService:
             aws_secret_access_key=secret_key,
             region_name=region,
         )
+        # Shared client, created lazily on first use (see _get_client)
+        self._client: Any = None
+        self._client_ctx: Any = None
+        self._client_lock = asyncio.Lock()
+
+        self._transfer_config = TransferConfig(
+            multipart_threshold=self.MULTIPART_THRESHOLD,
+            max_concurrency=self.MULTIPART_CONCURRENCY,
+        )
+
+    async def _get_client(self) -> Any:
+        """
+        Get the shared S3 client, creating it on first use.
+
+        The client (and its connection pool) lives for the lifetime of the
+        service instead of being rebuilt per operation.
+        """
+        if self._client is not None:
+            return self._client
+
+        async with self._client_lock:
+            if self._client is None:
+                client_ctx = self.session.client("s3", **self._get_client_config())
+                self._client = await client_ctx.__aenter__()
+                self._client_ctx = client_ctx
+
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared S3 client (call on app shutdown)"""
+        if self._client_ctx is not None:
+            client_ctx = self._client_ctx
+            self._client_ctx = None
+            self._client = None
+            await client_ctx.__aexit__(None, None, None)
 
     def _get_client_config(self) -> dict[str, str]:
         """Get boto3 client configuration"""
@@ -97,17 +140,57 @@ class S3StorageService:
         Returns:
             str: Hexadecimal checksum (64 characters)
         """
-        sha256 = hashlib.sha256()
         file_data.seek(0)
+        # BinaryIO does not declare readinto(); the streams passed here
+        # (BytesIO, spooled upload files) all provide it
+        digest = await asyncio.to_thread(
+            hashlib.file_digest, file_data, "sha256"  # type: ignore[arg-type]
+        )
+        file_data.seek(0)
+        return digest.hexdigest()
 
-        while True:
-            chunk = file_data.read(self.CHUNK_SIZE)
-            if not chunk:
-                break
-            sha256.update(chunk)
+    async def _existing_upload_result(
+        self, s3: Any, storage_ref: str, expected_checksum: str
+    ) -> dict[str, Any]:
+        """
+        Resolve an upload against an object that already exists.
 
-        file_data.seek(0)
-        return sha256.hexdigest()
+        Returns:
+            dict: Upload result of the existing object (idempotent re-upload)
+
+        Raises:
+            StorageAlreadyExistsError: If existing object has a different checksum
+            ClientError: If the object does not exist (404)
+        """
+        head = await s3.head_object(Bucket=self.bucket, Key=storage_ref)
+        existing_checksum = head.get("Metadata", {}).get("sha256")
+
+        if existing_checksum != expected_checksum:
+            raise StorageAlreadyExistsError(storage_ref)
+
+        return {
+            "storage_ref": storage_ref,
+            "checksum": existing_checksum,
+            "size": head["ContentLength"],
+            "uploaded_at": head["LastModified"].isoformat(),
+        }
+
+    @staticmethod
+    def _response_timestamp(response: dict[str, Any] | None) -> datetime:
+        """
+        Get the server-side timestamp of a write from its response headers.
+
+        Avoids a follow-up head_object just to learn LastModified. Falls back
+        to the local clock when the headers are unavailable.
+        """
+        headers = (response or {}).get("ResponseMetadata", {}).get("HTTPHeaders", {})
+        header = headers.get("last-modified") or headers.get("date")
+        if header:
+            try:
+                return parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                pass
+        return utc_now()
 
     async def upload(
         self,
@@ -121,10 +204,15 @@ class S3StorageService:
         Upload file to S3 with checksum validation.
 
         Implementation:
-        1. Check if object exists with same checksum (idempotency)
-        2. Upload to S3 with server-side encryption
-        3. Store checksum in S3 metadata
-        4. Validate upload success
+        1. Conditional upload (If-None-Match: *) with server-side encryption;
+           S3 verifies expected_checksum (ChecksumSHA256) so the payload is
+           never hashed locally
+        2. Store checksum in S3 metadata
+        3. On 412 (object exists), compare stored checksum (idempotency)
+
+        Files at or above MULTIPART_THRESHOLD are hashed locally and streamed
+        with a concurrent multipart upload instead; the existence check is
+        then a head_object.
 
         Args:
             file_data: File content (binary mode)
@@ -142,37 +230,25 @@ class S3StorageService:
             StorageUploadError: If upload fails
         """
         try:
-            async with self.session.client("s3", **self._get_client_config()) as s3:
-                # Check if object already exists
-                try:
-                    head = await s3.head_object(Bucket=self.bucket, Key=storage_ref)
-                    existing_checksum = head.get("Metadata", {}).get("sha256")
-
-                    if existing_checksum == expected_checksum:
-                        # Idempotent: object already exists with same checksum
-                        return {
-                            "storage_ref": storage_ref,
-                            "checksum": existing_checksum,
-                            "size": head["ContentLength"],
-                            "uploaded_at": head["LastModified"].isoformat(),
-                        }
-                    else:
-                        # Object exists with different checksum
-                        raise StorageAlreadyExistsError(storage_ref)
-                except ClientError as e:
-                    if e.response["Error"]["Code"] != "404":
-                        raise
-
-                # Read file content
-                file_data.seek(0)
-                file_content = file_data.read()
-                file_size = len(file_content)
+            s3 = await self._get_client()
+
+            file_size = file_data.seek(0, os.SEEK_END)
+            file_data.seek(0)
+
+            # S3 expects the SHA-256 as base64 of the raw 32-byte digest
+            try:
+                checksum_digest = bytes.fromhex(expected_checksum)
+            except ValueError:
+                checksum_digest = b""
+            if len(checksum_digest) != hashlib.sha256().digest_size:
+                raise StorageChecksumMismatchError(
+                    storage_ref, expected_checksum, "invalid SHA-256 checksum"
+                )
 
-                # Compute checksum
-                file_data.seek(0)
+            if file_size >= self.MULTIPART_THRESHOLD:
+                # Multipart parts only carry per-part checksums, so the
+                # whole-object SHA-256 has to be validated locally
                 computed_checksum = await self._compute_checksum(file_data)
-
-                # Validate checksum
                 if computed_checksum != expected_checksum:
                     raise StorageChecksumMismatchError(
                         storage_ref,
@@ -180,36 +256,74 @@ class S3StorageService:
                         computed_checksum,
                     )
 
-                # Prepare metadata
-                s3_metadata = {
-                    "sha256": computed_checksum,
-                    "original-size": str(file_size),
-                }
-                if metadata:
-                    # S3 metadata keys must be lowercase with hyphens
-                    for key, value in metadata.items():
-                        s3_metadata[key.lower().replace("_", "-")] = value
-
-                # Upload to S3
-                file_data.seek(0)
-                await s3.put_object(
-                    Bucket=self.bucket,
-                    Key=storage_ref,
-                    Body=file_content,
-                    ContentType=content_type,
-                    ServerSideEncryption="AES256",
-                    Metadata=s3_metadata,
-                )
+            # Prepare metadata
+            s3_metadata = {
+                "sha256": expected_checksum,
+                "original-size": str(file_size),
+            }
+            if metadata:
+                # S3 metadata keys must be lowercase with hyphens
+                for key, value in metadata.items():
+                    s3_metadata[key.lower().replace("_", "-")] = value
+
+            if file_size < self.MULTIPART_THRESHOLD:
+                # Conditional upload: S3 rejects the put with 412 if the key
+                # exists and verifies the SHA-256 server-side, so the happy
+                # path is a single request (no pre-check or verify head)
+                try:
+                    put_response = await s3.put_object(
+                        Bucket=self.bucket,
+                        Key=storage_ref,
+                        Body=file_data,
+                        ContentType=content_type,
+                        ServerSideEncryption="AES256",
+                        Metadata=s3_metadata,
+                        IfNoneMatch="*",
+                        ChecksumSHA256=base64.b64encode(checksum_digest).decode(),
+                    )
+                except ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+                    if error_code in ("BadDigest", "XAmzContentChecksumMismatch"):
+                        raise StorageChecksumMismatchError(
+                            storage_ref, expected_checksum, "rejected by S3"
+                        ) from e
+                    if error_code not in ("PreconditionFailed", "412"):
+                        raise
+                    return await self._existing_upload_result(
+                        s3, storage_ref, expected_checksum
+                    )
+            else:
+                # Multipart uploads can't be made conditional on create,
+                # so check for an existing object first
+                try:
+                    return await self._existing_upload_result(
+                        s3, storage_ref, expected_checksum
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] != "404":
+                        raise
 
-                # Verify upload
-                head = await s3.head_object(Bucket=self.bucket, Key=storage_ref)
+                # Stream parts concurrently without buffering the file
+                put_response = None
+                await s3.upload_fileobj(
+                    file_data,
+                    self.bucket,
+                    storage_ref,
+                    ExtraArgs={
+                        "ContentType": content_type,
+                        "ServerSideEncryption": "AES256",
+                        "Metadata": s3_metadata,
+                        "ChecksumAlgorithm": "SHA256",
+                    },
+                    Config=self._transfer_config,
+                )
 
-                return {
-                    "storage_ref": storage_ref,
-                    "checksum": computed_checksum,
-                    "size": file_size,
-                    "uploaded_at": head["LastModified"].isoformat(),
-                }
+            return {
+                "storage_ref": storage_ref,
+                "checksum": expected_checksum,
+                "size": file_size,
+                "uploaded_at": self._response_timestamp(put_response).isoformat(),
+            }
 
         except (StorageChecksumMismatchError, StorageAlreadyExistsError):
             raise
@@ -231,21 +345,22 @@ class S3StorageService:
             StorageDownloadError: If download fails
         """
         try:
-            async with self.session.client("s3", **self._get_client_config()) as s3:
-                try:
-                    response = await s3.get_object(Bucket=self.bucket, Key=storage_ref)
+            s3 = await self._get_client()
 
-                    async with response["Body"] as stream:
-                        while True:
-                            chunk = await stream.read(self.CHUNK_SIZE)
-                            if not chunk:
-                                break
-                            yield chunk
+            try:
+                response = await s3.get_object(Bucket=self.bucket, Key=storage_ref)
 
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "NoSuchKey":
-                        raise StorageNotFoundError(f"File not found: {storage_ref}") from e
-                    raise
+                async with response["Body"] as stream:
+                    while True:
+                        chunk = await stream.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        yield chunk
+
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "NoSuchKey":
+                    raise StorageNotFoundError(f"File not found: {storage_ref}") from e
+                raise
 
         except StorageNotFoundError:
             raise
@@ -266,18 +381,19 @@ class S3StorageService:
             StorageDeleteError: If deletion fails
         """
         try:
-            async with self.session.client("s3", **self._get_client_config()) as s3:
-                # Check if object exists
-                try:
-                    await s3.head_object(Bucket=self.bucket, Key=storage_ref)
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "404":
-                        return False
-                    raise
+            s3 = await self._get_client()
+
+            # Check if object exists
+            try:
+                await s3.head_object(Bucket=self.bucket, Key=storage_ref)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "404":
+                    return False
+                raise
 
-                # Delete object
-                await s3.delete_object(Bucket=self.bucket, Key=storage_ref)
-                return True
+            # Delete object
+            await s3.delete_object(Bucket=self.bucket, Key=storage_ref)
+            return True
 
         except Exception as e:
             raise StorageDeleteError(storage_ref, f"Delete failed: {e}") from e
@@ -293,9 +409,10 @@ class S3StorageService:
             bool: True if exists
         """
         try:
-            async with self.session.client("s3", **self._get_client_config()) as s3:
-                await s3.head_object(Bucket=self.bucket, Key=storage_ref)
-                return True
+            s3 = await self._get_client()
+
+            await s3.head_object(Bucket=self.bucket, Key=storage_ref)
+            return True
         except ClientError as e:
             if e.response["Error"]["Code"] == "404":
                 return False
@@ -317,18 +434,19 @@ class S3StorageService:
             StorageNotFoundError: If object doesn't exist
         """
         try:
-            async with self.session.client("s3", **self._get_client_config()) as s3:
-                head = await s3.head_object(Bucket=self.bucket, Key=storage_ref)
+            s3 = await self._get_client()
 
-                custom_metadata = head.get("Metadata", {})
+            head = await s3.head_object(Bucket=self.bucket, Key=storage_ref)
 
-                return {
-                    "size": head["ContentLength"],
-                    "content_type": head.get("ContentType", "application/octet-stream"),
-                    "checksum": custom_metadata.get("sha256"),
-                    "last_modified": head["LastModified"].isoformat(),
-                    "custom": custom_metadata,
-                }
+            custom_metadata = head.get("Metadata", {})
+
+            return {
+                "size": head["ContentLength"],
+                "content_type": head.get("ContentType", "application/octet-stream"),
+                "checksum": custom_metadata.get("sha256"),
+                "last_modified": head["LastModified"].isoformat(),
+                "custom": custom_metadata,
+            }
 
         except ClientError as e:
             if e.response["Error"]["Code"] == "404":
@@ -354,23 +472,24 @@ class S3StorageService:
             StorageNotFoundError: If object doesn't exist
         """
         try:
-            async with self.session.client("s3", **self._get_client_config()) as s3:
-                # Verify object exists
-                try:
-                    await s3.head_object(Bucket=self.bucket, Key=storage_ref)
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "404":
-                        raise StorageNotFoundError(f"File not found: {storage_ref}") from e
-                    raise
-
-                # Generate pre-signed URL
-                url: str = await s3.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": self.bucket, "Key": storage_ref},
-                    ExpiresIn=int(expiration.total_seconds()),
-                )
+            s3 = await self._get_client()
 
-                return url
+            # Verify object exists
+            try:
+                await s3.head_object(Bucket=self.bucket, Key=storage_ref)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "404":
+                    raise StorageNotFoundError(f"File not found: {storage_ref}") from e
+                raise
+
+            # Generate pre-signed URL
+            url: str = await s3.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket, "Key": storage_ref},
+                ExpiresIn=int(expiration.total_seconds()),
+            )
+
+            return url
 
         except StorageNotFoundError:
             raise
@@ -1,28 +1,63 @@
+import os
+from typing import Any
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
                                     create_async_engine)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from src.infrastructure.config.settings import get_settings
 
 settings = get_settings()
 
+# Scale the pool with available cores; parallel tenant syncs each hold a session
+POOL_SIZE = min((os.cpu_count() or 1) * 4, 64)
+
+if settings.use_pgbouncer:
+    # PgBouncer (transaction pooling) owns the pool; server-side prepared
+    # statements do not survive across backends, so asyncpg's caches are
+    # disabled and every statement gets a unique name.
+    pool_kwargs: dict[str, Any] = {"poolclass": NullPool}
+    driver_connect_args: dict[str, Any] = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+    # PgBouncer rejects unknown startup parameters, so jit is disabled
+    # server-side instead (ALTER ROLE ... SET jit = off)
+    server_settings: dict[str, str] = {"application_name": "timeline"}
+else:
+    pool_kwargs = {
+        "pool_size": POOL_SIZE,
+        "max_overflow": 30,
+        "pool_recycle": 3600,
+        "pool_use_lifo": True,  # Reuse the most recently returned (warm) connection
+    }
+    driver_connect_args = {
+        # asyncpg server-side prepared statements for repeated inserts/lookups
+        "prepared_statement_cache_size": 512,
+    }
+    server_settings = {"jit": "off", "application_name": "timeline"}
+
 # Create engine once at module level (not with lru_cache)
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=30,
-    pool_recycle=3600,
     query_cache_size=1200,
+    insertmanyvalues_page_size=1000,  # Rows per batched INSERT during flush
     connect_args=(
         {
-            "server_settings": {"jit": "off"},
+            # application_name tags the pool's backends in pg_stat_activity
+            "server_settings": server_settings,
             "command_timeout": 60,
+            **driver_connect_args,
         }
         if "postgresql" in settings.database_url
         else {}
     ),
+    **pool_kwargs,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -0,0 +1,43 @@
+"""Narrow workflow.execution_order to SMALLINT
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-17 18:00:00.000000
+
+Execution priorities are small non-negative numbers (the API caps them at
+32767), so the column and the ix_workflow_dispatch index entries that carry
+it shrink from 4 to 2 bytes.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b4c5d6e7f8"
+down_revision: str | Sequence[str] | None = "f2a3b4c5d6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert workflow.execution_order to SMALLINT."""
+    op.alter_column(
+        "workflow",
+        "execution_order",
+        existing_type=sa.Integer(),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Restore workflow.execution_order as INTEGER."""
+    op.alter_column(
+        "workflow",
+        "execution_order",
+        existing_type=sa.SmallInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,38 @@
+"""Convert remaining JSON columns to JSONB
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 14:00:00.000000
+
+event.payload was already converted in a1b2c3d4e5f6. This moves
+email_account.connection_params, email_account.granted_scopes and
+event_schema.schema_definition to JSONB so reads no longer reparse text.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: str | Sequence[str] | None = "f6a7b8c9d0e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSON_COLUMNS: list[tuple[str, str]] = [
+    ("email_account", "connection_params"),
+    ("email_account", "granted_scopes"),
+    ("event_schema", "schema_definition"),
+]
+
+
+def upgrade() -> None:
+    """Alter JSON columns to JSONB."""
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    """Revert columns to JSON."""
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,80 @@
+"""Enforce one active event schema and OAuth config with partial unique indexes
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-17 19:00:00.000000
+
+get_active_schema and get_active_config look up the active row by equality.
+A unique index over only the active rows guarantees there is at most one, so
+the lookups need no ORDER BY version DESC LIMIT 1 and the planner reads the
+row straight from the index. Where several versions were active, only the
+highest version is kept active (it is the one the old query returned).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c5d6e7f8a9"
+down_revision: str | Sequence[str] | None = "a3b4c5d6e7f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Deactivate superseded active rows and create the partial unique indexes."""
+    op.execute(
+        """
+        UPDATE event_schema AS s
+        SET is_active = false
+        WHERE s.is_active
+          AND EXISTS (
+            SELECT 1 FROM event_schema AS newer
+            WHERE newer.tenant_id = s.tenant_id
+              AND newer.event_type = s.event_type
+              AND newer.is_active
+              AND newer.version > s.version
+          )
+        """
+    )
+    op.create_index(
+        "uq_event_schema_active",
+        "event_schema",
+        ["tenant_id", "event_type"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+    )
+
+    op.execute(
+        """
+        UPDATE oauth_provider_config AS c
+        SET is_active = false
+        WHERE c.is_active
+          AND c.deleted_at IS NULL
+          AND EXISTS (
+            SELECT 1 FROM oauth_provider_config AS newer
+            WHERE newer.tenant_id = c.tenant_id
+              AND newer.provider_type = c.provider_type
+              AND newer.is_active
+              AND newer.deleted_at IS NULL
+              AND newer.version > c.version
+          )
+        """
+    )
+    # Superseded by the unique index; only present on schemas built from the models
+    op.execute("DROP INDEX IF EXISTS ix_oauth_provider_config_active")
+    op.create_index(
+        "uq_oauth_provider_config_active",
+        "oauth_provider_config",
+        ["tenant_id", "provider_type"],
+        unique=True,
+        postgresql_where=sa.text("is_active AND deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial unique indexes (deactivated rows stay inactive)."""
+    op.drop_index("uq_oauth_provider_config_active", table_name="oauth_provider_config")
+    op.drop_index("uq_event_schema_active", table_name="event_schema")
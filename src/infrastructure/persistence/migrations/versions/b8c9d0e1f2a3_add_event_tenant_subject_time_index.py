@@ -0,0 +1,39 @@
+"""Add descending covering index for event chain-tip queries
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17 14:30:00.000000
+
+get_last_hash/get_last_event/get_by_subject filter on (tenant_id, subject_id)
+and order by event_time DESC. A matching (tenant_id, subject_id, event_time
+DESC) INCLUDE (hash) index returns the newest row with an index-only scan
+instead of filtering and sorting. It supersedes ix_event_tenant_subject,
+whose columns are its prefix.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | Sequence[str] | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace (tenant_id, subject_id) index with descending covering index."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_event_tenant_subject_time_desc
+        ON event (tenant_id, subject_id, event_time DESC) INCLUDE (hash)
+        """
+    )
+    op.drop_index("ix_event_tenant_subject", table_name="event")
+
+
+def downgrade() -> None:
+    """Restore (tenant_id, subject_id) index."""
+    op.create_index("ix_event_tenant_subject", "event", ["tenant_id", "subject_id"])
+    op.execute("DROP INDEX IF EXISTS ix_event_tenant_subject_time_desc")
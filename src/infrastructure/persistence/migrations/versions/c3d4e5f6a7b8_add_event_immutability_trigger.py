@@ -0,0 +1,47 @@
+"""Add event immutability trigger
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-17 12:00:00.000000
+
+Moves event immutability from the ORM before_update listener to a
+PostgreSQL BEFORE UPDATE trigger so it applies to every writer
+(ORM, raw SQL and COPY-based bulk inserts alike).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b8"
+down_revision: str | Sequence[str] | None = "b2c3d4e5f6a7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create trigger rejecting UPDATEs on event rows."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION event_prevent_update() RETURNS trigger AS $$
+        BEGIN
+            RAISE EXCEPTION USING MESSAGE =
+                'Events are immutable and cannot be updated. '
+                || 'Create a new compensating event instead.';
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER event_no_update BEFORE UPDATE ON event
+        FOR EACH ROW EXECUTE FUNCTION event_prevent_update()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop event immutability trigger."""
+    op.execute("DROP TRIGGER IF EXISTS event_no_update ON event")
+    op.execute("DROP FUNCTION IF EXISTS event_prevent_update()")
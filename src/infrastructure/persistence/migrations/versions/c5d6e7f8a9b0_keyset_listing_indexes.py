@@ -0,0 +1,54 @@
+"""Add indexes for keyset pagination of schema, OAuth config and audit listings
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-17 20:00:00.000000
+
+get_all_for_tenant and list_configs page by (event_type / provider_type,
+version DESC) after the last row seen instead of OFFSET. The existing unique
+constraints are all-ascending, so they cannot return that mixed order; these
+indexes match it and let each page start at the cursor. OAuth audit history
+pages by (timestamp, id), so ix_oauth_audit_config_time gains id as the
+tiebreaker.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d6e7f8a9b0"
+down_revision: str | Sequence[str] | None = "b4c5d6e7f8a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the listing indexes and extend the audit history index with id."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_event_schema_tenant_type_version_desc
+        ON event_schema (tenant_id, event_type, version DESC)
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_oauth_provider_config_listing
+        ON oauth_provider_config (tenant_id, provider_type, version DESC)
+        WHERE deleted_at IS NULL
+        """
+    )
+    op.create_index(
+        "ix_oauth_audit_config_time_id",
+        "oauth_audit_log",
+        ["provider_config_id", "timestamp", "id"],
+    )
+    # Superseded (its columns are the prefix); only present on schemas built from the models
+    op.execute("DROP INDEX IF EXISTS ix_oauth_audit_config_time")
+
+
+def downgrade() -> None:
+    """Drop the listing indexes."""
+    op.drop_index("ix_oauth_audit_config_time_id", table_name="oauth_audit_log")
+    op.execute("DROP INDEX IF EXISTS ix_oauth_provider_config_listing")
+    op.execute("DROP INDEX IF EXISTS ix_event_schema_tenant_type_version_desc")
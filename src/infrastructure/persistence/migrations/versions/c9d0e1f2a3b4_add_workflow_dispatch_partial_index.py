@@ -0,0 +1,38 @@
+"""Add partial index for workflow dispatch
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-17 15:00:00.000000
+
+The workflow engine looks up live workflows with
+WHERE tenant_id = ? AND trigger_event_type = ? AND is_active
+AND deleted_at IS NULL ORDER BY execution_order. A partial index over only
+the live rows, already ordered by execution_order, serves that lookup
+without a sort.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: str | Sequence[str] | None = "b8c9d0e1f2a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create partial dispatch index on workflow."""
+    op.create_index(
+        "ix_workflow_dispatch",
+        "workflow",
+        ["tenant_id", "trigger_event_type", "execution_order"],
+        postgresql_where=sa.text("is_active AND deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop partial dispatch index."""
+    op.drop_index("ix_workflow_dispatch", table_name="workflow")
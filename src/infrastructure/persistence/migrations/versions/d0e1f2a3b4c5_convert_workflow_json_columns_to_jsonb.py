@@ -0,0 +1,38 @@
+"""Convert workflow JSON columns to JSONB
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-17 15:30:00.000000
+
+Moves workflow.trigger_conditions, workflow.actions and
+workflow_execution.execution_log to JSONB so reads no longer reparse text
+and the columns can be indexed.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: str | Sequence[str] | None = "c9d0e1f2a3b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSON_COLUMNS: list[tuple[str, str]] = [
+    ("workflow", "trigger_conditions"),
+    ("workflow", "actions"),
+    ("workflow_execution", "execution_log"),
+]
+
+
+def upgrade() -> None:
+    """Alter JSON columns to JSONB."""
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    """Revert columns to JSON."""
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
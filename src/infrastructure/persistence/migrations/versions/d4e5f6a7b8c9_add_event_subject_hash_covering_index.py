@@ -0,0 +1,36 @@
+"""Add covering index for event chain lookups
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-17 12:30:00.000000
+
+Adds a composite (subject_id, hash) index that INCLUDEs event_time so the
+previous_hash validation in Event.create_event is a single index-only scan
+instead of an index lookup followed by a heap fetch.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: str | Sequence[str] | None = "c3d4e5f6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create covering index on event (subject_id, hash) INCLUDE (event_time)."""
+    op.create_index(
+        "ix_event_subject_hash",
+        "event",
+        ["subject_id", "hash"],
+        unique=False,
+        postgresql_include=["event_time"],
+    )
+
+
+def downgrade() -> None:
+    """Drop covering index."""
+    op.drop_index("ix_event_subject_hash", table_name="event")
@@ -0,0 +1,38 @@
+"""Convert tenant.status to a native enum
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-17 16:00:00.000000
+
+Replaces the VARCHAR status column and its tenant_status_check CHECK
+constraint with a PostgreSQL ENUM type (4 bytes per row, validated by the
+type itself).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: str | Sequence[str] | None = "d0e1f2a3b4c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create tenant_status enum and convert tenant.status to it."""
+    op.drop_constraint("tenant_status_check", "tenant", type_="check")
+    op.execute("CREATE TYPE tenant_status AS ENUM ('active', 'suspended', 'archived')")
+    op.execute(
+        "ALTER TABLE tenant ALTER COLUMN status TYPE tenant_status USING status::tenant_status"
+    )
+
+
+def downgrade() -> None:
+    """Revert tenant.status to VARCHAR with CHECK constraint."""
+    op.execute("ALTER TABLE tenant ALTER COLUMN status TYPE varchar USING status::text")
+    op.execute("DROP TYPE tenant_status")
+    op.create_check_constraint(
+        "tenant_status_check", "tenant", "status IN ('active', 'suspended', 'archived')"
+    )
@@ -0,0 +1,55 @@
+"""Bound CUID foreign key columns to 25 characters
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 13:00:00.000000
+
+CUID2 identifiers are fixed-size (24 chars by default), so the hot foreign
+key columns on event, role_permission, user_role and email_account are
+narrowed from unbounded VARCHAR to VARCHAR(25).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: str | Sequence[str] | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CUID_COLUMNS: list[tuple[str, str, bool]] = [
+    ("event", "subject_id", False),
+    ("role_permission", "role_id", False),
+    ("role_permission", "permission_id", False),
+    ("user_role", "user_id", False),
+    ("user_role", "role_id", False),
+    ("user_role", "assigned_by", True),
+    ("email_account", "subject_id", False),
+]
+
+
+def upgrade() -> None:
+    """Narrow CUID foreign key columns to VARCHAR(25)."""
+    for table, column, nullable in CUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(),
+            type_=sa.String(length=25),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    """Restore unbounded VARCHAR columns."""
+    for table, column, nullable in CUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=25),
+            type_=sa.String(),
+            existing_nullable=nullable,
+        )
@@ -0,0 +1,86 @@
+"""Hash-partition workflow_execution by tenant_id
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-17 17:00:00.000000
+
+Rebuilds workflow_execution as PARTITION BY HASH (tenant_id) with 32
+partitions so tenant-scoped reads prune to a single partition with small
+indexes. The primary key becomes (tenant_id, id), as PostgreSQL requires the
+partition key in every unique constraint; it also replaces the standalone
+tenant_id index.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: str | Sequence[str] | None = "e1f2a3b4c5d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONS = 32
+
+FOREIGN_KEYS: list[tuple[str, str, str]] = [
+    ("tenant_id", "tenant", "CASCADE"),
+    ("workflow_id", "workflow", "CASCADE"),
+    ("triggered_by_event_id", "event", "SET NULL"),
+    ("triggered_by_subject_id", "subject", "SET NULL"),
+]
+
+INDEXED_COLUMNS = ["workflow_id", "triggered_by_event_id", "triggered_by_subject_id"]
+
+
+def _rebuild(*, partitioned: bool) -> None:
+    """Recreate workflow_execution from a renamed copy, preserving rows."""
+    op.execute("ALTER TABLE workflow_execution RENAME TO workflow_execution_old")
+    op.execute(
+        "ALTER TABLE workflow_execution_old "
+        "RENAME CONSTRAINT workflow_execution_pkey TO workflow_execution_old_pkey"
+    )
+    for column in ["tenant_id", *INDEXED_COLUMNS]:
+        op.execute(f"DROP INDEX IF EXISTS ix_workflow_execution_{column}")
+
+    columns = "LIKE workflow_execution_old INCLUDING DEFAULTS INCLUDING COMMENTS"
+    if partitioned:
+        op.execute(
+            f"CREATE TABLE workflow_execution ({columns}, PRIMARY KEY (tenant_id, id)) "
+            "PARTITION BY HASH (tenant_id)"
+        )
+        for i in range(PARTITIONS):
+            op.execute(
+                f"CREATE TABLE workflow_execution_p{i} PARTITION OF workflow_execution "
+                f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {i})"
+            )
+    else:
+        op.execute(f"CREATE TABLE workflow_execution ({columns}, PRIMARY KEY (id))")
+
+    op.execute("INSERT INTO workflow_execution SELECT * FROM workflow_execution_old")
+    op.execute("DROP TABLE workflow_execution_old")
+
+    for column, target, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            f"workflow_execution_{column}_fkey",
+            "workflow_execution",
+            target,
+            [column],
+            ["id"],
+            ondelete=ondelete,
+        )
+    # The partitioned primary key leads with tenant_id, so only the plain
+    # table needs a standalone tenant_id index
+    indexed = INDEXED_COLUMNS if partitioned else ["tenant_id", *INDEXED_COLUMNS]
+    for column in indexed:
+        op.create_index(f"ix_workflow_execution_{column}", "workflow_execution", [column])
+
+
+def upgrade() -> None:
+    """Rebuild workflow_execution as a hash-partitioned table."""
+    _rebuild(partitioned=True)
+
+
+def downgrade() -> None:
+    """Rebuild workflow_execution as a plain table keyed by id."""
+    _rebuild(partitioned=False)
@@ -0,0 +1,50 @@
+"""Replace email account status indexes with partial indexes
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17 13:30:00.000000
+
+sync_status and oauth_status are low-cardinality and heavily skewed (almost
+every account is idle/active), so full indexes on them are large and rarely
+selective. They are replaced with partial indexes covering only the accounts
+that need work: those currently syncing and those awaiting OAuth retry.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: str | Sequence[str] | None = "e5f6a7b8c9d0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Swap full status indexes for partial indexes."""
+    op.drop_index("ix_email_account_sync_status", table_name="email_account")
+    op.drop_index("ix_email_account_oauth_status", table_name="email_account")
+
+    op.create_index(
+        "ix_email_account_running",
+        "email_account",
+        ["tenant_id"],
+        postgresql_where=sa.text("sync_status = 'running'"),
+    )
+    op.create_index(
+        "ix_email_account_oauth_retry",
+        "email_account",
+        ["oauth_next_retry_at"],
+        postgresql_where=sa.text("oauth_status <> 'active'"),
+    )
+
+
+def downgrade() -> None:
+    """Restore full status indexes."""
+    op.drop_index("ix_email_account_oauth_retry", table_name="email_account")
+    op.drop_index("ix_email_account_running", table_name="email_account")
+
+    op.create_index("ix_email_account_oauth_status", "email_account", ["oauth_status"])
+    op.create_index("ix_email_account_sync_status", "email_account", ["sync_status"])
@@ -3,11 +3,13 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.persistence.database import Base
-from src.infrastructure.persistence.models.mixins import MultiTenantModel
+from src.infrastructure.persistence.models.mixins import (CUID_LENGTH,
+                                                          MultiTenantModel)
 
 
 class EmailAccount(MultiTenantModel, Base):
@@ -27,7 +29,7 @@ class EmailAccount(MultiTenantModel, Base):
     __tablename__ = "email_account"
 
     subject_id: Mapped[str] = mapped_column(
-        String, ForeignKey("subject.id"), nullable=False, index=True
+        String(CUID_LENGTH), ForeignKey("subject.id"), nullable=False, index=True
     )
 
     # Provider configuration
@@ -40,7 +42,7 @@ class EmailAccount(MultiTenantModel, Base):
     credentials_encrypted: Mapped[str] = mapped_column(String, nullable=False)
 
     # Provider-specific connection parameters (IMAP server, ports, etc.)
-    connection_params: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    connection_params: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
 
     # OAuth integration tracking (for OAuth providers)
     oauth_provider_config_id: Mapped[str | None] = mapped_column(
@@ -50,7 +52,7 @@ class EmailAccount(MultiTenantModel, Base):
         Integer, nullable=True
     )  # Config version at connection time
     granted_scopes: Mapped[list[str] | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Actual scopes user granted
 
     # Sync metadata
@@ -62,7 +64,7 @@ class EmailAccount(MultiTenantModel, Base):
 
     # Sync status tracking (for background sync progress)
     sync_status: Mapped[str] = mapped_column(
-        String, nullable=False, default="idle", index=True
+        String, nullable=False, default="idle"
     )  # idle, running, completed, failed
     sync_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     sync_completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -72,7 +74,7 @@ class EmailAccount(MultiTenantModel, Base):
 
     # OAuth status tracking (enhanced failure handling)
     oauth_status: Mapped[str] = mapped_column(
-        String, nullable=False, default="active", index=True
+        String, nullable=False, default="active"
     )  # active, consent_denied, refresh_failed, revoked, expired, unknown
     oauth_error_count: Mapped[int] = mapped_column(
         Integer, default=0, nullable=False
@@ -88,6 +90,20 @@ class EmailAccount(MultiTenantModel, Base):
     last_auth_error: Mapped[str | None] = mapped_column(String, nullable=True)
     last_auth_error_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # Partial indexes: only the few accounts that need work are indexed
+        Index(
+            "ix_email_account_running",
+            "tenant_id",
+            postgresql_where=text("sync_status = 'running'"),
+        ),
+        Index(
+            "ix_email_account_oauth_retry",
+            "oauth_next_retry_at",
+            postgresql_where=text("oauth_status <> 'active'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<EmailAccount(id={self.id}, "
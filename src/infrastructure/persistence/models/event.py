@@ -1,23 +1,29 @@
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy import (
-    Connection,
+    DDL,
     CheckConstraint,
     DateTime,
     ForeignKey,
     Index,
     Integer,
     String,
+    bindparam,
     event,
+    select,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, Mapper, Session, mapped_column
+from sqlalchemy.orm import Mapped, Session, mapped_column
 from sqlalchemy.sql import func
 
-from src.application.services.hash_service import HashService
+from src.application.services.hash_service import HashRecord, HashService
 from src.infrastructure.persistence.database import Base
-from src.infrastructure.persistence.models.mixins import CuidMixin, TenantMixin
+from src.infrastructure.persistence.models.mixins import (CUID_LENGTH, CuidMixin,
+                                                          TenantMixin)
+from src.shared.utils.datetime import utc_now
 
 
 class Event(CuidMixin, TenantMixin, Base):
@@ -35,7 +41,7 @@ class Event(CuidMixin, TenantMixin, Base):
     __tablename__ = "event"
 
     subject_id: Mapped[str] = mapped_column(
-        String, ForeignKey("subject.id"), nullable=False, index=True
+        String(CUID_LENGTH), ForeignKey("subject.id"), nullable=False, index=True
     )
     event_type: Mapped[str] = mapped_column(String, nullable=False, index=True)
     schema_version: Mapped[int] = mapped_column(
@@ -45,13 +51,31 @@ class Event(CuidMixin, TenantMixin, Base):
     payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
     previous_hash: Mapped[str | None] = mapped_column(String)
     hash: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, server_default=func.now()
+    )
 
     __table_args__ = (
         # Indexes for query performance
         Index("ix_event_subject_time", "subject_id", "event_time"),
-        Index("ix_event_tenant_subject", "tenant_id", "subject_id"),
+        # Chain-tip lookups (get_last_hash/get_last_event) and newest-first listing
+        Index(
+            "ix_event_tenant_subject_time_desc",
+            "tenant_id",
+            "subject_id",
+            text("event_time DESC"),
+            postgresql_include=["hash"],
+        ),
         Index("ix_event_tenant_type_version", "tenant_id", "event_type", "schema_version"),
+        # Covering index for chain-tip lookups (subject_id, hash) -> event_time
+        Index("ix_event_subject_hash", "subject_id", "hash", postgresql_include=["event_time"]),
+        # GIN index for payload containment queries (created in migration a1b2c3d4e5f6)
+        Index(
+            "ix_event_payload_gin",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
         # Immutability enforcement: created_at must always be set (prevents updates)
         CheckConstraint("created_at IS NOT NULL", name="ck_event_created_at_immutable"),
     )
@@ -84,6 +108,13 @@ class Event(CuidMixin, TenantMixin, Base):
             previous_hash=previous_hash,
         )
 
+    @classmethod
+    def compute_hashes_chain(
+        cls, previous_hash: str | None, records: Sequence[HashRecord]
+    ) -> list[str]:
+        """Compute chained hashes for a batch of events via HashService."""
+        return cls._hash_service.compute_hashes_chain(previous_hash, records)
+
     @classmethod
     def create_event(
         cls,
@@ -95,6 +126,7 @@ class Event(CuidMixin, TenantMixin, Base):
         event_time: datetime,
         payload: dict[str, Any],
         previous_hash: str | None = None,
+        previous_event_time: datetime | None = None,
     ) -> "Event":
         """
         Factory method that validates hash chain and prevents tampering at insert time.
@@ -104,26 +136,29 @@ class Event(CuidMixin, TenantMixin, Base):
         2. Ensure temporal ordering (new event must be after previous)
         3. Compute and validate hash before insertion
 
+        Callers that chain events themselves (e.g. bulk ingest) already hold the
+        previous event and can pass previous_event_time to skip the lookup.
+
         Raises:
             ValueError: If previous_hash is invalid or temporal ordering is violated
         """
         # Validate previous hash if provided
         if previous_hash:
-            prev_event = (
-                session.query(Event)
-                .filter(Event.subject_id == subject_id, Event.hash == previous_hash)
-                .first()
-            )
+            if previous_event_time is None:
+                previous_event_time = session.execute(
+                    _PREVIOUS_EVENT_TIME_STMT,
+                    {"subject_id": subject_id, "previous_hash": previous_hash},
+                ).scalar_one_or_none()
 
-            if not prev_event:
+            if previous_event_time is None:
                 raise ValueError(
                     f"Invalid previous_hash: {previous_hash} not found for subject {subject_id}"
                 )
 
             # Enforce temporal ordering
-            if event_time <= prev_event.event_time:
+            if event_time <= previous_event_time:
                 raise ValueError(
-                    f"Event time {event_time} must be after previous event time {prev_event.event_time}"
+                    f"Event time {event_time} must be after previous event time {previous_event_time}"
                 )
 
         # Compute hash with validated inputs
@@ -149,17 +184,29 @@ class Event(CuidMixin, TenantMixin, Base):
         )
 
 
-# Prevent updates to events at ORM level (events are immutable)
-@event.listens_for(Event, "before_update")
-def prevent_event_updates(
-    _mapper: Mapper[Any], 
-    _connection: Connection, 
-    _target: "Event"
-) -> None:
+# Chain-tip lookup built once so every call reuses the compiled statement cache entry
+_PREVIOUS_EVENT_TIME_STMT = select(Event.event_time).where(
+    Event.subject_id == bindparam("subject_id"),
+    Event.hash == bindparam("previous_hash"),
+)
+
+
+# Events are append-only: a PostgreSQL trigger (migration c3d4e5f6a7b8) rejects
+# UPDATEs from every writer, including raw SQL and COPY. Mirrored here so
+# metadata.create_all() databases get the same guarantee.
+for _ddl in (
     """
-    Events are append-only and cannot be modified after creation.
-    This is fundamental to event sourcing and audit trail integrity.
+    CREATE OR REPLACE FUNCTION event_prevent_update() RETURNS trigger AS $$
+    BEGIN
+        RAISE EXCEPTION USING MESSAGE =
+            'Events are immutable and cannot be updated. '
+            || 'Create a new compensating event instead.';
+    END;
+    $$ LANGUAGE plpgsql
+    """,
     """
-    raise ValueError(
-        "Events are immutable and cannot be updated. Create a new compensating event instead."
-    )
+    CREATE TRIGGER event_no_update BEFORE UPDATE ON event
+    FOR EACH ROW EXECUTE FUNCTION event_prevent_update()
+    """,
+):
+    event.listen(Event.__table__, "after_create", DDL(_ddl).execute_if(dialect="postgresql"))
@@ -1,7 +1,7 @@
 from typing import Any
 
-from sqlalchemy import (JSON, Boolean, ForeignKey, Integer, String,
-                        UniqueConstraint)
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.persistence.database import Base
@@ -26,7 +26,7 @@ class EventSchema(MultiTenantModel, Base):
 
     event_type: Mapped[str] = mapped_column(String, nullable=False, index=True)
     schema_definition: Mapped[dict[str, Any]] = mapped_column(
-        JSON, nullable=False
+        JSONB, nullable=False
     )  # Immutable after creation
     version: Mapped[int] = mapped_column(Integer, nullable=False)  # Auto-incremented per event_type
     is_active: Mapped[bool] = mapped_column(
@@ -40,4 +40,19 @@ class EventSchema(MultiTenantModel, Base):
 
     __table_args__ = (
         UniqueConstraint("tenant_id", "event_type", "version", name="uq_tenant_event_type_version"),
+        # At most one active version per event type; serves get_active_schema
+        Index(
+            "uq_event_schema_active",
+            "tenant_id",
+            "event_type",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+        # Keyset listing order of get_all_for_tenant (event_type, version DESC)
+        Index(
+            "ix_event_schema_tenant_type_version_desc",
+            "tenant_id",
+            "event_type",
+            text("version DESC"),
+        ),
     )
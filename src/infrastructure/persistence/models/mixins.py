@@ -18,8 +18,12 @@ from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 from sqlalchemy.sql import func
 
+from src.shared.utils.datetime import utc_now
 from src.shared.utils.generators import generate_cuid
 
+# Upper bound for CUID2 identifiers (24 chars by default) stored in FK columns
+CUID_LENGTH = 25
+
 
 class CuidMixin:
     """
@@ -67,10 +71,12 @@ class TimestampMixin:
     Mixin for timestamp tracking.
 
     Provides:
-        - created_at: Timestamp set on creation (server-side default)
-        - updated_at: Timestamp updated on modification (server-side default + onupdate)
+        - created_at: Timestamp set on creation
+        - updated_at: Timestamp updated on modification
 
-    Note: Uses timezone-aware DateTime for consistency
+    Note: Uses timezone-aware DateTime for consistency. Values are assigned
+    Python-side (server default kept as a fallback for raw SQL) so flushed
+    objects are complete without a refresh round-trip.
 
     Usage:
         class MyModel(TimestampMixin, Base):
@@ -80,14 +86,17 @@ class TimestampMixin:
 
     @declared_attr
     def created_at(cls) -> Mapped[datetime]:
-        return mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+        return mapped_column(
+            DateTime(timezone=True), default=utc_now, server_default=func.now(), nullable=False
+        )
 
     @declared_attr
     def updated_at(cls) -> Mapped[datetime]:
         return mapped_column(
             DateTime(timezone=True),
+            default=utc_now,
             server_default=func.now(),
-            onupdate=func.now(),
+            onupdate=utc_now,
             nullable=False,
         )
 
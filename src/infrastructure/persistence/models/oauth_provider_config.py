@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import (JSON, Boolean, DateTime, Index, Integer, String, Text,
-                        UniqueConstraint)
+                        UniqueConstraint, text)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.persistence.database import Base
@@ -111,12 +111,21 @@ class OAuthProviderConfig(AuditedMultiTenantModel, Base):
             "version",
             name="uq_tenant_provider_version",
         ),
-        # Index for finding active configs
+        # At most one live active config per provider; serves get_active_config
         Index(
-            "ix_oauth_provider_config_active",
+            "uq_oauth_provider_config_active",
             "tenant_id",
             "provider_type",
-            "is_active",
+            unique=True,
+            postgresql_where=text("is_active AND deleted_at IS NULL"),
+        ),
+        # Keyset listing order of list_configs (provider_type, version DESC)
+        Index(
+            "ix_oauth_provider_config_listing",
+            "tenant_id",
+            "provider_type",
+            text("version DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
         ),
     )
 
@@ -225,7 +234,8 @@ class OAuthAuditLog(Base):
     __table_args__ = (
         # Index for audit queries
         Index("ix_oauth_audit_tenant_time", "tenant_id", "timestamp"),
-        Index("ix_oauth_audit_config_time", "provider_config_id", "timestamp"),
+        # Keyset history pages (timestamp, id) < cursor, newest first
+        Index("ix_oauth_audit_config_time_id", "provider_config_id", "timestamp", "id"),
     )
 
     def __repr__(self) -> str:
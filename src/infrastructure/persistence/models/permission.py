@@ -6,7 +6,9 @@ from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from src.infrastructure.persistence.database import Base
-from src.infrastructure.persistence.models.mixins import CuidMixin, TenantMixin
+from src.infrastructure.persistence.models.mixins import (CUID_LENGTH, CuidMixin,
+                                                          TenantMixin)
+from src.shared.utils.datetime import utc_now
 
 
 class Permission(CuidMixin, TenantMixin, Base):
@@ -52,10 +54,10 @@ class RolePermission(CuidMixin, TenantMixin, Base):
     __tablename__ = "role_permission"
 
     role_id: Mapped[str] = mapped_column(
-        String, ForeignKey("role.id", ondelete="CASCADE"), nullable=False
+        String(CUID_LENGTH), ForeignKey("role.id", ondelete="CASCADE"), nullable=False
     )
     permission_id: Mapped[str] = mapped_column(
-        String, ForeignKey("permission.id", ondelete="CASCADE"), nullable=False
+        String(CUID_LENGTH), ForeignKey("permission.id", ondelete="CASCADE"), nullable=False
     )
 
     __table_args__ = (
@@ -76,18 +78,18 @@ class UserRole(CuidMixin, TenantMixin, Base):
     __tablename__ = "user_role"
 
     user_id: Mapped[str] = mapped_column(
-        String, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        String(CUID_LENGTH), ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
     role_id: Mapped[str] = mapped_column(
-        String, ForeignKey("role.id", ondelete="CASCADE"), nullable=False
+        String(CUID_LENGTH), ForeignKey("role.id", ondelete="CASCADE"), nullable=False
     )
 
     # Role assignment metadata
     assigned_by: Mapped[str | None] = mapped_column(
-        String, ForeignKey("user.id", ondelete="SET NULL"), nullable=True
+        String(CUID_LENGTH), ForeignKey("user.id", ondelete="SET NULL"), nullable=True
     )
     assigned_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utc_now, server_default=func.now(), nullable=False
     )
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import CheckConstraint, String
+from sqlalchemy import Enum, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.enums import TenantStatus
@@ -19,10 +19,14 @@ class Tenant(CuidMixin, TimestampMixin, Base):
     # Business fields
     code: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
-    status: Mapped[str] = mapped_column(
-        String, nullable=False, default=TenantStatus.ACTIVE.value, index=True
-    )
-
-    __table_args__ = (
-        CheckConstraint(f"status IN {tuple(TenantStatus.values())}", name="tenant_status_check"),
+    status: Mapped[TenantStatus] = mapped_column(
+        Enum(
+            TenantStatus,
+            name="tenant_status",
+            native_enum=True,
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
+        nullable=False,
+        default=TenantStatus.ACTIVE,
+        index=True,
     )
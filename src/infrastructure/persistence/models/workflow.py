@@ -9,8 +9,9 @@ Workflows define triggers and actions:
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import (JSON, Boolean, DateTime, ForeignKey, Integer, String,
-                        Text)
+from sqlalchemy import (DDL, Boolean, DateTime, ForeignKey, Index, Integer,
+                        SmallInteger, String, Text, event, text)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.persistence.database import Base
@@ -68,12 +69,12 @@ class Workflow(AuditedMultiTenantModel, Base):
         comment="Event type that triggers this workflow",
     )
     trigger_conditions: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, nullable=True, comment="Optional JSON conditions (JSONPath expressions)"
+        JSONB, nullable=True, comment="Optional JSON conditions (JSONPath expressions)"
     )
 
     # Actions to execute
     actions: Mapped[list[dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         comment="Array of actions to execute [{type, params}, ...]",
     )
@@ -85,16 +86,30 @@ class Workflow(AuditedMultiTenantModel, Base):
         comment="Rate limit: max executions per day (null = unlimited)",
     )
     execution_order: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         nullable=False,
         default=0,
         comment="Execution priority (lower = earlier)",
     )
 
+    __table_args__ = (
+        # Dispatch lookup: only live workflows are indexed, already in execution order
+        Index(
+            "ix_workflow_dispatch",
+            "tenant_id",
+            "trigger_event_type",
+            "execution_order",
+            postgresql_where=text("is_active AND deleted_at IS NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Workflow(id={self.id}, name={self.name}, trigger={self.trigger_event_type})>"
 
 
+WORKFLOW_EXECUTION_PARTITIONS = 32
+
+
 class WorkflowExecution(MultiTenantModel, Base):
     """
     Audit trail for workflow executions.
@@ -106,9 +121,21 @@ class WorkflowExecution(MultiTenantModel, Base):
         - updated_at: Last update timestamp
 
     Tracks each time a workflow is triggered and executed.
+
+    Hash-partitioned by tenant_id (WORKFLOW_EXECUTION_PARTITIONS partitions) so
+    tenant-scoped reads prune to one small partition. PostgreSQL requires the
+    partition key in the primary key, so rows are identified by (tenant_id, id)
+    and every ORM UPDATE/DELETE carries the partition key.
     """
 
     __tablename__ = "workflow_execution"
+    __table_args__ = {"postgresql_partition_by": "HASH (tenant_id)"}
+
+    # Partition key; overrides TenantMixin.tenant_id to lead the primary key,
+    # which also makes a separate tenant_id index redundant
+    tenant_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tenant.id", ondelete="CASCADE"), primary_key=True
+    )
 
     workflow_id: Mapped[str] = mapped_column(
         String,
@@ -150,7 +177,7 @@ class WorkflowExecution(MultiTenantModel, Base):
         Integer, nullable=False, default=0, comment="Number of actions that failed"
     )
     execution_log: Mapped[list[dict[str, Any]] | None] = mapped_column(
-        JSON, nullable=True, comment="Detailed execution log with action results"
+        JSONB, nullable=True, comment="Detailed execution log with action results"
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -160,3 +187,17 @@ class WorkflowExecution(MultiTenantModel, Base):
             f"workflow_id={self.workflow_id}, "
             f"status={self.status})>"
         )
+
+
+# Partitions are created by migration in deployed databases. Mirrored here so
+# metadata.create_all() databases can accept inserts. Statements are built in
+# Python as the migration does: DDL text is %-formatted, so no placeholders.
+for _i in range(WORKFLOW_EXECUTION_PARTITIONS):
+    event.listen(
+        WorkflowExecution.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE workflow_execution_p{_i} PARTITION OF workflow_execution "
+            f"FOR VALUES WITH (MODULUS {WORKFLOW_EXECUTION_PARTITIONS}, REMAINDER {_i})"
+        ).execute_if(dialect="postgresql"),
+    )
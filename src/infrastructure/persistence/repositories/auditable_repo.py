@@ -10,8 +10,10 @@ the current user as the actor for audit events.
 
 from __future__ import annotations
 
+import operator
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from src.infrastructure.persistence.database import Base
 from src.infrastructure.persistence.repositories.base import BaseRepository
@@ -25,6 +27,18 @@ if TYPE_CHECKING:
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Resolved on first use so the application layer is not imported at module load
+_AUDIT_SERVICE_CLS: type["SystemAuditService"] | None = None
+
+
+def _get_audit_service_cls() -> type["SystemAuditService"]:
+    """Return the SystemAuditService class, importing it once."""
+    global _AUDIT_SERVICE_CLS
+    if _AUDIT_SERVICE_CLS is None:
+        from src.application.services.system_audit_service import SystemAuditService
+        _AUDIT_SERVICE_CLS = SystemAuditService
+    return _AUDIT_SERVICE_CLS
+
 
 class AuditableRepository(BaseRepository[ModelType]):
     """
@@ -36,13 +50,42 @@ class AuditableRepository(BaseRepository[ModelType]):
     Subclasses must implement:
     - _get_entity_type(): Return the entity type string (e.g., "subject")
     - _get_tenant_id(obj): Extract tenant_id from the entity
-    - _serialize_for_audit(obj): Convert entity to dict for audit payload
+    - _audit_columns: Attribute names copied into the audit payload
+      (or override _serialize_for_audit(obj) for a custom payload)
 
     Optionally override:
     - _get_actor_id(): Return the current actor ID (user performing action)
     - _should_audit(): Return False to skip auditing for certain operations
     """
 
+    _audit_columns: ClassVar[tuple[str, ...]] = ()
+    _audit_getter: ClassVar[staticmethod[[Any], tuple[Any, ...]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Build one attrgetter per subclass so serialization is a single C call.
+
+        Raises:
+            TypeError: If the subclass declares no _audit_columns and does not
+                override _serialize_for_audit
+        """
+        super().__init_subclass__(**kwargs)
+        if not cls._audit_columns:
+            if cls._serialize_for_audit is AuditableRepository._serialize_for_audit:
+                raise TypeError(
+                    f"{cls.__name__} must declare _audit_columns "
+                    "or override _serialize_for_audit"
+                )
+            return
+        getter: Callable[[Any], tuple[Any, ...]]
+        if len(cls._audit_columns) > 1:
+            getter = operator.attrgetter(*cls._audit_columns)
+        else:
+            single = operator.attrgetter(cls._audit_columns[0])
+            getter = lambda obj: (single(obj),)  # noqa: E731
+        # staticmethod: a plain function stored on the class would bind self
+        cls._audit_getter = staticmethod(getter)
+
     def __init__(
         self,
         db: "AsyncSession",
@@ -54,13 +97,14 @@ class AuditableRepository(BaseRepository[ModelType]):
         super().__init__(db, model)
         self._audit_service = audit_service
         self._audit_enabled = enable_audit
+        # Collects audit entries while a batch hook runs (see _on_after_create_many)
+        self._deferred_audit: list[tuple[AuditAction, ModelType]] | None = None
 
     @property
     def audit_service(self) -> "SystemAuditService | None":
         """Get the audit service, lazily initializing if needed."""
         if self._audit_service is None and self._audit_enabled:
-            from src.application.services.system_audit_service import SystemAuditService
-            self._audit_service = SystemAuditService(self.db)
+            self._audit_service = _get_audit_service_cls()(self.db)
         return self._audit_service
 
     def enable_auditing(self, audit_service: "SystemAuditService | None" = None) -> None:
@@ -84,10 +128,9 @@ class AuditableRepository(BaseRepository[ModelType]):
         """Extract tenant_id from the entity."""
         ...
 
-    @abstractmethod
     def _serialize_for_audit(self, obj: ModelType) -> dict[str, Any]:
         """Convert entity to dict for audit payload."""
-        ...
+        return dict(zip(self._audit_columns, self._audit_getter(obj), strict=True))
 
     # Optional overrides
     def _get_actor_id(self) -> str | None:
@@ -123,6 +166,10 @@ class AuditableRepository(BaseRepository[ModelType]):
         if not self._audit_enabled or not self._should_audit(action, obj):
             return
 
+        if self._deferred_audit is not None and metadata is None:
+            self._deferred_audit.append((action, obj))
+            return
+
         service = self.audit_service
         if service is None:
             return
@@ -149,12 +196,56 @@ class AuditableRepository(BaseRepository[ModelType]):
                 str(e),
             )
 
+    async def _emit_audit_events(self, entries: list[tuple[AuditAction, ModelType]]) -> None:
+        """Emit audit events for many entities, one chained batch per action and tenant."""
+        service = self.audit_service
+        if not entries or service is None:
+            return
+
+        groups: dict[tuple[AuditAction, str], list[ModelType]] = {}
+        for action, obj in entries:
+            groups.setdefault((action, self._get_tenant_id(obj)), []).append(obj)
+
+        for (action, tenant_id), objs in groups.items():
+            try:
+                await service.emit_audit_events_bulk(
+                    tenant_id=tenant_id,
+                    entity_type=self._get_entity_type(),
+                    action=action,
+                    entities=[
+                        (getattr(obj, "id", str(obj)), self._serialize_for_audit(obj))
+                        for obj in objs
+                    ],
+                    actor_id=self._get_actor_id(),
+                    actor_type=self._get_actor_type(),
+                )
+            except Exception as e:
+                # Log but don't fail the operation if auditing fails
+                from src.shared.telemetry.logging import get_logger
+                logger = get_logger(__name__)
+                logger.warning(
+                    "Failed to emit %d audit events for %s.%s: %s",
+                    len(objs),
+                    self._get_entity_type(),
+                    action.value,
+                    str(e),
+                )
+
     # Override hooks from BaseRepository
     async def _on_after_create(self, obj: ModelType) -> None:
         """Emit created audit event after entity creation."""
         await super()._on_after_create(obj)
         await self._emit_audit_event(AuditAction.CREATED, obj)
 
+    async def _on_after_create_many(self, objs: list[ModelType]) -> None:
+        """Run per-record hooks, then emit their audit events as one batch."""
+        self._deferred_audit = []
+        try:
+            await super()._on_after_create_many(objs)
+        finally:
+            deferred, self._deferred_audit = self._deferred_audit, None
+        await self._emit_audit_events(deferred)
+
     async def _on_after_update(self, obj: ModelType) -> None:
         """Emit updated audit event after entity update."""
         await super()._on_after_update(obj)
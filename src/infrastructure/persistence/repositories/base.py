@@ -1,7 +1,9 @@
+import json
 from abc import ABC
+from collections.abc import Callable
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import JSON, Enum, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import object_session
 
@@ -9,6 +11,9 @@ from src.infrastructure.persistence.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Batches at or above this size are streamed with COPY (asyncpg only)
+BULK_COPY_THRESHOLD = 100
+
 
 class BaseRepository(ABC, Generic[ModelType]):
     """
@@ -16,43 +21,150 @@ class BaseRepository(ABC, Generic[ModelType]):
 
     Provides cache invalidation hooks for subclasses to override.
     Subclasses should call super() methods to ensure proper lifecycle.
+
+    Hot lookups in subclass modules are prebuilt as module-level statements
+    with bindparam() values: the statement's cache key is memoized, so each
+    execute is a plain compiled-cache hit instead of rebuilding and re-keying
+    the statement on every call.
     """
 
     def __init__(self, db: AsyncSession, model: type[ModelType]):
         self.db = db
         self.model = model
 
-    async def get_by_id(self, id: str) -> ModelType | None:
-        """Get a single record by ID"""
-        # Cast to Any for SQLAlchemy dynamic attribute access (id comes from CuidMixin)
-        model: Any = self.model
-        result = await self.db.execute(select(self.model).where(model.id == id))
-        return result.scalar_one_or_none()
+    async def get_by_id(self, id: str, *, with_for_update: bool = False) -> ModelType | None:
+        """
+        Get a single record by ID.
+
+        Served from the session identity map when already loaded (no SQL);
+        with_for_update=True always hits the database with SELECT ... FOR UPDATE.
+        """
+        return await self.db.get(self.model, id, with_for_update=with_for_update)
+
+    async def get_by_id_and_tenant(self, id: str, tenant_id: str) -> ModelType | None:
+        """
+        Get a single record by ID, only if it belongs to the tenant.
+
+        Goes through get_by_id, so a record already loaded in the session is
+        returned without SQL; a miss is a primary-key SELECT.
+        """
+        obj = await self.get_by_id(id)
+        if obj is None or getattr(obj, "tenant_id", None) != tenant_id:
+            return None
+        return obj
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
         """Get all records with pagination"""
         result = await self.db.execute(select(self.model).offset(skip).limit(limit))
         return list(result.scalars().all())
 
-    async def create(self, obj: ModelType) -> ModelType:
-        """Create a new record and trigger cache invalidation hook"""
+    async def create(self, obj: ModelType, *, refresh: bool = False) -> ModelType:
+        """
+        Create a new record and trigger cache invalidation hook.
+
+        IDs and timestamps are assigned Python-side, so the flushed object is
+        already complete; pass refresh=True only to reload server-computed values.
+        """
         self.db.add(obj)
         await self.db.flush()
-        await self.db.refresh(obj)
+        if refresh:
+            await self.db.refresh(obj)
         await self._on_after_create(obj)
         return obj
 
-    async def update(self, obj: ModelType) -> ModelType:
+    async def create_many(
+        self, objs: list[ModelType], *, refresh: bool = False
+    ) -> list[ModelType]:
+        """
+        Create many records with a single flush and trigger the batch create hook.
+
+        The flush is batched by SQLAlchemy's insertmanyvalues, so round-trips
+        scale with N / insertmanyvalues_page_size rather than N. Primary keys
+        are client-generated CUIDs, so refresh is only needed for server-side
+        defaults the caller wants to read back.
+        """
+        if not objs:
+            return []
+
+        self.db.add_all(objs)
+        await self.db.flush()
+        if refresh:
+            for obj in objs:
+                await self.db.refresh(obj)
+        await self._on_after_create_many(objs)
+        return objs
+
+    async def bulk_create(self, objs: list[ModelType]) -> list[ModelType]:
+        """
+        Create many records at once and trigger the batch create hook.
+
+        Large batches on asyncpg are streamed with COPY on the session's
+        connection (same transaction), bypassing the ORM unit of work. Python
+        column defaults are applied client-side first so the returned objects
+        are populated; columns left to a server default are omitted from the
+        COPY. COPY'd objects are not attached to the session. Smaller batches
+        and other drivers go through create_many().
+        """
+        if not objs:
+            return []
+
+        connection = await self.db.connection()
+        if len(objs) < BULK_COPY_THRESHOLD or connection.dialect.driver != "asyncpg":
+            return await self.create_many(objs)
+
+        # (attribute key, column name, value converter for COPY or None)
+        columns: list[tuple[str, str, Callable[[Any], Any] | None]] = []
+        for prop in inspect(self.model).column_attrs:
+            column = prop.columns[0]
+            default = column.default
+            if default is not None and (default.is_scalar or default.is_callable):
+                for obj in objs:
+                    if getattr(obj, prop.key) is None:
+                        value = default.arg(None) if default.is_callable else default.arg
+                        setattr(obj, prop.key, value)
+            if column.server_default is not None and all(
+                getattr(obj, prop.key) is None for obj in objs
+            ):
+                continue
+            converter: Callable[[Any], Any] | None = None
+            if isinstance(column.type, JSON):
+                converter = json.dumps
+            elif isinstance(column.type, Enum):
+                # Enum members are sent as their database labels, as on INSERT
+                converter = column.type.bind_processor(connection.dialect)
+            columns.append((prop.key, column.name, converter))
+
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None
+        await driver_connection.copy_records_to_table(
+            self.model.__tablename__,
+            columns=[name for _, name, _ in columns],
+            records=(
+                tuple(
+                    getattr(obj, key) if convert is None else convert(getattr(obj, key))
+                    for key, _, convert in columns
+                )
+                for obj in objs
+            ),
+        )
+
+        await self._on_after_create_many(objs)
+        return objs
+
+    async def update(self, obj: ModelType, *, refresh: bool = False) -> ModelType:
         """
         Update an existing record and trigger cache invalidation hook.
 
         Handles potentially detached objects by merging back to session.
+        updated_at is set Python-side on flush; refresh is opt-in.
         """
         # Merge object back to session if detached
         if object_session(obj) is None:
             obj = await self.db.merge(obj)
         await self.db.flush()
-        await self.db.refresh(obj)
+        if refresh:
+            await self.db.refresh(obj)
         await self._on_after_update(obj)
         return obj
 
@@ -68,6 +180,11 @@ class BaseRepository(ABC, Generic[ModelType]):
         """Hook called after creating a record. Override to invalidate caches."""
         pass
 
+    async def _on_after_create_many(self, objs: list[ModelType]) -> None:
+        """Hook called after creating a batch. Defaults to the per-record hook."""
+        for obj in objs:
+            await self._on_after_create(obj)
+
     async def _on_after_update(self, obj: ModelType) -> None:
         """Hook called after updating a record. Override to invalidate caches."""
         pass
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.persistence.models.document import Document
@@ -33,18 +33,17 @@ class DocumentRepository(AuditableRepository[Document]):
     def _get_tenant_id(self, obj: Document) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: Document) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "filename": obj.filename,
-            "original_filename": obj.original_filename,
-            "content_type": obj.content_type,
-            "size_bytes": obj.size_bytes,
-            "subject_id": obj.subject_id,
-            "event_id": obj.event_id,
-            "version": obj.version,
-            # Note: storage_path and checksum excluded for security
-        }
+    _audit_columns = (
+        "id",
+        "filename",
+        "original_filename",
+        "mime_type",
+        "file_size",
+        "subject_id",
+        "event_id",
+        "version",
+        # Note: storage_path and checksum excluded for security
+    )
 
     async def get_by_subject(
         self, subject_id: str, tenant_id: str, include_deleted: bool = False
@@ -65,30 +64,49 @@ class DocumentRepository(AuditableRepository[Document]):
     async def get_by_event(self, event_id: str, tenant_id: str) -> list[Document]:
         """Get all documents linked to an event within a tenant"""
         result = await self.db.execute(
-            select(Document)
-            .where(
-                and_(
-                    Document.event_id == event_id,
-                    Document.tenant_id == tenant_id,
-                    Document.deleted_at.is_(None),
+            lambda_stmt(
+                lambda: select(Document)
+                .where(
+                    and_(
+                        Document.event_id == event_id,
+                        Document.tenant_id == tenant_id,
+                        Document.deleted_at.is_(None),
+                    )
                 )
+                .order_by(Document.created_at.desc())
             )
-            .order_by(Document.created_at.desc())
         )
         return list(result.scalars().all())
 
     async def get_by_checksum(self, tenant_id: str, checksum: str) -> Document | None:
         """Check if document with same content already exists"""
         result = await self.db.execute(
-            select(Document).where(
-                and_(
+            lambda_stmt(
+                lambda: select(Document).where(
+                    and_(
+                        Document.tenant_id == tenant_id,
+                        Document.checksum == checksum,
+                        Document.deleted_at.is_(None),
+                    )
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_id_by_checksum(self, tenant_id: str, checksum: str) -> str | None:
+        """Return the ID of an existing document with the same content, without loading the row"""
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(Document.id)
+                .where(
                     Document.tenant_id == tenant_id,
                     Document.checksum == checksum,
                     Document.deleted_at.is_(None),
                 )
+                .limit(1)
             )
         )
-        return result.scalar_one_or_none()
+        return result.scalar()
 
     async def get_versions(self, document_id: str, tenant_id: str) -> list[Document]:
         """Get all versions of a document within a tenant"""
@@ -105,11 +123,19 @@ class DocumentRepository(AuditableRepository[Document]):
         return list(result.scalars().all())
 
     async def soft_delete(self, document_id: str) -> Document | None:
-        """Soft delete a document with audit event."""
-        document = await self.get_by_id(document_id)
+        """
+        Soft delete a document with audit event.
+
+        Single UPDATE ... RETURNING; already-deleted documents are left
+        untouched and return None.
+        """
+        result = await self.db.execute(
+            update(Document)
+            .where(Document.id == document_id, Document.deleted_at.is_(None))
+            .values(deleted_at=utc_now())
+            .returning(Document)
+        )
+        document = result.scalar_one_or_none()
         if document:
-            document.deleted_at = utc_now()
-            updated = await self.update(document)
-            await self.emit_custom_audit(updated, AuditAction.DELETED)
-            return updated
-        return None
+            await self._emit_audit_event(AuditAction.DELETED, document)
+        return document
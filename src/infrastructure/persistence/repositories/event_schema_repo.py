@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, func, select
+from cachetools import TTLCache
+from sqlalchemy import (ColumnElement, FromClause, RowMapping, and_, bindparam, func, insert, or_,
+                        select, tuple_, update)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.cache.redis_cache import CacheService
@@ -15,6 +21,145 @@ if TYPE_CHECKING:
     from src.application.services.system_audit_service import SystemAuditService
 
 
+# Columns stored in the active-schema cache entry (ActiveSchemaView fields)
+_CACHED_COLUMNS = (
+    "id",
+    "tenant_id",
+    "event_type",
+    "version",
+    "schema_definition",
+    "is_active",
+    "created_by",
+    "created_at",
+    "updated_at",
+)
+_CACHED_DATETIME_COLUMNS = ("created_at", "updated_at")
+
+
+@dataclass(frozen=True, slots=True)
+class ActiveSchemaView:
+    """
+    Read-only snapshot of an active schema.
+
+    Returned by the active-schema lookups so that cache hits and misses alike
+    skip ORM instances; load the schema with get_by_id to modify it.
+    """
+
+    id: str
+    tenant_id: str
+    event_type: str
+    version: int
+    schema_definition: dict[str, Any]
+    is_active: bool
+    created_by: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_cache(cls, data: dict[str, Any]) -> ActiveSchemaView:
+        """Build a view from a cache payload (datetimes are ISO 8601 strings)."""
+        values = dict(data)
+        for name in _CACHED_DATETIME_COLUMNS:
+            if isinstance(values.get(name), str):
+                values[name] = datetime.fromisoformat(values[name])
+        return cls(**values)
+
+
+# Cached in place of a schema when an event type has no active schema
+_NO_ACTIVE_SCHEMA: dict[str, Any] = {"__miss__": True}
+NEGATIVE_CACHE_TTL = 30
+
+# Active-schema queries in flight, by cache key (single-flight on cache miss).
+# Results are shared as cache payloads, never ORM instances, because each
+# waiter has its own session.
+_inflight_active_schema: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+
+# Process-local tier in front of Redis for get_active_schema. Entries live at
+# most LOCAL_CACHE_TTL seconds; writers also publish the invalidated key on
+# SCHEMA_INVALIDATION_CHANNEL so every worker evicts it at once. The tier is
+# only used while this process is subscribed (listen_for_schema_invalidations),
+# so processes that never subscribe go straight to Redis.
+LOCAL_CACHE_SIZE = 2048
+LOCAL_CACHE_TTL = 30
+SCHEMA_INVALIDATION_CHANNEL = "schema:invalidate"
+_LISTENER_RETRY_DELAY = 5
+_local_active_schemas: TTLCache[str, ActiveSchemaView | None] = TTLCache(
+    maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL
+)
+_local_tier_enabled = False
+_NOT_CACHED = object()
+
+
+def _enable_local_tier() -> None:
+    global _local_tier_enabled
+    _local_tier_enabled = True
+
+
+def _disable_local_tier() -> None:
+    global _local_tier_enabled
+    _local_tier_enabled = False
+    _local_active_schemas.clear()
+
+
+def _evict_local_schema(cache_key: str) -> None:
+    _local_active_schemas.pop(cache_key, None)
+
+
+async def listen_for_schema_invalidations(cache: CacheService) -> None:
+    """
+    Keep the local active-schema tier coherent with other workers.
+
+    Run as a background task for the life of the process. While the
+    subscription is down the local tier is disabled and emptied.
+    """
+    try:
+        while True:
+            await cache.listen(
+                SCHEMA_INVALIDATION_CHANNEL,
+                _evict_local_schema,
+                on_subscribed=_enable_local_tier,
+            )
+            _disable_local_tier()
+            await asyncio.sleep(_LISTENER_RETRY_DELAY)
+    finally:
+        _disable_local_tier()
+
+
+# Equality on uq_event_schema_active (bare is_active so the condition
+# matches the partial index predicate). Core column selects:
+# results become ActiveSchemaView / cache payloads, never ORM instances.
+_schema_table = EventSchema.__table__
+_ACTIVE_SCHEMA_STMT = select(*(_schema_table.c[name] for name in _CACHED_COLUMNS)).where(
+    _schema_table.c.tenant_id == bindparam("tenant_id"),
+    _schema_table.c.event_type == bindparam("event_type"),
+    _schema_table.c.is_active,
+)
+_ACTIVE_SCHEMAS_STMT = select(*(_schema_table.c[name] for name in _CACHED_COLUMNS)).where(
+    _schema_table.c.tenant_id == bindparam("tenant_id"),
+    _schema_table.c.event_type.in_(bindparam("event_types", expanding=True)),
+    _schema_table.c.is_active,
+)
+
+
+def _active_schema_key(tenant_id: str, event_type: str) -> str:
+    """Cache key for the active schema of an event type."""
+    return f"schema:active:v2:{tenant_id}:{event_type}"
+
+
+def _after_schema(table: FromClause, cursor: tuple[str, int]) -> ColumnElement[bool]:
+    """
+    Keyset predicate for the (event_type, version DESC) listing order.
+
+    The leading event_type >= bound gives the index a range start; the OR
+    skips the cursor's own type up to and including its version.
+    """
+    event_type, version = cursor
+    return and_(
+        table.c.event_type >= event_type,
+        or_(table.c.event_type > event_type, table.c.version < version),
+    )
+
+
 class EventSchemaRepository(AuditableRepository[EventSchema]):
     """
     Repository for EventSchema entity with Redis caching and audit tracking.
@@ -43,14 +188,13 @@ class EventSchemaRepository(AuditableRepository[EventSchema]):
     def _get_tenant_id(self, obj: EventSchema) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: EventSchema) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "event_type": obj.event_type,
-            "version": obj.version,
-            "is_active": obj.is_active,
-            "created_by": obj.created_by,
-        }
+    _audit_columns = (
+        "id",
+        "event_type",
+        "version",
+        "is_active",
+        "created_by",
+    )
 
     # Override hooks for cache invalidation
     async def _on_after_create(self, obj: EventSchema) -> None:
@@ -62,7 +206,12 @@ class EventSchemaRepository(AuditableRepository[EventSchema]):
         await self._invalidate_schema_cache(obj.tenant_id, obj.event_type)
 
     async def get_next_version(self, tenant_id: str, event_type: str) -> int:
-        """Get the next version number for an event_type (auto-increment)"""
+        """
+        Get the next version number for an event_type (auto-increment).
+
+        Read-only; to create a version use create_next_version, which computes
+        the number in the INSERT itself.
+        """
         result = await self.db.execute(
             select(func.max(EventSchema.version)).where(
                 and_(
@@ -74,56 +223,178 @@ class EventSchemaRepository(AuditableRepository[EventSchema]):
         max_version = result.scalar()
         return (max_version or 0) + 1
 
-    async def get_active_schema(self, tenant_id: str, event_type: str) -> EventSchema | None:
+    async def create_next_version(
+        self,
+        tenant_id: str,
+        event_type: str,
+        schema_definition: dict[str, Any],
+        *,
+        is_active: bool = True,
+        created_by: str | None = None,
+    ) -> EventSchema:
+        """
+        Insert a schema as the next version of its event_type in one statement.
+
+        The version is computed inside the INSERT (MAX + 1), so there is no gap
+        between reading and writing it; a concurrent creator that lands on the
+        same version is rejected by uq_tenant_event_type_version.
+
+        An active schema replaces the currently active version, which is
+        deactivated first (uq_event_schema_active allows one active version).
+        """
+        if is_active:
+            await self._deactivate_active_versions(tenant_id, event_type)
+
+        next_version = (
+            select(func.coalesce(func.max(EventSchema.version), 0) + 1)
+            .where(EventSchema.tenant_id == tenant_id, EventSchema.event_type == event_type)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            insert(EventSchema)
+            .values(
+                tenant_id=tenant_id,
+                event_type=event_type,
+                schema_definition=schema_definition,
+                version=next_version,
+                is_active=is_active,
+                created_by=created_by,
+            )
+            .returning(EventSchema)
+        )
+        schema = result.scalar_one()
+        await self._on_after_create(schema)
+        return schema
+
+    async def get_active_schema(
+        self, tenant_id: str, event_type: str
+    ) -> ActiveSchemaView | None:
         """
         Get active schema for event type and tenant
 
-        Uses Redis cache to avoid repeated queries (10 min TTL)
+        Uses a process-local cache (30 s TTL) and Redis (10 min TTL) to avoid
+        repeated queries
         This is the most frequently accessed method - called on every event creation
+
+        Returns a read-only ActiveSchemaView, not an ORM instance.
         """
 
-        # Try cache first
-        cache_key = f"schema:active:{tenant_id}:{event_type}"
-        schema: EventSchema | None
-        if self.cache and self.cache.is_available():
-            cached = await self.cache.get(cache_key)
+        # Try cache first: process-local tier, then Redis
+        cache_key = _active_schema_key(tenant_id, event_type)
+        cache = self.cache
+        if cache is not None and not cache.is_available():
+            cache = None
+        use_local = cache is not None and _local_tier_enabled
+        if use_local:
+            local = _local_active_schemas.get(cache_key, _NOT_CACHED)
+            if local is not _NOT_CACHED:
+                return local
+        if cache is not None:
+            cached = await cache.get(cache_key)
             if cached is not None:
-                # Reconstruct EventSchema from cached dict
-                schema = EventSchema(**cached)
-                # Reattach to session for proper ORM behavior
-                self.db.add(schema)
-                return schema
-
-        # Cache miss - query database
-        result = await self.db.execute(
-            select(EventSchema)
-            .where(
-                and_(
-                    EventSchema.tenant_id == tenant_id,
-                    EventSchema.event_type == event_type,
-                    EventSchema.is_active.is_(True),
+                view = (
+                    None if cached == _NO_ACTIVE_SCHEMA else ActiveSchemaView.from_cache(cached)
                 )
-            )
-            .order_by(EventSchema.version.desc())
-            .limit(1)
+                if use_local:
+                    _local_active_schemas[cache_key] = view
+                return view
+
+        # Cache miss - if another request is already querying this key, share
+        # its result instead of issuing the same query (if that query fails or
+        # is cancelled, fall through and run our own)
+        inflight = _inflight_active_schema.get(cache_key)
+        if inflight is not None:
+            await asyncio.wait([inflight])
+            if not inflight.cancelled():
+                data = inflight.result()
+                return ActiveSchemaView(**data) if data else None
+
+        future: asyncio.Future[dict[str, Any] | None] = (
+            asyncio.get_running_loop().create_future()
         )
-        schema = result.scalar_one_or_none()
-
-        # Cache for future requests (convert to dict for JSON serialization)
-        if schema and self.cache and self.cache.is_available():
-            schema_dict: dict[str, Any] = {
-                "id": schema.id,
-                "tenant_id": schema.tenant_id,
-                "event_type": schema.event_type,
-                "version": schema.version,
-                "schema_definition": schema.schema_definition,
-                "is_active": schema.is_active,
-                "created_at": schema.created_at.isoformat() if schema.created_at else None,
-                "updated_at": schema.updated_at.isoformat() if schema.updated_at else None,
-            }
-            await self.cache.set(cache_key, schema_dict, ttl=self.cache_ttl)
+        _inflight_active_schema[cache_key] = future
+        try:
+            result = await self.db.execute(
+                _ACTIVE_SCHEMA_STMT, {"tenant_id": tenant_id, "event_type": event_type}
+            )
+            row = result.mappings().one_or_none()
+            data = dict(row) if row is not None else None
+            future.set_result(data)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            _inflight_active_schema.pop(cache_key, None)
 
-        return schema
+        # Cache for future requests; absent schemas are cached briefly so
+        # repeated lookups for an unconfigured type don't all reach the DB
+        if cache is not None:
+            if data is not None:
+                await cache.set(cache_key, data, ttl=self.cache_ttl)
+            else:
+                await cache.set(cache_key, _NO_ACTIVE_SCHEMA, ttl=NEGATIVE_CACHE_TTL)
+
+        view = ActiveSchemaView(**data) if data is not None else None
+        if use_local:
+            _local_active_schemas[cache_key] = view
+        return view
+
+    async def get_active_schemas_bulk(
+        self, tenant_id: str, event_types: list[str]
+    ) -> dict[str, ActiveSchemaView]:
+        """
+        Get the active schema for each of several event types.
+
+        Costs one cache MGET plus, for the misses, one query for all of them,
+        instead of a round-trip per event type. Types without an active schema
+        are absent from the result.
+        """
+        types = list(dict.fromkeys(event_types))
+        schemas: dict[str, ActiveSchemaView] = {}
+        cache = self.cache
+        if cache is not None and not cache.is_available():
+            cache = None
+
+        if cache is not None:
+            keys = [_active_schema_key(tenant_id, event_type) for event_type in types]
+            absent: set[str] = set()
+            for event_type, cached in zip(types, await cache.mget(keys), strict=True):
+                if cached == _NO_ACTIVE_SCHEMA:
+                    absent.add(event_type)
+                elif cached is not None:
+                    schemas[event_type] = ActiveSchemaView.from_cache(cached)
+            types = [event_type for event_type in types if event_type not in absent]
+
+        missing = [event_type for event_type in types if event_type not in schemas]
+        if missing:
+            result = await self.db.execute(
+                _ACTIVE_SCHEMAS_STMT, {"tenant_id": tenant_id, "event_types": missing}
+            )
+            loaded = {row["event_type"]: dict(row) for row in result.mappings()}
+            schemas.update(
+                (event_type, ActiveSchemaView(**data)) for event_type, data in loaded.items()
+            )
+
+            if cache is not None:
+                if loaded:
+                    await cache.set_many(
+                        {
+                            _active_schema_key(tenant_id, event_type): data
+                            for event_type, data in loaded.items()
+                        },
+                        ttl=self.cache_ttl,
+                    )
+                unconfigured = [event_type for event_type in missing if event_type not in loaded]
+                if unconfigured:
+                    await cache.set_many(
+                        {
+                            _active_schema_key(tenant_id, event_type): _NO_ACTIVE_SCHEMA
+                            for event_type in unconfigured
+                        },
+                        ttl=NEGATIVE_CACHE_TTL,
+                    )
+
+        return schemas
 
     async def get_by_version(
         self, tenant_id: str, event_type: str, version: int
@@ -140,6 +411,30 @@ class EventSchemaRepository(AuditableRepository[EventSchema]):
         )
         return result.scalar_one_or_none()
 
+    async def get_by_versions(
+        self, tenant_id: str, keys: Sequence[tuple[str, int]]
+    ) -> dict[tuple[str, int], EventSchema]:
+        """
+        Get several specific schema versions in one query
+
+        Args:
+            tenant_id: Tenant ID
+            keys: (event_type, version) pairs; duplicates are fine
+
+        Returns:
+            Schemas keyed by (event_type, version); missing versions are absent
+        """
+        if not keys:
+            return {}
+
+        result = await self.db.execute(
+            select(EventSchema).where(
+                EventSchema.tenant_id == tenant_id,
+                tuple_(EventSchema.event_type, EventSchema.version).in_(set(keys)),
+            )
+        )
+        return {(schema.event_type, schema.version): schema for schema in result.scalars()}
+
     async def get_all_for_event_type(self, tenant_id: str, event_type: str) -> list[EventSchema]:
         """Get all schema versions for event type"""
         result = await self.db.execute(
@@ -155,18 +450,55 @@ class EventSchemaRepository(AuditableRepository[EventSchema]):
         return list(result.scalars().all())
 
     async def get_all_for_tenant(
-        self, tenant_id: str, skip: int = 0, limit: int = 100
+        self,
+        tenant_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[str, int] | None = None,
     ) -> list[EventSchema]:
-        """Get all schemas for tenant with pagination"""
+        """
+        Get all schemas for tenant with pagination, by event_type then newest version.
+
+        cursor is the (event_type, version) of the last schema seen (keyset
+        pagination); skip is deprecated.
+        """
+        query = select(EventSchema).where(EventSchema.tenant_id == tenant_id)
+        if cursor is not None:
+            query = query.where(_after_schema(EventSchema.__table__, cursor))
         result = await self.db.execute(
-            select(EventSchema)
-            .where(EventSchema.tenant_id == tenant_id)
-            .order_by(EventSchema.event_type, EventSchema.version.desc())
+            query.order_by(EventSchema.event_type, EventSchema.version.desc())
             .offset(skip)
             .limit(limit)
         )
         return list(result.scalars().all())
 
+    async def get_all_for_tenant_core(
+        self,
+        tenant_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[str, int] | None = None,
+    ) -> Sequence[RowMapping]:
+        """
+        Get all schemas for tenant as plain row mappings (read-only listing).
+
+        Selects table columns through Core, so no ORM instances are hydrated
+        or added to the identity map. Use get_all_for_tenant when the schemas
+        will be modified. Paginates like get_all_for_tenant.
+        """
+        table = EventSchema.__table__
+        query = select(*(table.c[name] for name in _CACHED_COLUMNS)).where(
+            table.c.tenant_id == tenant_id
+        )
+        if cursor is not None:
+            query = query.where(_after_schema(table, cursor))
+        result = await self.db.execute(
+            query.order_by(table.c.event_type, table.c.version.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.mappings().all()
+
     async def deactivate_schema(self, schema_id: str) -> EventSchema | None:
         """Deactivate a schema with audit event (cache invalidated via hook)."""
         schema = await self.get_by_id(schema_id)
@@ -178,18 +510,48 @@ class EventSchemaRepository(AuditableRepository[EventSchema]):
         return None
 
     async def activate_schema(self, schema_id: str) -> EventSchema | None:
-        """Activate a schema with audit event (cache invalidated via hook)."""
+        """
+        Activate a schema with audit event (cache invalidated via hook).
+
+        Any other active version of the event type is deactivated first.
+        """
         schema = await self.get_by_id(schema_id)
         if schema:
+            await self._deactivate_active_versions(
+                schema.tenant_id, schema.event_type, keep_id=schema.id
+            )
             schema.is_active = True
             updated = await self.update(schema)
             await self.emit_custom_audit(updated, AuditAction.ACTIVATED)
             return updated
         return None
 
+    async def _deactivate_active_versions(
+        self, tenant_id: str, event_type: str, keep_id: str | None = None
+    ) -> None:
+        """Deactivate the active version of an event type, with audit events."""
+        conditions = [
+            EventSchema.tenant_id == tenant_id,
+            EventSchema.event_type == event_type,
+            EventSchema.is_active.is_(True),
+        ]
+        if keep_id is not None:
+            conditions.append(EventSchema.id != keep_id)
+        result = await self.db.execute(
+            update(EventSchema)
+            .where(*conditions)
+            .values(is_active=False)
+            .returning(EventSchema)
+        )
+        for schema in result.scalars().all():
+            await self.emit_custom_audit(schema, AuditAction.DEACTIVATED)
+
     async def _invalidate_schema_cache(self, tenant_id: str, event_type: str) -> None:
         """Invalidate cached schemas when schema is modified"""
+        cache_key = _active_schema_key(tenant_id, event_type)
+        _evict_local_schema(cache_key)
         if self.cache and self.cache.is_available():
-            # Invalidate active schema cache
-            cache_key = f"schema:active:{tenant_id}:{event_type}"
+            # Invalidate active schema cache, then tell other workers to drop
+            # their local copies
             await self.cache.delete(cache_key)
+            await self.cache.publish(SCHEMA_INVALIDATION_CHANNEL, cache_key)
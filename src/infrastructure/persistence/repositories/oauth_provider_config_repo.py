@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import TYPE_CHECKING, Any
-
-from sqlalchemy import and_, select
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import (ColumnDefault, ColumnElement, FromClause, RowMapping, Table, and_,
+                        bindparam, case, delete, insert, literal, or_, select, true, tuple_,
+                        update)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
+from src.domain.exceptions import UnknownProviderError
 from src.infrastructure.persistence.models.oauth_provider_config import (
     OAuthAuditLog, OAuthProviderConfig, OAuthState)
 from src.infrastructure.persistence.repositories.auditable_repo import AuditableRepository
@@ -18,6 +26,93 @@ if TYPE_CHECKING:
     from src.application.services.system_audit_service import SystemAuditService
 
 
+# Columns returned by the Core listing queries; credentials are never selected
+CONFIG_LIST_COLUMNS = (
+    "id",
+    "tenant_id",
+    "provider_type",
+    "display_name",
+    "version",
+    "is_active",
+    "superseded_by_id",
+    "redirect_uri",
+    "redirect_uri_whitelist",
+    "allowed_scopes",
+    "default_scopes",
+    "tenant_configured_scopes",
+    "health_status",
+    "last_health_check_at",
+    "rate_limit_connections_per_hour",
+    "current_hour_connections",
+    "created_at",
+    "updated_at",
+    "created_by",
+)
+AUDIT_LOG_LIST_COLUMNS = (
+    "id",
+    "tenant_id",
+    "provider_config_id",
+    "actor_user_id",
+    "action",
+    "timestamp",
+    "changes",
+    "reason",
+    "ip_address",
+)
+
+# Connection rate limits are counted per window
+RATE_LIMIT_WINDOW = timedelta(hours=1)
+
+# Rows removed per DELETE (and per commit) by cleanup_expired_states
+STATE_CLEANUP_BATCH_SIZE = 1000
+
+# OAuth state lifetimes, prebuilt for the TTLs callers use
+_STATE_TTLS: Mapping[int, timedelta] = MappingProxyType(
+    {minutes: timedelta(minutes=minutes) for minutes in (5, 10, 15, 30, 60)}
+)
+
+# Per-provider defaults for a first config version
+_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType(
+    {
+        "gmail": "Gmail",
+        "outlook": "Microsoft 365",
+        "yahoo": "Yahoo Mail",
+    }
+)
+_AUTH_ENDPOINTS: Mapping[str, str] = MappingProxyType(
+    {
+        "gmail": "https://accounts.google.com/o/oauth2/v2/auth",
+        "outlook": "https://login.microsoftonline.com/common/oauth2/v2.0/authorize",
+        "yahoo": "https://api.login.yahoo.com/oauth2/request_auth",
+    }
+)
+_TOKEN_ENDPOINTS: Mapping[str, str] = MappingProxyType(
+    {
+        "gmail": "https://oauth2.googleapis.com/token",
+        "outlook": "https://login.microsoftonline.com/common/oauth2/v2.0/token",
+        "yahoo": "https://api.login.yahoo.com/oauth2/get_token",
+    }
+)
+
+# Built once: the hottest config lookup (every OAuth connect/refresh), an
+# equality match on uq_oauth_provider_config_active
+_ACTIVE_CONFIG_STMT = select(OAuthProviderConfig).where(
+    OAuthProviderConfig.tenant_id == bindparam("tenant_id"),
+    OAuthProviderConfig.provider_type == bindparam("provider_type"),
+    OAuthProviderConfig.is_active,
+    OAuthProviderConfig.deleted_at.is_(None),
+)
+
+
+def _after_config(table: FromClause, cursor: tuple[str, int]) -> ColumnElement[bool]:
+    """Keyset predicate for the (provider_type, version DESC) listing order."""
+    provider_type, version = cursor
+    return and_(
+        table.c.provider_type >= provider_type,
+        or_(table.c.provider_type > provider_type, table.c.version < version),
+    )
+
+
 class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
     """Repository for OAuth provider configuration with versioning support and audit tracking."""
 
@@ -37,30 +132,22 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
     def _get_tenant_id(self, obj: OAuthProviderConfig) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: OAuthProviderConfig) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "provider_type": obj.provider_type,
-            "display_name": obj.display_name,
-            "version": obj.version,
-            "is_active": obj.is_active,
-            "health_status": obj.health_status,
-            # Note: encrypted credentials are excluded for security
-        }
+    _audit_columns = (
+        "id",
+        "provider_type",
+        "display_name",
+        "version",
+        "is_active",
+        "health_status",
+        # Note: encrypted credentials are excluded for security
+    )
 
     async def get_active_config(
         self, tenant_id: str, provider_type: str
     ) -> OAuthProviderConfig | None:
-        """Get active configuration for provider"""
+        """Get active configuration for provider (unique via uq_oauth_provider_config_active)"""
         result = await self.db.execute(
-            select(OAuthProviderConfig).where(
-                and_(
-                    OAuthProviderConfig.tenant_id == tenant_id,
-                    OAuthProviderConfig.provider_type == provider_type,
-                    OAuthProviderConfig.is_active.is_(True),
-                    OAuthProviderConfig.deleted_at.is_(None),
-                )
-            )
+            _ACTIVE_CONFIG_STMT, {"tenant_id": tenant_id, "provider_type": provider_type}
         )
         return result.scalar_one_or_none()
 
@@ -85,8 +172,14 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
         include_inactive: bool = False,
         skip: int = 0,
         limit: int = 100,
+        cursor: tuple[str, int] | None = None,
     ) -> list[OAuthProviderConfig]:
-        """List all OAuth provider configs for tenant"""
+        """
+        List all OAuth provider configs for tenant, by provider then newest version
+
+        cursor is the (provider_type, version) of the last config seen (keyset
+        pagination); skip is deprecated.
+        """
         query = select(OAuthProviderConfig).where(
             and_(
                 OAuthProviderConfig.tenant_id == tenant_id,
@@ -96,6 +189,8 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
 
         if not include_inactive:
             query = query.where(OAuthProviderConfig.is_active.is_(True))
+        if cursor is not None:
+            query = query.where(_after_config(OAuthProviderConfig.__table__, cursor))
 
         query = (
             query.offset(skip)
@@ -106,6 +201,42 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def list_configs_core(
+        self,
+        tenant_id: str,
+        include_inactive: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[str, int] | None = None,
+    ) -> Sequence[RowMapping]:
+        """
+        List OAuth provider configs for tenant as plain row mappings.
+
+        Read-only variant of list_configs: selects CONFIG_LIST_COLUMNS through
+        Core, skipping ORM hydration and the encrypted credential columns.
+        """
+        table = OAuthProviderConfig.__table__
+        query = select(*(table.c[name] for name in CONFIG_LIST_COLUMNS)).where(
+            and_(
+                table.c.tenant_id == tenant_id,
+                table.c.deleted_at.is_(None),
+            )
+        )
+
+        if not include_inactive:
+            query = query.where(table.c.is_active.is_(True))
+        if cursor is not None:
+            query = query.where(_after_config(table, cursor))
+
+        query = (
+            query.offset(skip)
+            .limit(limit)
+            .order_by(table.c.provider_type, table.c.version.desc())
+        )
+
+        result = await self.db.execute(query)
+        return result.mappings().all()
+
     async def create_new_version(
         self,
         tenant_id: str,
@@ -120,43 +251,90 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
         """
         Create new version of OAuth config (credential rotation).
 
-        Deactivates previous version and creates new active version.
+        Deactivates previous version and creates new active version. A
+        rotation is one statement: an UPDATE deactivates the active row and
+        feeds the INSERT of its successor, which copies the unchanged fields
+        server-side, so the previous row is never loaded. The INSERT reads
+        from the UPDATE, so the old row is deactivated before the new one
+        reaches uq_oauth_provider_config_active.
         """
-        # Get current active config
-        current = await self.get_active_config(tenant_id, provider_type)
-
-        if current:
-            # Deactivate current version
-            current.is_active = False
-            new_version = current.version + 1
+        # __table__ is typed as FromClause; DML needs the Table
+        table = cast(Table, OAuthProviderConfig.__table__)
+        new_id = generate_cuid()
+        now = utc_now()
 
-            # Create new version
-            new_config = OAuthProviderConfig(
-                tenant_id=tenant_id,
-                provider_type=provider_type,
-                display_name=current.display_name,
-                version=new_version,
-                is_active=True,
-                client_id_encrypted=client_id_encrypted,
-                client_secret_encrypted=client_secret_encrypted,
-                encryption_key_id=encryption_key_id,
-                redirect_uri=redirect_uri,
-                redirect_uri_whitelist=current.redirect_uri_whitelist,
-                allowed_scopes=scopes,
-                default_scopes=scopes,
-                tenant_configured_scopes=scopes,
-                authorization_endpoint=current.authorization_endpoint,
-                token_endpoint=current.token_endpoint,
-                provider_metadata=current.provider_metadata,
-                created_by=created_by,
+        previous = (
+            update(table)
+            .where(
+                table.c.tenant_id == tenant_id,
+                table.c.provider_type == provider_type,
+                table.c.is_active,
+                table.c.deleted_at.is_(None),
             )
+            .values(is_active=False, superseded_by_id=new_id, updated_at=now)
+            .returning(
+                table.c.id,
+                table.c.version,
+                table.c.display_name,
+                table.c.redirect_uri_whitelist,
+                table.c.authorization_endpoint,
+                table.c.token_endpoint,
+                table.c.provider_metadata,
+            )
+            .cte("previous")
+        )
+        # Python-side defaults are not applied inside a CTE, so every column
+        # with a default is given explicitly
+        copied = {
+            **{
+                column.name: literal(column.default.arg, column.type)
+                for column in table.c
+                if isinstance(column.default, ColumnDefault) and column.default.is_scalar
+            },
+            "id": literal(new_id),
+            "tenant_id": literal(tenant_id),
+            "provider_type": literal(provider_type),
+            "display_name": previous.c.display_name,
+            "version": previous.c.version + 1,
+            "is_active": true(),
+            "client_id_encrypted": literal(client_id_encrypted),
+            "client_secret_encrypted": literal(client_secret_encrypted),
+            "encryption_key_id": literal(encryption_key_id),
+            "redirect_uri": literal(redirect_uri),
+            "redirect_uri_whitelist": previous.c.redirect_uri_whitelist,
+            "allowed_scopes": literal(scopes, table.c.allowed_scopes.type),
+            "default_scopes": literal(scopes, table.c.default_scopes.type),
+            "tenant_configured_scopes": literal(scopes, table.c.tenant_configured_scopes.type),
+            "authorization_endpoint": previous.c.authorization_endpoint,
+            "token_endpoint": previous.c.token_endpoint,
+            "provider_metadata": previous.c.provider_metadata,
+            "created_by": literal(created_by),
+            "created_at": literal(now, table.c.created_at.type),
+            "updated_at": literal(now, table.c.updated_at.type),
+        }
+        rotated = (
+            insert(table)
+            .from_select(
+                list(copied),
+                select(*copied.values()).select_from(previous),
+                include_defaults=False,
+            )
+            .returning(*table.c)
+            .cte("rotated")
+        )
+        result = await self.db.execute(
+            select(
+                aliased(OAuthProviderConfig, rotated),
+                previous.c.id,
+                previous.c.version,
+            ).select_from(rotated.join(previous, true()))
+        )
+        row = result.one_or_none()
 
-            # Link versions
-            current.superseded_by_id = new_config.id
-
-        else:
+        if row is None:
             # First version for this provider
             new_config = OAuthProviderConfig(
+                id=new_id,
                 tenant_id=tenant_id,
                 provider_type=provider_type,
                 display_name=self._get_display_name(provider_type),
@@ -174,54 +352,98 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
                 token_endpoint=self._get_token_endpoint(provider_type),
                 created_by=created_by,
             )
+            return await self.create(new_config)
+
+        new_config, previous_id, previous_version = row
+        await self._on_after_create(new_config)
+
+        # Keep an already-loaded previous version in step with the UPDATE
+        stale = self.db.identity_map.get(identity_key(OAuthProviderConfig, previous_id))
+        if stale is not None:
+            set_committed_value(stale, "is_active", False)
+            set_committed_value(stale, "superseded_by_id", new_id)
+
+        # Emit custom audit for credential rotation
+        await self.emit_custom_audit(
+            new_config,
+            AuditAction.STATUS_CHANGED,
+            metadata={
+                "operation": "credential_rotation",
+                "previous_version": previous_version,
+                "new_version": new_config.version,
+                "previous_config_id": previous_id,
+            },
+        )
+
+        return new_config
 
-        await self.create(new_config)
-
-        # Emit custom audit for credential rotation if this is a version upgrade
-        if current:
-            await self.emit_custom_audit(
-                new_config,
-                AuditAction.STATUS_CHANGED,
-                metadata={
-                    "operation": "credential_rotation",
-                    "previous_version": current.version,
-                    "new_version": new_config.version,
-                    "previous_config_id": current.id,
-                },
+    async def activate_config(self, config_id: str) -> OAuthProviderConfig | None:
+        """
+        Activate a config version with audit event.
+
+        The provider's other live active version is deactivated first
+        (uq_oauth_provider_config_active allows one); a concurrent activation
+        of another version fails with IntegrityError.
+        """
+        config = await self.get_by_id(config_id)
+        if config is None:
+            return None
+
+        result = await self.db.execute(
+            update(OAuthProviderConfig)
+            .where(
+                OAuthProviderConfig.tenant_id == config.tenant_id,
+                OAuthProviderConfig.provider_type == config.provider_type,
+                OAuthProviderConfig.is_active.is_(True),
+                OAuthProviderConfig.deleted_at.is_(None),
+                OAuthProviderConfig.id != config.id,
             )
+            .values(is_active=False)
+            .returning(OAuthProviderConfig)
+        )
+        for previous in result.scalars().all():
+            await self.emit_custom_audit(previous, AuditAction.DEACTIVATED)
 
-        return new_config
+        config.is_active = True
+        updated = await self.update(config)
+        await self.emit_custom_audit(updated, AuditAction.ACTIVATED)
+        return updated
 
     async def increment_connection_count(self, config_id: str) -> bool:
-        """Increment hourly connection counter for rate limiting"""
-        config = await self.get_by_id(config_id)
-        if not config:
-            return False
+        """
+        Increment hourly connection counter for rate limiting.
 
+        Runs as one conditional UPDATE: the hourly reset, the limit check and
+        the increment are evaluated by the database against the current row,
+        so concurrent callers cannot both pass on the same stale count.
+        Returns False if the config does not exist or the limit is reached.
+        """
         now = utc_now()
-        # Normalize DB value to UTC-aware (handles legacy naive datetimes)
-        reset_at = ensure_utc(config.rate_limit_reset_at)
-
-        # Reset counter if hour has passed
-        if reset_at and now > reset_at:
-            config.current_hour_connections = 0
-            config.rate_limit_reset_at = now + timedelta(hours=1)
-
-        # Initialize if not set
-        if not config.rate_limit_reset_at:
-            config.rate_limit_reset_at = now + timedelta(hours=1)
-
-        # Check rate limit
-        if (
-            config.rate_limit_connections_per_hour
-            and config.current_hour_connections >= config.rate_limit_connections_per_hour
-        ):
-            return False
-
-        # Increment counter
-        config.current_hour_connections += 1
-        await self.db.flush()
-        return True
+        hour_elapsed = and_(
+            OAuthProviderConfig.rate_limit_reset_at.is_not(None),
+            OAuthProviderConfig.rate_limit_reset_at < now,
+        )
+        current = case((hour_elapsed, 0), else_=OAuthProviderConfig.current_hour_connections)
+        limit = OAuthProviderConfig.rate_limit_connections_per_hour
+        result = await self.db.execute(
+            update(OAuthProviderConfig)
+            .where(
+                OAuthProviderConfig.id == config_id,
+                or_(limit.is_(None), limit == 0, current < limit),
+            )
+            .values(
+                current_hour_connections=current + 1,
+                rate_limit_reset_at=case(
+                    (
+                        or_(OAuthProviderConfig.rate_limit_reset_at.is_(None), hour_elapsed),
+                        now + RATE_LIMIT_WINDOW,
+                    ),
+                    else_=OAuthProviderConfig.rate_limit_reset_at,
+                ),
+            )
+            .returning(OAuthProviderConfig.id)
+        )
+        return result.scalar_one_or_none() is not None
 
     async def update_health_status(
         self,
@@ -230,40 +452,33 @@ class OAuthProviderConfigRepository(AuditableRepository[OAuthProviderConfig]):
         error: str | None = None,
     ) -> None:
         """Update provider health status"""
-        config = await self.get_by_id(config_id)
-        if config:
-            config.health_status = status
-            config.last_health_check_at = utc_now()
-            if error:
-                config.last_health_error = error
-            await self.db.flush()
-
-    def _get_display_name(self, provider_type: str) -> str:
+        values: dict[str, Any] = {"health_status": status, "last_health_check_at": utc_now()}
+        if error:
+            values["last_health_error"] = error
+        await self.db.execute(
+            update(OAuthProviderConfig).where(OAuthProviderConfig.id == config_id).values(**values)
+        )
+
+    @staticmethod
+    def _get_display_name(provider_type: str) -> str:
         """Get display name for provider"""
-        names = {
-            "gmail": "Gmail",
-            "outlook": "Microsoft 365",
-            "yahoo": "Yahoo Mail",
-        }
-        return names.get(provider_type, provider_type.title())
+        return _DISPLAY_NAMES.get(provider_type, provider_type.title())
 
-    def _get_auth_endpoint(self, provider_type: str) -> str:
+    @staticmethod
+    def _get_auth_endpoint(provider_type: str) -> str:
         """Get authorization endpoint for provider"""
-        endpoints = {
-            "gmail": "https://accounts.google.com/o/oauth2/v2/auth",
-            "outlook": "https://login.microsoftonline.com/common/oauth2/v2.0/authorize",
-            "yahoo": "https://api.login.yahoo.com/oauth2/request_auth",
-        }
-        return endpoints[provider_type]
+        try:
+            return _AUTH_ENDPOINTS[provider_type]
+        except KeyError:
+            raise UnknownProviderError(provider_type) from None
 
-    def _get_token_endpoint(self, provider_type: str) -> str:
+    @staticmethod
+    def _get_token_endpoint(provider_type: str) -> str:
         """Get token endpoint for provider"""
-        endpoints = {
-            "gmail": "https://oauth2.googleapis.com/token",
-            "outlook": "https://login.microsoftonline.com/common/oauth2/v2.0/token",
-            "yahoo": "https://api.login.yahoo.com/oauth2/get_token",
-        }
-        return endpoints[provider_type]
+        try:
+            return _TOKEN_ENDPOINTS[provider_type]
+        except KeyError:
+            raise UnknownProviderError(provider_type) from None
 
 
 class OAuthStateRepository:
@@ -283,6 +498,7 @@ class OAuthStateRepository:
         ttl_minutes: int = 10,
     ) -> OAuthState:
         """Create new OAuth state"""
+        ttl = _STATE_TTLS.get(ttl_minutes) or timedelta(minutes=ttl_minutes)
         now = utc_now()
         state = OAuthState(
             id=generate_cuid(),
@@ -292,19 +508,17 @@ class OAuthStateRepository:
             nonce=nonce,
             signature=signature,
             created_at=now,
-            expires_at=now + timedelta(minutes=ttl_minutes),
+            expires_at=now + ttl,
             consumed=False,
             return_url=return_url,
         )
         self.db.add(state)
         await self.db.flush()
-        await self.db.refresh(state)
         return state
 
     async def get_state(self, state_id: str) -> OAuthState | None:
-        """Get OAuth state by ID"""
-        result = await self.db.execute(select(OAuthState).where(OAuthState.id == state_id))
-        return result.scalar_one_or_none()
+        """Get OAuth state by ID (served from the identity map when already loaded)"""
+        return await self.db.get(OAuthState, state_id)
 
     async def consume_state(self, state_id: str) -> OAuthState | None:
         """
@@ -333,27 +547,49 @@ class OAuthStateRepository:
         state.consumed_at = now
         state.callback_received_at = now
         await self.db.flush()
-        await self.db.refresh(state)
         return state
 
     async def cleanup_expired_states(self) -> int:
-        """Delete expired OAuth states (cleanup job)"""
+        """
+        Delete consumed, expired OAuth states (cleanup job)
+
+        Deletes in chunks of STATE_CLEANUP_BATCH_SIZE, oldest first, and
+        commits after each chunk so no single transaction holds many row
+        locks or a large WAL segment. Rows locked by an in-flight callback
+        are skipped until the next run. Run on a dedicated session, not
+        inside a request transaction.
+
+        Returns:
+            Number of states deleted
+        """
         now = utc_now()
-        result = await self.db.execute(
-            select(OAuthState).where(
+        expired_ids = (
+            select(OAuthState.id)
+            .where(
                 and_(
                     OAuthState.expires_at < now,
                     OAuthState.consumed.is_(True),
                 )
             )
+            .order_by(OAuthState.expires_at)
+            .limit(STATE_CLEANUP_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(OAuthState)
+            .where(OAuthState.id.in_(expired_ids.scalar_subquery()))
+            .returning(OAuthState.id)
+            .execution_options(synchronize_session=False)
         )
-        states = result.scalars().all()
-
-        for state in states:
-            await self.db.delete(state)
 
-        await self.db.flush()
-        return len(states)
+        total = 0
+        while True:
+            result = await self.db.execute(stmt)
+            deleted = len(result.scalars().all())
+            await self.db.commit()
+            total += deleted
+            if deleted < STATE_CLEANUP_BATCH_SIZE:
+                return total
 
 
 class OAuthAuditLogRepository:
@@ -373,7 +609,13 @@ class OAuthAuditLogRepository:
         ip_address: str | None = None,
         user_agent: str | None = None,
     ) -> OAuthAuditLog:
-        """Create audit log entry"""
+        """
+        Create audit log entry.
+
+        The entry is only added to the session: it is written by the caller's
+        commit flush, in the same transaction and INSERT batch as the change
+        it records, rather than costing a flush round-trip of its own.
+        """
         log = OAuthAuditLog(
             id=generate_cuid(),
             tenant_id=tenant_id,
@@ -387,8 +629,6 @@ class OAuthAuditLogRepository:
             user_agent=user_agent,
         )
         self.db.add(log)
-        await self.db.flush()
-        await self.db.refresh(log)
         return log
 
     async def get_config_history(
@@ -397,18 +637,50 @@ class OAuthAuditLogRepository:
         provider_config_id: str,
         skip: int = 0,
         limit: int = 100,
+        cursor: tuple[datetime, str] | None = None,
     ) -> list[OAuthAuditLog]:
-        """Get audit history for config"""
-        result = await self.db.execute(
-            select(OAuthAuditLog)
-            .where(
-                and_(
-                    OAuthAuditLog.tenant_id == tenant_id,
-                    OAuthAuditLog.provider_config_id == provider_config_id,
-                )
+        """
+        Get audit history for config, newest first
+
+        cursor is the (timestamp, id) of the last entry seen (keyset
+        pagination); skip is deprecated.
+        """
+        query = select(OAuthAuditLog).where(
+            and_(
+                OAuthAuditLog.tenant_id == tenant_id,
+                OAuthAuditLog.provider_config_id == provider_config_id,
             )
-            .order_by(OAuthAuditLog.timestamp.desc())
+        )
+        if cursor is not None:
+            query = query.where(tuple_(OAuthAuditLog.timestamp, OAuthAuditLog.id) < cursor)
+        result = await self.db.execute(
+            query.order_by(OAuthAuditLog.timestamp.desc(), OAuthAuditLog.id.desc())
             .offset(skip)
             .limit(limit)
         )
         return list(result.scalars().all())
+
+    async def get_config_history_core(
+        self,
+        tenant_id: str,
+        provider_config_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[datetime, str] | None = None,
+    ) -> Sequence[RowMapping]:
+        """Get audit history for config as plain row mappings (no ORM hydration)"""
+        table = OAuthAuditLog.__table__
+        query = select(*(table.c[name] for name in AUDIT_LOG_LIST_COLUMNS)).where(
+            and_(
+                table.c.tenant_id == tenant_id,
+                table.c.provider_config_id == provider_config_id,
+            )
+        )
+        if cursor is not None:
+            query = query.where(tuple_(table.c.timestamp, table.c.id) < cursor)
+        result = await self.db.execute(
+            query.order_by(table.c.timestamp.desc(), table.c.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.mappings().all()
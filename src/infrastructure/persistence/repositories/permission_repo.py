@@ -1,19 +1,54 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.persistence.models.permission import (
     Permission, RolePermission, UserRole)
+from src.infrastructure.persistence.models.role import Role
 from src.infrastructure.persistence.repositories.auditable_repo import AuditableRepository
 from src.shared.enums import AuditAction
+from src.shared.utils import generate_cuid
 
 if TYPE_CHECKING:
     from src.application.services.system_audit_service import SystemAuditService
 
 
+_PERMISSION_BY_CODE_STMT = select(Permission).where(
+    Permission.code == bindparam("code"), Permission.tenant_id == bindparam("tenant_id")
+)
+_PERMISSIONS_BY_TENANT_STMT = (
+    select(Permission)
+    .where(Permission.tenant_id == bindparam("tenant_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(Permission.resource, Permission.action)
+)
+_PERMISSIONS_BY_RESOURCE_STMT = select(Permission).where(
+    Permission.tenant_id == bindparam("tenant_id"), Permission.resource == bindparam("resource")
+)
+_ROLE_PERMISSIONS_STMT = (
+    select(Permission)
+    .join(RolePermission, RolePermission.permission_id == Permission.id)
+    .where(
+        RolePermission.role_id == bindparam("role_id"),
+        RolePermission.tenant_id == bindparam("tenant_id"),
+    )
+)
+_USER_ROLES_STMT = (
+    select(Role)
+    .join(UserRole, UserRole.role_id == Role.id)
+    .where(
+        UserRole.user_id == bindparam("user_id"),
+        UserRole.tenant_id == bindparam("tenant_id"),
+        Role.is_active.is_(True),
+    )
+)
+
+
 class PermissionRepository(AuditableRepository[Permission]):
     """Repository for Permission operations with automatic audit tracking."""
 
@@ -33,19 +68,18 @@ class PermissionRepository(AuditableRepository[Permission]):
     def _get_tenant_id(self, obj: Permission) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: Permission) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "code": obj.code,
-            "resource": obj.resource,
-            "action": obj.action,
-            "description": obj.description,
-        }
+    _audit_columns = (
+        "id",
+        "code",
+        "resource",
+        "action",
+        "description",
+    )
 
     async def get_by_code_and_tenant(self, code: str, tenant_id: str) -> Permission | None:
         """Get permission by code within a specific tenant"""
         result = await self.db.execute(
-            select(Permission).where(Permission.code == code, Permission.tenant_id == tenant_id)
+            _PERMISSION_BY_CODE_STMT, {"code": code, "tenant_id": tenant_id}
         )
         return result.scalar_one_or_none()
 
@@ -54,29 +88,43 @@ class PermissionRepository(AuditableRepository[Permission]):
     ) -> list[Permission]:
         """Get all permissions for a tenant"""
         result = await self.db.execute(
-            select(Permission)
-            .where(Permission.tenant_id == tenant_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(Permission.resource, Permission.action)
+            _PERMISSIONS_BY_TENANT_STMT, {"tenant_id": tenant_id, "skip": skip, "limit": limit}
         )
         return list(result.scalars().all())
 
     async def get_by_resource(self, tenant_id: str, resource: str) -> list[Permission]:
         """Get all permissions for a specific resource"""
         result = await self.db.execute(
-            select(Permission).where(
-                Permission.tenant_id == tenant_id, Permission.resource == resource
-            )
+            _PERMISSIONS_BY_RESOURCE_STMT, {"tenant_id": tenant_id, "resource": resource}
         )
         return list(result.scalars().all())
 
+    async def get_ids_by_codes(self, codes: list[str], tenant_id: str) -> dict[str, str]:
+        """Map permission codes to IDs within a tenant (unknown codes are omitted)"""
+        if not codes:
+            return {}
+        result = await self.db.execute(
+            select(Permission.code, Permission.id).where(
+                Permission.tenant_id == tenant_id, Permission.code.in_(codes)
+            )
+        )
+        return dict(result.tuples().all())
+
+    async def get_existing_ids(self, permission_ids: list[str], tenant_id: str) -> set[str]:
+        """Return the subset of permission IDs that exist within a tenant"""
+        if not permission_ids:
+            return set()
+        result = await self.db.execute(
+            select(Permission.id).where(
+                Permission.tenant_id == tenant_id, Permission.id.in_(permission_ids)
+            )
+        )
+        return set(result.scalars().all())
+
     async def get_permissions_for_role(self, role_id: str, tenant_id: str) -> list[Permission]:
         """Get all permissions assigned to a role"""
         result = await self.db.execute(
-            select(Permission)
-            .join(RolePermission, RolePermission.permission_id == Permission.id)
-            .where(RolePermission.role_id == role_id, RolePermission.tenant_id == tenant_id)
+            _ROLE_PERMISSIONS_STMT, {"role_id": role_id, "tenant_id": tenant_id}
         )
         return list(result.scalars().all())
 
@@ -89,7 +137,6 @@ class PermissionRepository(AuditableRepository[Permission]):
         )
         self.db.add(role_permission)
         await self.db.flush()
-        await self.db.refresh(role_permission)
 
         # Emit custom audit for role assignment
         if self._audit_enabled and self.audit_service:
@@ -104,24 +151,69 @@ class PermissionRepository(AuditableRepository[Permission]):
 
         return role_permission
 
+    async def assign_permissions_to_role(
+        self, role_id: str, permission_ids: list[str], tenant_id: str
+    ) -> list[str]:
+        """
+        Assign many permissions to a role in one INSERT, with audit events.
+
+        Existing assignments are skipped (ON CONFLICT DO NOTHING on
+        uq_role_permission), so the call is idempotent.
+
+        Returns:
+            IDs of the permissions that were newly assigned
+        """
+        if not permission_ids:
+            return []
+
+        stmt = (
+            pg_insert(RolePermission)
+            .values(
+                [
+                    {
+                        "id": generate_cuid(),
+                        "tenant_id": tenant_id,
+                        "role_id": role_id,
+                        "permission_id": permission_id,
+                    }
+                    for permission_id in dict.fromkeys(permission_ids)
+                ]
+            )
+            .on_conflict_do_nothing(constraint="uq_role_permission")
+            .returning(RolePermission.permission_id)
+        )
+        result = await self.db.execute(stmt)
+        assigned = list(result.scalars().all())
+
+        if self._audit_enabled and self.audit_service:
+            for permission_id in assigned:
+                await self.audit_service.emit_audit_event(
+                    tenant_id=tenant_id,
+                    entity_type="role",
+                    action=AuditAction.ASSIGNED,
+                    entity_id=role_id,
+                    entity_data={"permission_id": permission_id},
+                    metadata={"permission_assigned": permission_id},
+                )
+
+        return assigned
+
     async def remove_permission_from_role(self, role_id: str, permission_id: str) -> bool:
         """Remove a permission from a role with audit event."""
+        # One statement; RETURNING supplies the tenant for the audit event
         result = await self.db.execute(
-            select(RolePermission).where(
+            delete(RolePermission)
+            .where(
                 RolePermission.role_id == role_id,
                 RolePermission.permission_id == permission_id,
             )
+            .returning(RolePermission.tenant_id)
         )
-        role_permission = result.scalar_one_or_none()
+        tenant_id = result.scalar_one_or_none()
 
-        if not role_permission:
+        if tenant_id is None:
             return False
 
-        tenant_id = role_permission.tenant_id
-
-        await self.db.delete(role_permission)
-        await self.db.flush()
-
         # Emit custom audit for role unassignment
         if self._audit_enabled and self.audit_service:
             await self.audit_service.emit_audit_event(
@@ -151,7 +243,6 @@ class PermissionRepository(AuditableRepository[Permission]):
         )
         self.db.add(user_role)
         await self.db.flush()
-        await self.db.refresh(user_role)
 
         # Emit custom audit for role assignment to user
         if self._audit_enabled and self.audit_service:
@@ -168,19 +259,17 @@ class PermissionRepository(AuditableRepository[Permission]):
 
     async def remove_role_from_user(self, user_id: str, role_id: str) -> bool:
         """Remove a role from a user with audit event."""
+        # One statement; RETURNING supplies the tenant for the audit event
         result = await self.db.execute(
-            select(UserRole).where(UserRole.user_id == user_id, UserRole.role_id == role_id)
+            delete(UserRole)
+            .where(UserRole.user_id == user_id, UserRole.role_id == role_id)
+            .returning(UserRole.tenant_id)
         )
-        user_role = result.scalar_one_or_none()
+        tenant_id = result.scalar_one_or_none()
 
-        if not user_role:
+        if tenant_id is None:
             return False
 
-        tenant_id = user_role.tenant_id
-
-        await self.db.delete(user_role)
-        await self.db.flush()
-
         # Emit custom audit for role removal from user
         if self._audit_enabled and self.audit_service:
             await self.audit_service.emit_audit_event(
@@ -194,17 +283,32 @@ class PermissionRepository(AuditableRepository[Permission]):
 
         return True
 
-    async def get_user_roles(self, user_id: str, tenant_id: str) -> list:
+    async def get_user_roles(self, user_id: str, tenant_id: str) -> list[Role]:
         """Get all roles assigned to a user"""
-        from src.infrastructure.persistence.models.role import Role
+        result = await self.db.execute(
+            _USER_ROLES_STMT, {"user_id": user_id, "tenant_id": tenant_id}
+        )
+        return list(result.scalars().all())
+
+    async def get_user_permissions(self, user_id: str, tenant_id: str) -> frozenset[str]:
+        """
+        Get the permission codes granted to a user through all of their roles.
 
+        Resolves UserRole -> RolePermission -> Permission in a single joined
+        query instead of get_user_roles plus get_permissions_for_role per role.
+        Inactive roles and expired role assignments grant nothing.
+        """
         result = await self.db.execute(
-            select(Role)
-            .join(UserRole, UserRole.role_id == Role.id)
+            select(Permission.code)
+            .select_from(UserRole)
+            .join(RolePermission, RolePermission.role_id == UserRole.role_id)
+            .join(Permission, Permission.id == RolePermission.permission_id)
+            .join(Role, Role.id == UserRole.role_id)
             .where(
                 UserRole.user_id == user_id,
                 UserRole.tenant_id == tenant_id,
                 Role.is_active.is_(True),
+                or_(UserRole.expires_at.is_(None), UserRole.expires_at > func.now()),
             )
         )
-        return list(result.scalars().all())
+        return frozenset(result.scalars().all())
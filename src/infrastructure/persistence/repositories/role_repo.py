@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.persistence.models.role import Role
@@ -13,6 +13,24 @@ if TYPE_CHECKING:
     from src.application.services.system_audit_service import SystemAuditService
 
 
+_ROLE_BY_CODE_STMT = select(Role).where(
+    Role.code == bindparam("code"), Role.tenant_id == bindparam("tenant_id")
+)
+_ROLES_BY_TENANT_STMT = (
+    select(Role)
+    .where(Role.tenant_id == bindparam("tenant_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(Role.created_at.desc())
+)
+_ACTIVE_ROLES_BY_TENANT_STMT = _ROLES_BY_TENANT_STMT.where(Role.is_active.is_(True))
+_SYSTEM_ROLES_STMT = select(Role).where(
+    Role.tenant_id == bindparam("tenant_id"),
+    Role.is_system.is_(True),
+    Role.is_active.is_(True),
+)
+
+
 class RoleRepository(AuditableRepository[Role]):
     """Repository for Role operations with automatic audit tracking."""
 
@@ -32,20 +50,19 @@ class RoleRepository(AuditableRepository[Role]):
     def _get_tenant_id(self, obj: Role) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: Role) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "code": obj.code,
-            "name": obj.name,
-            "description": obj.description,
-            "is_system": obj.is_system,
-            "is_active": obj.is_active,
-        }
+    _audit_columns = (
+        "id",
+        "code",
+        "name",
+        "description",
+        "is_system",
+        "is_active",
+    )
 
     async def get_by_code_and_tenant(self, code: str, tenant_id: str) -> Role | None:
         """Get role by code within a specific tenant"""
         result = await self.db.execute(
-            select(Role).where(Role.code == code, Role.tenant_id == tenant_id)
+            _ROLE_BY_CODE_STMT, {"code": code, "tenant_id": tenant_id}
         )
         return result.scalar_one_or_none()
 
@@ -57,14 +74,10 @@ class RoleRepository(AuditableRepository[Role]):
         include_inactive: bool = False,
     ) -> list[Role]:
         """Get all roles for a tenant"""
-        query = select(Role).where(Role.tenant_id == tenant_id)
-
-        if not include_inactive:
-            query = query.where(Role.is_active.is_(True))
-
-        query = query.offset(skip).limit(limit).order_by(Role.created_at.desc())
-
-        result = await self.db.execute(query)
+        query = _ROLES_BY_TENANT_STMT if include_inactive else _ACTIVE_ROLES_BY_TENANT_STMT
+        result = await self.db.execute(
+            query, {"tenant_id": tenant_id, "skip": skip, "limit": limit}
+        )
         return list(result.scalars().all())
 
     async def deactivate(self, role_id: str) -> Role | None:
@@ -91,11 +104,5 @@ class RoleRepository(AuditableRepository[Role]):
 
     async def get_system_roles(self, tenant_id: str) -> list[Role]:
         """Get all system roles for a tenant"""
-        result = await self.db.execute(
-            select(Role).where(
-                Role.tenant_id == tenant_id,
-                Role.is_system.is_(True),
-                Role.is_active.is_(True),
-            )
-        )
+        result = await self.db.execute(_SYSTEM_ROLES_STMT, {"tenant_id": tenant_id})
         return list(result.scalars().all())
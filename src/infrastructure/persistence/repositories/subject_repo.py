@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.persistence.models.subject import Subject
@@ -12,6 +12,28 @@ if TYPE_CHECKING:
     from src.application.services.system_audit_service import SystemAuditService
 
 
+_SUBJECTS_BY_TENANT_STMT = (
+    select(Subject)
+    .where(Subject.tenant_id == bindparam("tenant_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SUBJECTS_BY_TYPE_STMT = (
+    select(Subject)
+    .where(
+        Subject.tenant_id == bindparam("tenant_id"),
+        Subject.subject_type == bindparam("subject_type"),
+    )
+    .order_by(Subject.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SUBJECT_BY_EXTERNAL_REF_STMT = select(Subject).where(
+    Subject.tenant_id == bindparam("tenant_id"),
+    Subject.external_ref == bindparam("external_ref"),
+)
+
+
 class SubjectRepository(AuditableRepository[Subject]):
     """Repository for Subject entity with automatic audit tracking."""
 
@@ -31,17 +53,16 @@ class SubjectRepository(AuditableRepository[Subject]):
     def _get_tenant_id(self, obj: Subject) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: Subject) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "subject_type": obj.subject_type,
-            "external_ref": obj.external_ref,
-        }
+    _audit_columns = (
+        "id",
+        "subject_type",
+        "external_ref",
+    )
 
     async def get_by_tenant(self, tenant_id: str, skip: int = 0, limit: int = 100) -> list[Subject]:
         """Get all subjects for a tenant with pagination"""
         result = await self.db.execute(
-            select(Subject).where(Subject.tenant_id == tenant_id).offset(skip).limit(limit)
+            _SUBJECTS_BY_TENANT_STMT, {"tenant_id": tenant_id, "skip": skip, "limit": limit}
         )
         return list(result.scalars().all())
 
@@ -50,26 +71,14 @@ class SubjectRepository(AuditableRepository[Subject]):
     ) -> list[Subject]:
         """Get all subjects of a specific type for a tenant with pagination"""
         result = await self.db.execute(
-            select(Subject)
-            .where(Subject.tenant_id == tenant_id, Subject.subject_type == subject_type)
-            .order_by(Subject.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            _SUBJECTS_BY_TYPE_STMT,
+            {"tenant_id": tenant_id, "subject_type": subject_type, "skip": skip, "limit": limit},
         )
         return list(result.scalars().all())
 
     async def get_by_external_ref(self, tenant_id: str, external_ref: str) -> Subject | None:
         """Get subject by external reference"""
         result = await self.db.execute(
-            select(Subject).where(
-                Subject.tenant_id == tenant_id, Subject.external_ref == external_ref
-            )
-        )
-        return result.scalar_one_or_none()
-
-    async def get_by_id_and_tenant(self, subject_id: str, tenant_id: str) -> Subject | None:
-        """Get subject by ID and verify it belongs to the tenant"""
-        result = await self.db.execute(
-            select(Subject).where(Subject.id == subject_id, Subject.tenant_id == tenant_id)
+            _SUBJECT_BY_EXTERNAL_REF_STMT, {"tenant_id": tenant_id, "external_ref": external_ref}
         )
         return result.scalar_one_or_none()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from src.domain.enums import TenantStatus
 from src.infrastructure.cache.redis_cache import CacheService
@@ -16,6 +21,108 @@ if TYPE_CHECKING:
     from src.application.services.system_audit_service import SystemAuditService
 
 
+# Cached tenants are a fixed-shape array, (id, code, name, status,
+# created_at, updated_at), with timestamps as integer microseconds since the
+# epoch: no field names to encode and no ISO strings to parse on a hit.
+# "v2" keeps readers off the earlier dict-shaped entries.
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+# Tenant queries in flight, by cache key (single-flight on cache miss).
+# Results are shared as cache payloads, never ORM instances, because each
+# waiter has its own session.
+_inflight_tenant: dict[str, asyncio.Future[list[Any] | None]] = {}
+
+
+# Tenant lookup by code backs every login
+_TENANT_BY_CODE_STMT = select(Tenant).where(Tenant.code == bindparam("code"))
+_ACTIVE_TENANTS_STMT = (
+    select(Tenant)
+    .where(Tenant.status == TenantStatus.ACTIVE)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+
+# Per-request tier in front of Redis: tenants already resolved during the
+# current request, as detached instances under their Redis keys. None outside
+# a request (Celery tasks, scripts), where lookups skip it.
+_request_tenants: ContextVar[dict[str, Tenant] | None] = ContextVar(
+    "request_tenants", default=None
+)
+
+
+def begin_request_tenant_cache() -> Token[dict[str, Tenant] | None]:
+    """Start an empty tenant cache for the current request (call from middleware)."""
+    return _request_tenants.set({})
+
+
+def end_request_tenant_cache(token: Token[dict[str, Tenant] | None]) -> None:
+    """Discard the current request's tenant cache."""
+    _request_tenants.reset(token)
+
+
+def _tenant_id_key(tenant_id: str) -> str:
+    """Cache key for a tenant looked up by ID."""
+    return f"tenant:v2:id:{tenant_id}"
+
+
+def _tenant_code_key(code: str) -> str:
+    """Cache key for a tenant looked up by code."""
+    return f"tenant:v2:code:{code}"
+
+
+def _to_epoch_us(value: datetime | None) -> int | None:
+    return (value - _EPOCH) // _MICROSECOND if value is not None else None
+
+
+def _from_epoch_us(value: int | None) -> datetime | None:
+    return _EPOCH + timedelta(microseconds=value) if value is not None else None
+
+
+def _tenant_to_cache(tenant: Tenant) -> list[Any]:
+    """Snapshot every tenant column for the cache."""
+    return [
+        tenant.id,
+        tenant.code,
+        tenant.name,
+        tenant.status,
+        _to_epoch_us(tenant.created_at),
+        _to_epoch_us(tenant.updated_at),
+    ]
+
+
+def _tenant_from_cache(data: list[Any]) -> Tenant:
+    """
+    Rebuild a cached tenant without touching the session.
+
+    The instance is detached (persistent identity, no session), so reading
+    it costs no identity-map work and it can never be flushed as an INSERT.
+    """
+    tenant_id, code, name, status, created_at, updated_at = data
+    tenant = Tenant(
+        id=tenant_id,
+        code=code,
+        name=name,
+        status=TenantStatus(status),
+        created_at=_from_epoch_us(created_at),
+        updated_at=_from_epoch_us(updated_at),
+    )
+    make_transient_to_detached(tenant)
+    return tenant
+
+
+def _remember_for_request(tenant: Tenant) -> None:
+    """Keep a detached copy of tenant for the rest of the request, by ID and code."""
+    request_tenants = _request_tenants.get()
+    if request_tenants is not None:
+        if not inspect(tenant).detached:
+            tenant = _tenant_from_cache(_tenant_to_cache(tenant))
+        request_tenants[_tenant_id_key(tenant.id)] = tenant
+        request_tenants[_tenant_code_key(tenant.code)] = tenant
+
+
 class TenantRepository(AuditableRepository[Tenant]):
     """
     Repository for Tenant entity with Redis caching and audit tracking.
@@ -48,101 +155,178 @@ class TenantRepository(AuditableRepository[Tenant]):
         # Tenants use their own ID as tenant_id for audit purposes
         return obj.id
 
-    def _serialize_for_audit(self, obj: Tenant) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "code": obj.code,
-            "name": obj.name,
-            "status": obj.status,
-        }
+    _audit_columns = (
+        "id",
+        "code",
+        "name",
+        "status",
+    )
 
-    async def get_by_id(self, tenant_id: str) -> Tenant | None:
+    async def get_by_id(
+        self, tenant_id: str, *, with_for_update: bool = False
+    ) -> Tenant | None:
         """
         Get tenant by ID with caching
 
-        Uses Redis cache to avoid repeated queries (15 min TTL)
+        Checks the per-request cache, then Redis (15 min TTL). Cache hits
+        are detached, read-only instances; use get_by_id_for_update (or
+        with_for_update=True) to modify.
         """
+        if with_for_update:
+            return await self.get_by_id_for_update(tenant_id, with_for_update=True)
 
         # Try cache first
-        cache_key = f"tenant:id:{tenant_id}"
+        cache_key = _tenant_id_key(tenant_id)
+        request_tenants = _request_tenants.get()
+        if request_tenants is not None and cache_key in request_tenants:
+            return request_tenants[cache_key]
         tenant: Tenant | None
         if self.cache and self.cache.is_available():
             cached = await self.cache.get(cache_key)
             if cached is not None:
-                tenant = Tenant(**cached)
-                self.db.add(tenant)
+                tenant = _tenant_from_cache(cached)
+                _remember_for_request(tenant)
                 return tenant
 
-        # Cache miss - query database (use parent method)
-        tenant = await super().get_by_id(tenant_id)
+        # Cache miss - query database (use parent method), once per key
+        tenant = await self._load_once(cache_key, lambda: self.get_by_id_for_update(tenant_id))
 
         # Cache for future requests
-        if tenant and self.cache and self.cache.is_available():
-            tenant_dict: dict[str, Any] = {
-                "id": tenant.id,
-                "code": tenant.code,
-                "name": tenant.name,
-                "status": tenant.status,
-                "created_at": tenant.created_at.isoformat() if tenant.created_at else None,
-                "updated_at": tenant.updated_at.isoformat() if tenant.updated_at else None,
-            }
-            await self.cache.set(cache_key, tenant_dict, ttl=self.cache_ttl)
+        if tenant:
+            _remember_for_request(tenant)
+            if self.cache and self.cache.is_available():
+                await self.cache.set(cache_key, _tenant_to_cache(tenant), ttl=self.cache_ttl)
 
         return tenant
 
+    async def get_by_id_for_update(
+        self, tenant_id: str, *, with_for_update: bool = False
+    ) -> Tenant | None:
+        """
+        Get tenant by ID from the database, bound to the session for modification
+
+        with_for_update=True also takes a row lock (SELECT ... FOR UPDATE).
+        """
+        return await super().get_by_id(tenant_id, with_for_update=with_for_update)
+
+    async def get_many_by_id(self, tenant_ids: Sequence[str]) -> dict[str, Tenant]:
+        """
+        Get several tenants by ID with caching
+
+        Costs one cache MGET plus, for the misses, one IN query that also
+        repopulates the cache, instead of a round-trip per tenant. Unknown IDs
+        are absent from the result.
+        """
+        ids = list(dict.fromkeys(tenant_ids))
+        tenants: dict[str, Tenant] = {}
+        cache = self.cache
+        if cache is not None and not cache.is_available():
+            cache = None
+
+        if cache is not None:
+            cached_values = await cache.mget([_tenant_id_key(i) for i in ids])
+            for tenant_id, cached in zip(ids, cached_values, strict=True):
+                if cached is not None:
+                    tenants[tenant_id] = _tenant_from_cache(cached)
+
+        missing = [tenant_id for tenant_id in ids if tenant_id not in tenants]
+        if missing:
+            result = await self.db.execute(select(Tenant).where(Tenant.id.in_(missing)))
+            loaded = {tenant.id: tenant for tenant in result.scalars()}
+            tenants.update(loaded)
+
+            if cache is not None and loaded:
+                await cache.set_many(
+                    {
+                        _tenant_id_key(tenant_id): _tenant_to_cache(tenant)
+                        for tenant_id, tenant in loaded.items()
+                    },
+                    ttl=self.cache_ttl,
+                )
+
+        return tenants
+
     async def get_by_code(self, code: str) -> Tenant | None:
         """
         Get tenant by unique code with caching
 
-        Uses Redis cache to avoid repeated queries (15 min TTL)
+        Checks the per-request cache, then Redis (15 min TTL)
         """
 
         # Try cache first
-        cache_key = f"tenant:code:{code}"
+        cache_key = _tenant_code_key(code)
+        request_tenants = _request_tenants.get()
+        if request_tenants is not None and cache_key in request_tenants:
+            return request_tenants[cache_key]
         tenant: Tenant | None
         if self.cache and self.cache.is_available():
             cached = await self.cache.get(cache_key)
             if cached is not None:
-                tenant = Tenant(**cached)
-                self.db.add(tenant)
+                tenant = _tenant_from_cache(cached)
+                _remember_for_request(tenant)
                 return tenant
 
-        # Cache miss - query database
-        result = await self.db.execute(select(Tenant).where(Tenant.code == code))
-        tenant = result.scalar_one_or_none()
+        # Cache miss - query database, once per key
+        async def query() -> Tenant | None:
+            result = await self.db.execute(_TENANT_BY_CODE_STMT, {"code": code})
+            return result.scalar_one_or_none()
+
+        tenant = await self._load_once(cache_key, query)
 
         # Cache for future requests
+        if tenant:
+            _remember_for_request(tenant)
         if tenant and self.cache and self.cache.is_available():
-            tenant_dict: dict[str, Any] = {
-                "id": tenant.id,
-                "code": tenant.code,
-                "name": tenant.name,
-                "status": tenant.status,
-                "created_at": tenant.created_at.isoformat() if tenant.created_at else None,
-                "updated_at": tenant.updated_at.isoformat() if tenant.updated_at else None,
-            }
+            tenant_dict = _tenant_to_cache(tenant)
             # Cache by both ID and code for maximum cache hit rate
-            await self.cache.set(cache_key, tenant_dict, ttl=self.cache_ttl)
-            await self.cache.set(f"tenant:id:{tenant.id}", tenant_dict, ttl=self.cache_ttl)
+            await self.cache.set_many(
+                {cache_key: tenant_dict, _tenant_id_key(tenant.id): tenant_dict},
+                ttl=self.cache_ttl,
+            )
+
+        return tenant
+
+    async def _load_once(
+        self, cache_key: str, query: Callable[[], Awaitable[Tenant | None]]
+    ) -> Tenant | None:
+        """
+        Run a cache-miss query, sharing its result with concurrent misses.
+
+        If another request is already querying this key, wait for its result
+        instead of issuing the same query (if that query fails or is
+        cancelled, run our own). Waiters get detached instances rebuilt from
+        the shared payload; the querying request gets its session-bound row.
+        """
+        inflight = _inflight_tenant.get(cache_key)
+        if inflight is not None:
+            await asyncio.wait([inflight])
+            if not inflight.cancelled():
+                data = inflight.result()
+                return _tenant_from_cache(data) if data else None
 
+        future: asyncio.Future[list[Any] | None] = asyncio.get_running_loop().create_future()
+        _inflight_tenant[cache_key] = future
+        try:
+            tenant = await query()
+            future.set_result(_tenant_to_cache(tenant) if tenant else None)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            _inflight_tenant.pop(cache_key, None)
         return tenant
 
     async def get_active_tenants(self, skip: int = 0, limit: int = 100) -> list[Tenant]:
         """Get all active tenants with pagination"""
-        result = await self.db.execute(
-            select(Tenant)
-            .where(Tenant.status == TenantStatus.ACTIVE.value)
-            .offset(skip)
-            .limit(limit)
-        )
+        result = await self.db.execute(_ACTIVE_TENANTS_STMT, {"skip": skip, "limit": limit})
         return list(result.scalars().all())
 
     async def update_status(self, tenant_id: str, status: TenantStatus) -> Tenant | None:
         """Update tenant status with audit event (cache invalidated via hook)."""
-        tenant = await self.get_by_id(tenant_id)
+        tenant = await self.get_by_id_for_update(tenant_id)
         if tenant:
             old_status = tenant.status
-            tenant.status = status.value
+            tenant.status = status
             updated = await self.update(tenant)
             await self.emit_custom_audit(
                 updated,
@@ -170,6 +354,10 @@ class TenantRepository(AuditableRepository[Tenant]):
 
     async def _invalidate_tenant_cache(self, tenant_id: str, tenant_code: str) -> None:
         """Invalidate cached tenant data"""
+        keys = [_tenant_id_key(tenant_id), _tenant_code_key(tenant_code)]
+        request_tenants = _request_tenants.get()
+        if request_tenants is not None:
+            for key in keys:
+                request_tenants.pop(key, None)
         if self.cache and self.cache.is_available():
-            await self.cache.delete(f"tenant:id:{tenant_id}")
-            await self.cache.delete(f"tenant:code:{tenant_code}")
+            await self.cache.delete_many(keys)
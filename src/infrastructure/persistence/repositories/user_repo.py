@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -35,14 +35,13 @@ class UserRepository(AuditableRepository[User]):
     def _get_tenant_id(self, obj: User) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: User) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "username": obj.username,
-            "email": obj.email,
-            "is_active": obj.is_active,
-            # Note: hashed_password is automatically redacted by SystemAuditService
-        }
+    _audit_columns = (
+        "id",
+        "username",
+        "email",
+        "is_active",
+        # Note: hashed_password is automatically redacted by SystemAuditService
+    )
 
     async def get_by_username_and_tenant(self, username: str, tenant_id: str) -> User | None:
         """Get user by username within a specific tenant"""
@@ -58,13 +57,6 @@ class UserRepository(AuditableRepository[User]):
         )
         return result.scalar_one_or_none()
 
-    async def get_by_id_and_tenant(self, user_id: str, tenant_id: str) -> User | None:
-        """Get user by ID and verify it belongs to the tenant"""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id, User.tenant_id == tenant_id)
-        )
-        return result.scalar_one_or_none()
-
     async def authenticate(self, username: str, tenant_id: str, password: str) -> User | None:
         """
         Authenticate user by username, tenant, and password.
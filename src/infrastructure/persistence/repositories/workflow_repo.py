@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.persistence.models.workflow import (Workflow,
                                                             WorkflowExecution)
 from src.infrastructure.persistence.repositories.auditable_repo import AuditableRepository
+from src.infrastructure.persistence.repositories.base import BaseRepository
 from src.shared.enums import AuditAction
 from src.shared.utils import utc_now
 
@@ -36,25 +37,27 @@ class WorkflowRepository(AuditableRepository[Workflow]):
     def _get_tenant_id(self, obj: Workflow) -> str:
         return obj.tenant_id
 
-    def _serialize_for_audit(self, obj: Workflow) -> dict[str, Any]:
-        return {
-            "id": obj.id,
-            "name": obj.name,
-            "description": obj.description,
-            "trigger_event_type": obj.trigger_event_type,
-            "is_active": obj.is_active,
-            "execution_order": obj.execution_order,
-        }
+    _audit_columns = (
+        "id",
+        "name",
+        "description",
+        "trigger_event_type",
+        "is_active",
+        "execution_order",
+    )
 
     async def get_by_id(self, workflow_id: str, tenant_id: str) -> Workflow | None:
-        """Get workflow by ID and tenant"""
-        stmt = select(Workflow).where(
-            Workflow.id == workflow_id,
-            Workflow.tenant_id == tenant_id,
-            Workflow.deleted_at.is_(None),
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        """Get workflow by ID and tenant (identity map first, see BaseRepository.get_by_id)"""
+        # Not get_by_id_and_tenant: it dispatches through self.get_by_id,
+        # which is this two-argument override.
+        workflow = await BaseRepository.get_by_id(self, workflow_id)
+        if (
+            workflow is None
+            or workflow.tenant_id != tenant_id
+            or workflow.deleted_at is not None
+        ):
+            return None
+        return workflow
 
     async def get_by_tenant(
         self,
@@ -136,17 +139,12 @@ class WorkflowExecutionRepository:
         """Create execution record"""
         self.db.add(execution)
         await self.db.flush()
-        await self.db.refresh(execution)
         return execution
 
     async def get_by_id(self, execution_id: str, tenant_id: str) -> WorkflowExecution | None:
         """Get execution by ID"""
-        stmt = select(WorkflowExecution).where(
-            WorkflowExecution.id == execution_id,
-            WorkflowExecution.tenant_id == tenant_id,
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        # Identity is (tenant_id, id), matching the partitioned primary key
+        return await self.db.get(WorkflowExecution, (tenant_id, execution_id))
 
     async def get_by_workflow(
         self, workflow_id: str, tenant_id: str, skip: int = 0, limit: int = 100
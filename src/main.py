@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -14,7 +15,11 @@ from src.domain.exceptions import TimelineException
 from src.infrastructure.cache.redis_cache import CacheService
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.persistence.database import engine, get_db
+from src.infrastructure.persistence.repositories.event_schema_repo import (
+    listen_for_schema_invalidations,
+)
 from src.presentation.api.dependencies import (
+    close_storage_service,
     get_cache_service,
     set_cache_service,
 )
@@ -35,6 +40,7 @@ from src.presentation.api.v1.routes import (
 )
 from src.presentation.middleware.correlation import CorrelationIDMiddleware
 from src.presentation.middleware.rate_limit import limiter
+from src.presentation.middleware.request_cache import RequestCacheMiddleware
 from src.presentation.middleware.security import (RequestIDMiddleware,
     RequestSizeLimitMiddleware,
     SecurityHeadersMiddleware,
@@ -99,12 +105,18 @@ async def lifespan(app: FastAPI):
         logger.info("Distributed tracing disabled in configuration")
 
     # Initialize Redis cache
+    schema_listener: asyncio.Task[None] | None = None
     if settings.redis_enabled:
         try:
             cache_service = CacheService()
             await cache_service.connect()
             set_cache_service(cache_service)
             logger.info("Redis cache initialized successfully")
+            if cache_service.is_available():
+                # Evict process-local active schemas when another worker changes them
+                schema_listener = asyncio.create_task(
+                    listen_for_schema_invalidations(cache_service)
+                )
         except Exception as e:
             logger.warning(f"Redis cache initialization failed: {e}. Continuing without cache.")
     else:
@@ -123,6 +135,11 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Error during telemetry shutdown: {e}")
 
     # Shutdown cache
+    if schema_listener is not None:
+        schema_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await schema_listener
+
     if settings.redis_enabled:
         try:
             cache = await get_cache_service()
@@ -131,6 +148,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Error during cache shutdown: {e}")
 
+    # Shutdown storage clients (pooled S3 connections)
+    try:
+        await close_storage_service()
+    except Exception as e:
+        logger.warning(f"Error during storage shutdown: {e}")
+
     await engine.dispose()
     logger.info("Database engine disposed")
 
@@ -200,6 +223,9 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+# Request-scoped tenant cache (added first, so it wraps only the app)
+app.add_middleware(RequestCacheMiddleware)
+
 # Security middleware (order matters - applied in reverse)
 # 1. Timeout middleware (30 second timeout)
 app.add_middleware(TimeoutMiddleware, timeout=30.0)
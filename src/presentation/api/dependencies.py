@@ -238,6 +238,14 @@ async def get_storage_service():
     return _storage_service
 
 
+async def close_storage_service() -> None:
+    """Close the global storage service's shared clients (called on app shutdown)"""
+    global _storage_service
+    if _storage_service is not None and hasattr(_storage_service, "aclose"):
+        await _storage_service.aclose()
+    _storage_service = None
+
+
 async def get_document_service(
     storage=Depends(get_storage_service),
     db: AsyncSession = Depends(get_db),
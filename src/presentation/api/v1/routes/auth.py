@@ -46,7 +46,7 @@ async def login(
     tenant_repo = TenantRepository(db)
     tenant = await tenant_repo.get_by_code(token_request.tenant_code)
 
-    if not tenant or tenant.status != TenantStatus.ACTIVE.value:
+    if not tenant or tenant.status != TenantStatus.ACTIVE:
         # Use generic error to prevent tenant enumeration
         logger.warning("Login attempt for invalid/inactive tenant: %s", token_request.tenant_code)
         raise HTTPException(
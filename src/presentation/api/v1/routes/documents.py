@@ -250,11 +250,11 @@ async def create_document(
             )
 
     # Check for duplicate (same checksum)
-    existing = await repo.get_by_checksum(tenant.id, data.checksum)
-    if existing:
+    existing_id = await repo.get_id_by_checksum(tenant.id, data.checksum)
+    if existing_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Document with same content already exists (ID: {existing.id})",
+            detail=f"Document with same content already exists (ID: {existing_id})",
         )
 
     document = Document(
@@ -77,8 +77,7 @@ async def create_email_account(
     )
 
     db.add(email_account)
-    await db.flush()  # Persist to DB and populate auto-generated fields
-    await db.refresh(email_account)  # Refresh relationships
+    await db.flush()  # Persist to DB; IDs and timestamps are assigned client-side
 
     logger.info(
         f"Created email account: {email_account.email_address} "
@@ -153,7 +152,6 @@ async def update_email_account(
         account.is_active = data.is_active
 
     await db.flush()
-    await db.refresh(account)
 
     return EmailAccountResponse.model_validate(account)
 
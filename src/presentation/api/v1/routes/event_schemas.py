@@ -5,7 +5,6 @@ from fastapi.params import Query
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
 
-from src.infrastructure.persistence.models.event_schema import EventSchema
 from src.infrastructure.persistence.models.tenant import Tenant
 from src.infrastructure.persistence.repositories.event_repo import \
     EventRepository
@@ -51,25 +50,15 @@ async def create_event_schema(
     - Events can only be created with active schemas to maintain data integrity
     """
     try:
-        # Auto-increment version number
-        next_version = await repo.get_next_version(tenant.id, data.event_type)
-
-        # Deactivate the currently active schema (if any)
-        previous_active = await repo.get_active_schema(tenant.id, data.event_type)
-        if previous_active:
-            previous_active.is_active = False
-            await repo.update(previous_active)
-
-        # Create new schema and automatically activate it
-        schema = EventSchema(
-            tenant_id=tenant.id,
-            event_type=data.event_type,
-            schema_definition=data.schema_definition,
-            version=next_version,
+        # Create new schema with an auto-incremented version and activate it;
+        # create_next_version deactivates the previous active version
+        created_schema = await repo.create_next_version(
+            tenant.id,
+            data.event_type,
+            data.schema_definition,
             is_active=True,  # Auto-activate new schema
             created_by=current_user.sub,  # User ID from JWT token
         )
-        created_schema = await repo.create(schema)
         return validate(EventSchemaResponse, created_schema)
     except IntegrityError:
         raise HTTPException(
@@ -85,11 +74,33 @@ async def create_event_schema(
 async def list_event_schemas(
     repo: Annotated[EventSchemaRepository, Depends(get_event_schema_repo)],
     tenant: Annotated[Tenant, Depends(get_current_tenant)],
-    skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
+    skip: Annotated[
+        int,
+        Query(
+            ge=0,
+            description=(
+                "Number of records to skip (deprecated: use after_event_type/after_version)"
+            ),
+            deprecated=True,
+        ),
+    ] = 0,
     limit: Annotated[int, Query(ge=1, le=1000, description="Max records to return")] = 100,
+    after_event_type: Annotated[
+        str | None, Query(description="Event type of the last schema on the previous page")
+    ] = None,
+    after_version: Annotated[
+        int | None, Query(ge=1, description="Version of the last schema on the previous page")
+    ] = None,
 ) -> list[EventSchemaResponse]:
-    """List all event schemas for the tenant"""
-    schemas = await repo.get_all_for_tenant(tenant.id, skip, limit)
+    """List all event schemas for the tenant, by event type then newest version"""
+    if (after_event_type is None) != (after_version is None):
+        raise HTTPException(
+            status_code=400, detail="after_event_type and after_version must be provided together"
+        )
+    cursor = None
+    if after_event_type is not None and after_version is not None:
+        cursor = (after_event_type, after_version)
+    schemas = await repo.get_all_for_tenant_core(tenant.id, skip, limit, cursor=cursor)
     return [validate(EventSchemaResponse, schema) for schema in schemas]
 
 
@@ -172,8 +183,18 @@ async def update_event_schema(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schema not found")
 
     if data.is_active is not None:
-        schema.is_active = data.is_active
-        updated_schema = await repo.update(schema)
+        try:
+            # activate_schema deactivates the event type's other active
+            # version first (uq_event_schema_active allows one)
+            if data.is_active:
+                updated_schema = await repo.activate_schema(schema.id)
+            else:
+                updated_schema = await repo.deactivate_schema(schema.id)
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Another version of '{schema.event_type}' was activated concurrently",
+            ) from None
         return validate(EventSchemaResponse, updated_schema)
 
     return validate(EventSchemaResponse, schema)
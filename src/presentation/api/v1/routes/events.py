@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -20,6 +21,21 @@ from src.presentation.api.v1.schemas.verification import (
 
 router = APIRouter()
 
+SKIP_DEPRECATION = "Number of records to skip (deprecated: use before_time/before_id)"
+
+
+def _cursor(
+    before_time: datetime | None, before_id: str | None
+) -> tuple[datetime, str] | None:
+    """Build a keyset cursor from query params; both or neither must be given."""
+    if before_time is None and before_id is None:
+        return None
+    if before_time is None or before_id is None:
+        raise HTTPException(
+            status_code=400, detail="before_time and before_id must be provided together"
+        )
+    return before_time, before_id
+
 
 def _to_verification_response(
     result: "ChainVerificationResult",
@@ -65,11 +81,18 @@ async def get_subject_timeline(
     subject_id: str,
     repo: Annotated[EventRepository, Depends(get_event_repo)],
     tenant: Annotated[Tenant, Depends(get_current_tenant)],
-    skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
+    skip: Annotated[int, Query(ge=0, description=SKIP_DEPRECATION, deprecated=True)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000, description="Max records to return")] = 100,
+    before_time: Annotated[
+        datetime | None, Query(description="Time of the last event on the previous page")
+    ] = None,
+    before_id: Annotated[
+        str | None, Query(description="ID of the last event on the previous page")
+    ] = None,
 ):
     """Get all events for a subject (timeline)"""
-    events = await repo.get_by_subject(subject_id, tenant.id, skip, limit)
+    cursor = _cursor(before_time, before_id)
+    events = await repo.get_by_subject(subject_id, tenant.id, skip, limit, cursor=cursor)
     return events
 
 
@@ -90,8 +113,14 @@ async def get_event(
 async def list_events(
     repo: Annotated[EventRepository, Depends(get_event_repo)],
     tenant: Annotated[Tenant, Depends(get_current_tenant)],
-    skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
+    skip: Annotated[int, Query(ge=0, description=SKIP_DEPRECATION, deprecated=True)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000, description="Max records to return")] = 100,
+    before_time: Annotated[
+        datetime | None, Query(description="Time of the last event on the previous page")
+    ] = None,
+    before_id: Annotated[
+        str | None, Query(description="ID of the last event on the previous page")
+    ] = None,
     event_type: Annotated[
         str | None,
         Query(
@@ -100,11 +129,17 @@ async def list_events(
         ),
     ] = None,
 ):
-    """List all events for the tenant, optionally filtered by event_type"""
+    """
+    List all events for the tenant, optionally filtered by event_type.
+
+    before_time is the event_time of the last event when filtering by type,
+    otherwise its created_at.
+    """
+    cursor = _cursor(before_time, before_id)
     if event_type:
-        return await repo.get_by_type(tenant.id, event_type, skip, limit)
+        return await repo.get_by_type(tenant.id, event_type, skip, limit, cursor=cursor)
 
-    return await repo.get_by_tenant(tenant.id, skip, limit)
+    return await repo.get_by_tenant(tenant.id, skip, limit, cursor=cursor)
 
 
 @router.get(
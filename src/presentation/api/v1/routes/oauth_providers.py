@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import secrets
+from datetime import datetime
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.external.email.envelope_encryption import (
@@ -127,7 +129,6 @@ async def create_provider_config(
     )
 
     await db.commit()
-    await db.refresh(config)
 
     logger.info(
         f"Created OAuth provider config: {config.provider_type} "
@@ -140,18 +141,38 @@ async def create_provider_config(
 @router.get("", response_model=OAuthProviderListResponse)
 async def list_provider_configs(
     include_inactive: bool = Query(False, description="Include inactive configs"),
-    skip: int = Query(0, ge=0),
+    skip: int = Query(
+        0,
+        ge=0,
+        description="Deprecated: use after_provider_type/after_version",
+        deprecated=True,
+    ),
     limit: int = Query(100, ge=1, le=1000),
+    after_provider_type: str | None = Query(
+        None, description="Provider type of the last config on the previous page"
+    ),
+    after_version: int | None = Query(
+        None, ge=1, description="Version of the last config on the previous page"
+    ),
     current_user: TokenPayload = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all OAuth provider configurations for tenant"""
+    if (after_provider_type is None) != (after_version is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_provider_type and after_version must be provided together",
+        )
+    cursor = None
+    if after_provider_type is not None and after_version is not None:
+        cursor = (after_provider_type, after_version)
     repo = OAuthProviderConfigRepository(db)
-    configs = await repo.list_configs(
+    configs = await repo.list_configs_core(
         tenant_id=current_user.tenant_id,
         include_inactive=include_inactive,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
 
     return OAuthProviderListResponse(
@@ -221,7 +242,20 @@ async def update_provider_config(
             "old": str(config.is_active),
             "new": str(data.is_active),
         }
-        config.is_active = data.is_active
+        if data.is_active:
+            # Deactivates the provider's other active version first
+            # (uq_oauth_provider_config_active allows one)
+            provider_type = config.provider_type
+            try:
+                await repo.activate_config(config.id)
+            except IntegrityError:
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Another {provider_type} provider config was activated concurrently",
+                ) from None
+        else:
+            config.is_active = False
 
     if data.rate_limit_connections_per_hour is not None:
         changes["rate_limit"] = {
@@ -248,7 +282,6 @@ async def update_provider_config(
         )
 
     await db.commit()
-    await db.refresh(config)
 
     logger.info(f"Updated OAuth provider config: {config.id}")
 
@@ -625,7 +658,6 @@ async def oauth_callback(
         logger.info(f"Created new email account: {user_info.email}")
 
     await db.commit()
-    await db.refresh(email_account)
 
     # Redirect to frontend with success params
     if return_url:
@@ -766,12 +798,26 @@ async def check_provider_health(
 @router.get("/{config_id}/audit", response_model=list[OAuthAuditLogResponse])
 async def get_audit_history(
     config_id: str,
-    skip: int = Query(0, ge=0),
+    skip: int = Query(
+        0, ge=0, description="Deprecated: use before_timestamp/before_id", deprecated=True
+    ),
     limit: int = Query(100, ge=1, le=1000),
+    before_timestamp: datetime | None = Query(
+        None, description="Timestamp of the last entry on the previous page"
+    ),
+    before_id: str | None = Query(None, description="ID of the last entry on the previous page"),
     current_user: TokenPayload = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get audit history for provider configuration"""
+    """Get audit history for provider configuration, newest first"""
+    if (before_timestamp is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before_timestamp and before_id must be provided together",
+        )
+    cursor = None
+    if before_timestamp is not None and before_id is not None:
+        cursor = (before_timestamp, before_id)
     repo = OAuthProviderConfigRepository(db)
     audit_repo = OAuthAuditLogRepository(db)
 
@@ -784,11 +830,12 @@ async def get_audit_history(
         )
 
     # Get audit logs
-    logs = await audit_repo.get_config_history(
+    logs = await audit_repo.get_config_history_core(
         tenant_id=current_user.tenant_id,
         provider_config_id=config_id,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
 
     return [OAuthAuditLogResponse.model_validate(log) for log in logs]
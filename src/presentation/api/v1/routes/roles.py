@@ -56,17 +56,10 @@ async def create_role(
 
         # Assign permissions if provided
         if data.permission_codes:
-            invalid_codes = []
-            for perm_code in data.permission_codes:
-                permission = await perm_repo.get_by_code_and_tenant(perm_code, current_tenant.id)
-                if permission:
-                    await perm_repo.assign_permission_to_role(
-                        role_id=created_role.id,
-                        permission_id=permission.id,
-                        tenant_id=current_tenant.id,
-                    )
-                else:
-                    invalid_codes.append(perm_code)
+            permission_ids = await perm_repo.get_ids_by_codes(
+                data.permission_codes, current_tenant.id
+            )
+            invalid_codes = [code for code in data.permission_codes if code not in permission_ids]
 
             # Fail if any permission codes were invalid
             if invalid_codes:
@@ -75,6 +68,12 @@ async def create_role(
                     detail=f"Invalid permission codes: {', '.join(invalid_codes)}",
                 )
 
+            await perm_repo.assign_permissions_to_role(
+                role_id=created_role.id,
+                permission_ids=list(permission_ids.values()),
+                tenant_id=current_tenant.id,
+            )
+
         return RoleResponse.model_validate(created_role)
 
     except IntegrityError:
@@ -207,24 +206,21 @@ async def assign_permissions_to_role(
     if not role or role.tenant_id != current_tenant.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found")
 
-    # Assign each permission
+    # Validate all permission IDs in one query
+    existing_ids = await perm_repo.get_existing_ids(data.permission_ids, current_tenant.id)
     for permission_id in data.permission_ids:
-        permission = await perm_repo.get_by_id(permission_id)
-        if not permission or permission.tenant_id != current_tenant.id:
+        if permission_id not in existing_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Permission {permission_id} not found",
             )
 
-        try:
-            await perm_repo.assign_permission_to_role(
-                role_id=role_id,
-                permission_id=permission_id,
-                tenant_id=current_tenant.id,
-            )
-        except IntegrityError:
-            # Permission already assigned, skip
-            pass
+    # Single INSERT; permissions already assigned are skipped
+    await perm_repo.assign_permissions_to_role(
+        role_id=role_id,
+        permission_ids=data.permission_ids,
+        tenant_id=current_tenant.id,
+    )
 
     return {"message": "Permissions assigned successfully"}
 
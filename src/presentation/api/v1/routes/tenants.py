@@ -81,7 +81,7 @@ async def update_tenant(
     repo: Annotated[TenantRepository, Depends(get_tenant_repo_transactional)],
 ):
     """Update a tenant"""
-    tenant = await repo.get_by_id(tenant_id)
+    tenant = await repo.get_by_id_for_update(tenant_id)
 
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
@@ -90,7 +90,7 @@ async def update_tenant(
         tenant.name = data.name
 
     if data.status is not None:
-        tenant.status = data.status.value
+        tenant.status = data.status
 
     updated = await repo.update(tenant)
     return updated
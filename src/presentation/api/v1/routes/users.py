@@ -39,7 +39,7 @@ async def register_user(
     if not tenant:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid tenant code")
 
-    if tenant.status != TenantStatus.ACTIVE.value:
+    if tenant.status != TenantStatus.ACTIVE:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Tenant is not active")
 
     try:
@@ -14,7 +14,7 @@ class WorkflowCreate(BaseModel):
     trigger_event_type: str = Field(..., pattern=r"^[a-z0-9_]+$")
     trigger_conditions: dict[str, Any] | None = None
     actions: list[dict[str, Any]] = Field(min_length=1)
-    execution_order: int = Field(default=0, ge=0)
+    execution_order: int = Field(default=0, ge=0, le=32767)
     max_executions_per_day: int | None = Field(default=None, gt=0)
     is_active: bool = True
 
@@ -26,7 +26,7 @@ class WorkflowUpdate(BaseModel):
     description: str | None = None
     trigger_conditions: dict[str, Any] | None = None
     actions: list[dict[str, Any]] | None = Field(default=None, min_length=1)
-    execution_order: int | None = Field(default=None, ge=0)
+    execution_order: int | None = Field(default=None, ge=0, le=32767)
     max_executions_per_day: int | None = Field(default=None, gt=0)
     is_active: bool | None = None
 
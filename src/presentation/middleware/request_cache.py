@@ -0,0 +1,30 @@
+"""Request-scoped cache middleware"""
+
+from collections.abc import Callable
+
+from fastapi import Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from src.infrastructure.persistence.repositories.tenant_repo import (
+    begin_request_tenant_cache,
+    end_request_tenant_cache,
+)
+
+
+class RequestCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Give each request its own in-process tenant cache.
+
+    Auth, tenant resolution and permission checks look up the same tenant
+    several times per request; after the first lookup, TenantRepository
+    serves the rest from this cache instead of Redis. The cache is dropped
+    when the request finishes.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        token = begin_request_tenant_cache()
+        try:
+            return await call_next(request)
+        finally:
+            end_request_tenant_cache(token)
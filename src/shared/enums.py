@@ -73,6 +73,8 @@ class AuditAction(str, Enum):
     ACTIVATED = "activated"
     DEACTIVATED = "deactivated"
     ARCHIVED = "archived"
+    ASSIGNED = "assigned"
+    UNASSIGNED = "unassigned"
 
     @classmethod
     def values(cls) -> list[str]:
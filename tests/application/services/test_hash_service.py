@@ -140,3 +140,38 @@ class TestHashService:
 
         # THEN
         assert hash_v1 != hash_v2
+
+    def test_compute_hashes_chain_matches_sequential_hashes(self, hash_service: HashService):
+        """
+        GIVEN a batch of events, including a non-ASCII nested payload
+        WHEN the chain is hashed with compute_hashes_chain
+        THEN each digest must equal compute_hash fed with the previous digest.
+        """
+        # GIVEN
+        records = [
+            ("subject-456", "TEST_EVENT", 1, FROZEN_DATETIME, {"b": 2, "a": {"z": 1, "y": 2}}),
+            ("subject-456", "EMAIL_RECEIVED", 2, FROZEN_DATETIME, {"subject": "Café ✓"}),
+            ("subject-456", "TEST_EVENT", 1, FROZEN_DATETIME, {}),
+        ]
+        previous_hash = "a" * 64
+
+        # WHEN
+        chained = hash_service.compute_hashes_chain(previous_hash, records)
+
+        # THEN
+        expected = []
+        prev = previous_hash
+        for subject_id, event_type, schema_version, event_time, payload in records:
+            prev = hash_service.compute_hash(
+                subject_id=subject_id,
+                event_type=event_type,
+                schema_version=schema_version,
+                event_time=event_time,
+                payload=payload,
+                previous_hash=prev,
+            )
+            expected.append(prev)
+        assert chained == expected
+        assert hash_service.compute_hashes_chain(None, records[:1])[0] == (
+            hash_service.compute_hash(*records[0], previous_hash=None)
+        )
@@ -0,0 +1,42 @@
+"""Unit tests for SystemAuditService"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from src.application.services.system_audit_service import SystemAuditService
+from src.domain.enums import TenantStatus
+from src.infrastructure.persistence.models.tenant import Tenant
+from src.infrastructure.persistence.repositories.tenant_repo import \
+    TenantRepository
+from src.shared.enums import ActorType, AuditAction
+
+
+def test_sanitize_entity_data_stores_enum_values():
+    """Enum members are stored by value, not by their str() form"""
+    sanitized = SystemAuditService._sanitize_entity_data({"status": TenantStatus.ACTIVE})
+
+    assert sanitized == {"status": "active"}
+
+
+def test_tenant_audit_payload_stores_status_value():
+    """Tenant audit payloads keep the plain status string in the audit trail"""
+    repo = TenantRepository(MagicMock(), enable_audit=False)
+    tenant = Tenant(id="tenant-1", code="ACME", name="Acme", status=TenantStatus.SUSPENDED)
+
+    payload = SystemAuditService(MagicMock())._build_audit_payload(
+        entity_type="tenant",
+        entity_id=tenant.id,
+        action=AuditAction.UPDATED,
+        actor_id=None,
+        actor_type=ActorType.SYSTEM,
+        entity_data=repo._serialize_for_audit(tenant),
+        metadata=None,
+        timestamp=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+    assert payload["entity_data"] == {
+        "id": "tenant-1",
+        "code": "ACME",
+        "name": "Acme",
+        "status": "suspended",
+    }
@@ -1,7 +1,7 @@
 """Unit tests for VerificationService"""
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -22,6 +22,16 @@ def mock_event_repo():
     return AsyncMock()
 
 
+def stream_events(mock_event_repo, events):
+    """Make mock_event_repo.iter_by_tenant yield the given events"""
+
+    async def _iter(*args, **kwargs):
+        for event in events:
+            yield event
+
+    mock_event_repo.iter_by_tenant = MagicMock(side_effect=_iter)
+
+
 @pytest.fixture
 def verification_service(mock_event_repo, hash_service):
     """VerificationService instance"""
@@ -302,7 +312,7 @@ class TestVerifyTenantChains:
             hash_service=hash_service,
         )
 
-        mock_event_repo.get_by_tenant.return_value = [event_a1, event_a2, event_b1]
+        stream_events(mock_event_repo, [event_a1, event_a2, event_b1])
 
         # WHEN
         result = await verification_service.verify_tenant_chains(tenant_id="tenant_123", limit=100)
@@ -345,7 +355,7 @@ class TestVerifyTenantChains:
         )
         event_b1.payload = {"amount": 999}  # Tampered!
 
-        mock_event_repo.get_by_tenant.return_value = [event_a1, event_b1]
+        stream_events(mock_event_repo, [event_a1, event_b1])
 
         # WHEN
         result = await verification_service.verify_tenant_chains(tenant_id="tenant_123", limit=100)
@@ -1,6 +1,6 @@
 """Tests for Redis cache service"""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import redis.asyncio as redis
@@ -89,7 +89,7 @@ async def test_cache_delete_pattern(cache_service):
     """Test delete pattern (wildcard deletion)"""
 
     # Mock scan_iter to return matching keys
-    async def mock_scan_iter(match=None):
+    async def mock_scan_iter(match=None, count=None):
         keys = [
             "permissions:tenant-1:user-1",
             "permissions:tenant-1:user-2",
@@ -104,7 +104,22 @@ async def test_cache_delete_pattern(cache_service):
     deleted_count = await cache_service.delete_pattern("permissions:tenant-1:*")
 
     assert deleted_count == 3
-    assert cache_service.redis.delete.call_count == 3
+    cache_service.redis.delete.assert_called_once_with(
+        "permissions:tenant-1:user-1",
+        "permissions:tenant-1:user-2",
+        "permissions:tenant-1:user-3",
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_delete_many_single_command(cache_service):
+    """Test delete_many removes all keys with one DEL"""
+    cache_service.redis.delete = AsyncMock(return_value=2)
+
+    deleted = await cache_service.delete_many(["tenant:id:t1", "tenant:code:acme"])
+
+    assert deleted == 2
+    cache_service.redis.delete.assert_called_once_with("tenant:id:t1", "tenant:code:acme")
 
 
 @pytest.mark.asyncio
@@ -118,6 +133,55 @@ async def test_cache_clear_all(cache_service):
     cache_service.redis.flushdb.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_cache_mget_mixed_hits(cache_service):
+    """Test mget returns values in key order with None for misses"""
+    cache_service.redis.mget = AsyncMock(return_value=['{"v": 1}', None, '{"v": 3}'])
+
+    result = await cache_service.mget(["a", "b", "c"])
+
+    assert result == [{"v": 1}, None, {"v": 3}]
+    cache_service.redis.mget.assert_called_once_with(["a", "b", "c"])
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many_pipelines_setex(cache_service):
+    """Test set_many issues one pipelined SETEX per key"""
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock()
+    cache_service.redis.pipeline = MagicMock(return_value=pipe)
+
+    result = await cache_service.set_many({"a": {"v": 1}, "b": {"v": 2}}, ttl=60)
+
+    assert result is True
+    assert [c.args[:2] for c in pipe.setex.call_args_list] == [("a", 60), ("b", 60)]
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_listen_dispatches_messages(cache_service):
+    """Test listen passes channel messages to the handler after subscribing"""
+
+    async def mock_listen():
+        yield {"type": "subscribe", "data": 1}
+        yield {"type": "message", "data": "schema:active:v2:t1:email"}
+
+    pubsub = MagicMock()
+    pubsub.__aenter__.return_value = pubsub
+    pubsub.subscribe = AsyncMock()
+    pubsub.listen = mock_listen
+    cache_service.redis.pubsub = MagicMock(return_value=pubsub)
+    received: list[str] = []
+    on_subscribed = MagicMock()
+
+    await cache_service.listen("schema:invalidate", received.append, on_subscribed)
+
+    pubsub.subscribe.assert_awaited_once_with("schema:invalidate")
+    on_subscribed.assert_called_once()
+    assert received == ["schema:active:v2:t1:email"]
+
+
 @pytest.mark.asyncio
 async def test_cache_unavailable_returns_none(disconnected_cache):
     """Test that unavailable cache returns None for get"""
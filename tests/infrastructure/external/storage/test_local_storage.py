@@ -1,7 +1,11 @@
 """Unit tests for LocalStorageService"""
 
+import hashlib
 import io
+from datetime import timedelta
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -9,6 +13,7 @@ from src.infrastructure.exceptions import (StorageAlreadyExistsError,
                                            StorageChecksumMismatchError,
                                            StorageNotFoundError,
                                            StoragePermissionError)
+from src.infrastructure.external.storage.factory import StorageFactory
 from src.infrastructure.external.storage.local_storage import \
     LocalStorageService
 
@@ -41,7 +46,7 @@ def sample_checksum():
 
     Computed from: b"Hello, World! This is test content."
     """
-    return "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+    return "86c08faf3a17b36d3922b3b012d0b9188724aef3356336e0fc518c1f04bac2af"
 
 
 class TestLocalStorageUpload:
@@ -161,6 +166,40 @@ class TestLocalStorageUpload:
                 content_type="text/plain",
             )
 
+    @pytest.mark.asyncio
+    async def test_upload_idempotent_uses_sidecar_checksum(self, storage_service):
+        """
+        GIVEN a file already uploaded with an up-to-date metadata sidecar
+        WHEN uploading again with same checksum
+        THEN should answer from the sidecar without re-hashing the file
+        """
+        # GIVEN
+        content = b"sidecar fast path"
+        checksum = hashlib.sha256(content).hexdigest()
+        storage_ref = "tenants/acme/documents/doc_fp/v1/test.txt"
+        await storage_service.upload(
+            file_data=io.BytesIO(content),
+            storage_ref=storage_ref,
+            expected_checksum=checksum,
+            content_type="text/plain",
+        )
+
+        # WHEN
+        with patch.object(
+            storage_service, "_compute_checksum", new=AsyncMock()
+        ) as mock_checksum:
+            result = await storage_service.upload(
+                file_data=io.BytesIO(content),
+                storage_ref=storage_ref,
+                expected_checksum=checksum,
+                content_type="text/plain",
+            )
+
+        # THEN
+        mock_checksum.assert_not_called()
+        assert result["checksum"] == checksum
+        assert result["size"] == len(content)
+
 
 class TestLocalStoragePathSecurity:
     """Tests for path traversal protection."""
@@ -189,7 +228,7 @@ class TestLocalStoragePathSecurity:
                     expected_checksum="dummy",
                     content_type="text/plain",
                 )
-            assert "Path traversal detected" in str(exc_info.value)
+            assert "path_validation" in str(exc_info.value)
             sample_file_data.seek(0)  # Reset for next iteration
 
     def test_get_full_path_security(self, storage_service):
@@ -215,6 +254,32 @@ class TestLocalStoragePathSecurity:
             with pytest.raises(StoragePermissionError):
                 storage_service._get_full_path(ref)
 
+    @pytest.mark.asyncio
+    async def test_upload_rejects_symlink_escape(
+        self, storage_service, sample_file_data, tmp_path
+    ):
+        """
+        GIVEN a symlink inside the storage root that points outside it
+        WHEN uploading through it
+        THEN should raise StoragePermissionError
+        """
+        # GIVEN
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (storage_service.storage_root / "tenants").symlink_to(outside)
+        storage_ref = "tenants/acme/file.txt"
+
+        # WHEN/THEN - The lexical check alone does not see the link
+        storage_service._get_full_path(storage_ref)
+        with pytest.raises(StoragePermissionError):
+            await storage_service.upload(
+                file_data=sample_file_data,
+                storage_ref=storage_ref,
+                expected_checksum="dummy",
+                content_type="text/plain",
+            )
+        assert not any(outside.iterdir())
+
 
 class TestLocalStorageDownload:
     """Tests for LocalStorageService download functionality."""
@@ -263,6 +328,32 @@ class TestLocalStorageDownload:
 
         assert "File not found" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_sendfile_to_copies_content(self, storage_service, tmp_path):
+        """
+        GIVEN an uploaded file
+        WHEN sending it to a file descriptor
+        THEN the descriptor should receive the full content
+        """
+        # GIVEN
+        content = b"zero-copy content" * 1000
+        storage_ref = "tenants/acme/documents/doc_sf/v1/test.txt"
+        await storage_service.upload(
+            file_data=io.BytesIO(content),
+            storage_ref=storage_ref,
+            expected_checksum=hashlib.sha256(content).hexdigest(),
+            content_type="text/plain",
+        )
+        out_path = tmp_path / "out.bin"
+
+        # WHEN
+        with open(out_path, "wb") as out:
+            sent = await storage_service.sendfile_to(storage_ref, out.fileno())
+
+        # THEN
+        assert sent == len(content)
+        assert out_path.read_bytes() == content
+
 
 class TestLocalStorageMetadata:
     """Tests for metadata operations."""
@@ -404,22 +495,118 @@ class TestLocalStoragePresignedURLs:
     """Tests for pre-signed URL generation."""
 
     @pytest.mark.asyncio
-    async def test_generate_download_url_not_supported(self, storage_service):
+    async def test_generate_download_url_missing_file(self, storage_service):
         """
         GIVEN local storage backend
-        WHEN trying to generate pre-signed URL
-        THEN should raise StorageNotSupportedError
+        WHEN generating a download URL for a non-existent file
+        THEN should raise StorageNotFoundError
         """
         # GIVEN
         storage_ref = "tenants/acme/documents/doc_123/v1/test.txt"
 
         # WHEN/THEN
-        from src.infrastructure.exceptions import StorageNotSupportedError
-
-        with pytest.raises(StorageNotSupportedError) as exc_info:
+        with pytest.raises(StorageNotFoundError) as exc_info:
             await storage_service.generate_download_url(storage_ref)
 
-        assert "Local storage doesn't support pre-signed URLs" in str(exc_info.value)
+        assert storage_ref in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_download_token_round_trip(self, storage_service):
+        """
+        GIVEN an uploaded file
+        WHEN generating a download URL and validating its token
+        THEN the token should resolve to the storage_ref
+        """
+        # GIVEN
+        content = b"signed token"
+        storage_ref = "tenants/acme/documents/doc_tok/v1/test.txt"
+        await storage_service.upload(
+            file_data=io.BytesIO(content),
+            storage_ref=storage_ref,
+            expected_checksum=hashlib.sha256(content).hexdigest(),
+            content_type="text/plain",
+        )
+
+        # WHEN
+        url = await storage_service.generate_download_url(storage_ref)
+        token = url.rsplit("/", 1)[1]
+
+        # THEN
+        assert storage_service.validate_download_token(token) == storage_ref
+
+    @pytest.mark.asyncio
+    async def test_download_token_rejects_tampered_or_expired(self, storage_service):
+        """
+        GIVEN a signed download token
+        WHEN it is tampered with, signed by another key, or expired
+        THEN validation should return None
+        """
+        # GIVEN
+        content = b"signed token"
+        storage_ref = "tenants/acme/documents/doc_tok/v1/test.txt"
+        await storage_service.upload(
+            file_data=io.BytesIO(content),
+            storage_ref=storage_ref,
+            expected_checksum=hashlib.sha256(content).hexdigest(),
+            content_type="text/plain",
+        )
+        url = await storage_service.generate_download_url(storage_ref)
+        token = url.rsplit("/", 1)[1]
+        expired_url = await storage_service.generate_download_url(
+            storage_ref, expiration=timedelta(seconds=-1)
+        )
+        other_service = LocalStorageService(
+            storage_root=str(storage_service.storage_root), signing_key=b"other"
+        )
+
+        # WHEN/THEN
+        tampered = token[:-2] + ("A" if token[-2] != "A" else "B") + token[-1]
+        assert storage_service.validate_download_token(tampered) is None
+        assert storage_service.validate_download_token("not-a-token") is None
+        assert other_service.validate_download_token(token) is None
+        assert (
+            storage_service.validate_download_token(expired_url.rsplit("/", 1)[1])
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_factory_signing_key_is_separate_from_secret_key(
+        self, temp_storage_root
+    ):
+        """
+        GIVEN a local storage service built by StorageFactory
+        WHEN validating its tokens and tokens signed with the raw secret_key
+        THEN only its own tokens should validate
+        """
+        # GIVEN
+        settings = SimpleNamespace(
+            storage_backend="local",
+            storage_root=temp_storage_root,
+            storage_base_url=None,
+            secret_key="jwt-secret",
+        )
+        service = StorageFactory.create_storage_service(settings)
+        content = b"signed token"
+        storage_ref = "tenants/acme/documents/doc_tok/v1/test.txt"
+        await service.upload(
+            file_data=io.BytesIO(content),
+            storage_ref=storage_ref,
+            expected_checksum=hashlib.sha256(content).hexdigest(),
+            content_type="text/plain",
+        )
+        jwt_keyed_service = LocalStorageService(
+            storage_root=temp_storage_root, signing_key=b"jwt-secret"
+        )
+
+        # WHEN
+        token = (await service.generate_download_url(storage_ref)).rsplit("/", 1)[1]
+        jwt_keyed_token = (
+            await jwt_keyed_service.generate_download_url(storage_ref)
+        ).rsplit("/", 1)[1]
+
+        # THEN
+        assert service.validate_download_token(token) == storage_ref
+        assert service.validate_download_token(jwt_keyed_token) is None
 
 
 class TestLocalStorageAtomicWrites:
@@ -1,5 +1,6 @@
 """Unit tests for S3StorageService"""
 
+import hashlib
 import io
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
@@ -39,7 +40,7 @@ def sample_checksum():
 
     Computed from: b"Hello, World! This is test content."
     """
-    return "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+    return "86c08faf3a17b36d3922b3b012d0b9188724aef3356336e0fc518c1f04bac2af"
 
 
 class TestS3StorageUpload:
@@ -57,16 +58,7 @@ class TestS3StorageUpload:
         content_type = "text/plain"
 
         mock_s3_client = AsyncMock()
-        mock_s3_client.head_object = AsyncMock(
-            side_effect=ClientError({"Error": {"Code": "404"}}, "head_object")
-        )
-        mock_s3_client.put_object = AsyncMock()
-        mock_s3_client.head_object = AsyncMock(
-            side_effect=[
-                ClientError({"Error": {"Code": "404"}}, "head_object"),  # First check
-                {"ContentLength": 35, "LastModified": datetime.now(UTC)()},  # After upload
-            ]
-        )
+        mock_s3_client.put_object = AsyncMock(return_value={"ETag": '"etag"'})
 
         # WHEN
         with patch.object(s3_service.session, "client") as mock_client:
@@ -93,25 +85,30 @@ class TestS3StorageUpload:
         assert call_kwargs["Key"] == storage_ref
         assert call_kwargs["ContentType"] == content_type
         assert call_kwargs["ServerSideEncryption"] == "AES256"
+        assert call_kwargs["IfNoneMatch"] == "*"
+        assert "ChecksumSHA256" in call_kwargs
         assert "sha256" in call_kwargs["Metadata"]
 
+        # Happy path is a single request (no pre-check or verify head)
+        mock_s3_client.head_object.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_upload_checksum_mismatch(self, s3_service, sample_file_data):
         """
         GIVEN a file with incorrect checksum
         WHEN uploading to S3
-        THEN should raise StorageChecksumMismatchError
+        THEN should raise StorageChecksumMismatchError (S3 rejects the digest)
         """
         # GIVEN
         storage_ref = "tenants/acme/documents/doc_456/v1/test.txt"
         wrong_checksum = "0000000000000000000000000000000000000000000000000000000000000000"
 
         mock_s3_client = AsyncMock()
-        mock_s3_client.head_object = AsyncMock(
-            side_effect=ClientError({"Error": {"Code": "404"}}, "head_object")
+        mock_s3_client.put_object = AsyncMock(
+            side_effect=ClientError({"Error": {"Code": "BadDigest"}}, "put_object")
         )
 
-        # WHEN/THEN
+        # WHEN/THEN - S3 validates the checksum server-side
         with patch.object(s3_service.session, "client") as mock_client:
             mock_client.return_value.__aenter__.return_value = mock_s3_client
 
@@ -142,6 +139,9 @@ class TestS3StorageUpload:
         }
 
         mock_s3_client = AsyncMock()
+        mock_s3_client.put_object = AsyncMock(
+            side_effect=ClientError({"Error": {"Code": "PreconditionFailed"}}, "put_object")
+        )
         mock_s3_client.head_object = AsyncMock(return_value=existing_metadata)
 
         # WHEN
@@ -155,10 +155,10 @@ class TestS3StorageUpload:
                 content_type="text/plain",
             )
 
-        # THEN - Should return existing metadata (no upload)
+        # THEN - Should return existing metadata (conditional put rejected)
         assert result["checksum"] == sample_checksum
         assert result["size"] == 35
-        mock_s3_client.put_object.assert_not_called()
+        mock_s3_client.put_object.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_upload_rejects_different_checksum(
@@ -177,6 +177,9 @@ class TestS3StorageUpload:
         }
 
         mock_s3_client = AsyncMock()
+        mock_s3_client.put_object = AsyncMock(
+            side_effect=ClientError({"Error": {"Code": "PreconditionFailed"}}, "put_object")
+        )
         mock_s3_client.head_object = AsyncMock(return_value=existing_metadata)
 
         # WHEN/THEN
@@ -191,6 +194,45 @@ class TestS3StorageUpload:
                     content_type="text/plain",
                 )
 
+    @pytest.mark.asyncio
+    async def test_upload_large_file_streams_multipart(self, s3_service):
+        """
+        GIVEN a file at or above the multipart threshold
+        WHEN uploading to S3
+        THEN should stream it via upload_fileobj instead of a single put
+        """
+        # GIVEN
+        s3_service.MULTIPART_THRESHOLD = 16
+        content = b"x" * 64
+        checksum = hashlib.sha256(content).hexdigest()
+        storage_ref = "tenants/acme/documents/doc_big/v1/big.bin"
+
+        mock_s3_client = AsyncMock()
+        mock_s3_client.head_object = AsyncMock(
+            side_effect=ClientError({"Error": {"Code": "404"}}, "head_object")
+        )
+        mock_s3_client.upload_fileobj = AsyncMock()
+
+        # WHEN
+        with patch.object(s3_service.session, "client") as mock_client:
+            mock_client.return_value.__aenter__.return_value = mock_s3_client
+
+            result = await s3_service.upload(
+                file_data=io.BytesIO(content),
+                storage_ref=storage_ref,
+                expected_checksum=checksum,
+                content_type="application/octet-stream",
+            )
+
+        # THEN
+        assert result["checksum"] == checksum
+        assert result["size"] == len(content)
+        mock_s3_client.put_object.assert_not_called()
+        mock_s3_client.upload_fileobj.assert_called_once()
+        extra_args = mock_s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        assert extra_args["ChecksumAlgorithm"] == "SHA256"
+        assert extra_args["Metadata"]["sha256"] == checksum
+
 
 class TestS3StorageDownload:
     """Tests for S3StorageService download functionality."""
@@ -210,6 +252,8 @@ class TestS3StorageDownload:
         mock_stream.read = AsyncMock(
             side_effect=[sample_file_data.read(), b""]  # Return content then EOF
         )
+        # download() reads inside "async with response['Body']"
+        mock_stream.__aenter__.return_value = mock_stream
 
         mock_response = {"Body": mock_stream}
 
@@ -252,7 +296,7 @@ class TestS3StorageDownload:
                 async for _ in s3_service.download(storage_ref):
                     pass
 
-            assert "Object not found" in str(exc_info.value)
+            assert "File not found" in str(exc_info.value)
 
 
 class TestS3StorageMetadata:
@@ -330,6 +374,29 @@ class TestS3StorageMetadata:
 
             assert await s3_service.exists(storage_ref) is False
 
+    @pytest.mark.asyncio
+    async def test_client_reused_across_operations(self, s3_service):
+        """
+        GIVEN an S3 service
+        WHEN performing several operations and then closing it
+        THEN a single client should be created, reused and closed once
+        """
+        # GIVEN
+        mock_s3_client = AsyncMock()
+        mock_s3_client.head_object = AsyncMock(return_value={})
+
+        # WHEN
+        with patch.object(s3_service.session, "client") as mock_client:
+            mock_client.return_value.__aenter__.return_value = mock_s3_client
+
+            assert await s3_service.exists("tenants/acme/a.txt") is True
+            assert await s3_service.exists("tenants/acme/b.txt") is True
+            await s3_service.aclose()
+
+        # THEN
+        mock_client.assert_called_once()
+        mock_client.return_value.__aexit__.assert_awaited_once()
+
 
 class TestS3StorageDelete:
     """Tests for delete functionality."""
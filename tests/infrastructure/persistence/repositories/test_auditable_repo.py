@@ -0,0 +1,69 @@
+"""Unit tests for AuditableRepository audit payload serialization"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.persistence.models.workflow import Workflow
+from src.infrastructure.persistence.repositories.auditable_repo import \
+    AuditableRepository
+
+
+class _SingleColumnRepository(AuditableRepository[Workflow]):
+    _audit_columns = ("name",)
+
+    def _get_entity_type(self) -> str:
+        return "single"
+
+    def _get_tenant_id(self, obj: Workflow) -> str:
+        return obj.tenant_id
+
+
+class _MultiColumnRepository(_SingleColumnRepository):
+    _audit_columns = ("id", "name")
+
+
+def test_single_column_payload():
+    """A one-column repository serializes without binding the getter to self"""
+    repo = _SingleColumnRepository(MagicMock(), Workflow, enable_audit=False)
+
+    assert repo._serialize_for_audit(SimpleNamespace(name="Escalate")) == {"name": "Escalate"}
+
+
+def test_multi_column_payload():
+    """A multi-column repository serializes every declared column"""
+    repo = _MultiColumnRepository(MagicMock(), Workflow, enable_audit=False)
+    obj = SimpleNamespace(id="wf-1", name="Escalate")
+
+    assert repo._serialize_for_audit(obj) == {"id": "wf-1", "name": "Escalate"}
+
+
+def test_zero_columns_without_override_is_rejected():
+    """A repository with no columns must override _serialize_for_audit"""
+    with pytest.raises(TypeError, match="_audit_columns"):
+
+        class _NoColumnRepository(AuditableRepository[Workflow]):
+            def _get_entity_type(self) -> str:
+                return "none"
+
+            def _get_tenant_id(self, obj: Workflow) -> str:
+                return obj.tenant_id
+
+
+def test_zero_columns_with_override_is_allowed():
+    """A custom _serialize_for_audit replaces the column declaration"""
+
+    class _CustomRepository(AuditableRepository[Workflow]):
+        def _get_entity_type(self) -> str:
+            return "custom"
+
+        def _get_tenant_id(self, obj: Workflow) -> str:
+            return obj.tenant_id
+
+        def _serialize_for_audit(self, obj: Workflow) -> dict:
+            return {"custom": True}
+
+    repo = _CustomRepository(MagicMock(), Workflow, enable_audit=False)
+
+    assert repo._serialize_for_audit(SimpleNamespace()) == {"custom": True}
@@ -0,0 +1,45 @@
+"""Unit tests for BaseRepository bulk creation"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.domain.enums import TenantStatus
+from src.infrastructure.persistence.models.tenant import Tenant
+from src.infrastructure.persistence.repositories.base import (
+    BULK_COPY_THRESHOLD, BaseRepository)
+
+
+class _TenantRepository(BaseRepository[Tenant]):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_copies_enum_columns_as_labels():
+    """Large batches are COPY'd with enum members converted to their labels"""
+    copied: dict = {}
+
+    async def copy_records_to_table(table, *, columns, records):
+        copied.update(table=table, columns=columns, records=list(records))
+
+    raw_connection = MagicMock()
+    raw_connection.driver_connection.copy_records_to_table = copy_records_to_table
+    connection = MagicMock(dialect=PGDialect_asyncpg())
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    db = MagicMock()
+    db.connection = AsyncMock(return_value=connection)
+
+    tenants = [
+        Tenant(code=f"T{i}", name=f"Tenant {i}", status=TenantStatus.SUSPENDED)
+        for i in range(BULK_COPY_THRESHOLD)
+    ]
+    await _TenantRepository(db, Tenant).bulk_create(tenants)
+
+    status_index = copied["columns"].index("status")
+    assert copied["table"] == "tenant"
+    statuses = [record[status_index] for record in copied["records"]]
+    # Exact str, not the (str-subclassing) enum member
+    assert {type(status) for status in statuses} == {str}
+    assert set(statuses) == {"suspended"}
+    db.add_all.assert_not_called()
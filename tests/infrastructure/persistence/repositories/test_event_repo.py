@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy.exc import DBAPIError
 
 from src.infrastructure.persistence.models.event import Event
 from src.infrastructure.persistence.models.subject import Subject
@@ -229,6 +230,29 @@ async def test_get_last_hash_returns_previous_hash(event_repo, test_db, test_sub
     assert last_hash == "hash2"
 
 
+@pytest.mark.asyncio
+async def test_get_chain_tip_returns_hash_and_time(event_repo, test_db, test_subject, test_tenant):
+    """Test get_chain_tip returns (hash, event_time) of the most recent event"""
+    event_time = datetime.now(timezone.utc)
+    test_db.add(
+        Event(
+            tenant_id=test_tenant.id,
+            subject_id=test_subject.id,
+            event_type="test",
+            schema_version=1,
+            event_time=event_time,
+            payload={},
+            hash="tip_hash",
+        )
+    )
+    await test_db.commit()
+
+    assert await event_repo.get_chain_tip(test_subject.id, test_tenant.id) == (
+        "tip_hash",
+        event_time,
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_last_hash_none_for_empty_subject(event_repo, test_subject, test_tenant):
     """Test get_last_hash returns None for subject with no events"""
@@ -263,9 +287,36 @@ async def test_get_by_id_and_tenant(event_repo, test_db, test_subject, test_tena
     assert not_found is None
 
 
+@pytest.mark.asyncio
+async def test_create_events_bulk_persists_chain(event_repo, test_db, test_subject, test_tenant):
+    """Test create_events_bulk inserts all events with IDs and created_at populated"""
+    now = datetime.now(timezone.utc)
+    events = [
+        Event(
+            tenant_id=test_tenant.id,
+            subject_id=test_subject.id,
+            event_type="test",
+            schema_version=1,
+            event_time=now - timedelta(minutes=3 - i),
+            payload={"step": i, "name": "Café"},
+            hash=f"bulk-hash{i}",
+            previous_hash=f"bulk-hash{i - 1}" if i else None,
+        )
+        for i in range(3)
+    ]
+
+    created = await event_repo.create_events_bulk(events)
+    await test_db.commit()
+
+    assert all(e.id and e.created_at for e in created)
+    stored = await event_repo.get_by_subject(test_subject.id, test_tenant.id)
+    assert [e.hash for e in stored] == ["bulk-hash2", "bulk-hash1", "bulk-hash0"]
+    assert stored[0].payload == {"step": 2, "name": "Café"}
+
+
 @pytest.mark.asyncio
 async def test_event_immutability_enforcement(test_db, test_subject, test_tenant):
-    """Test that events cannot be updated after creation"""
+    """Test that the database trigger rejects updates to events"""
     # Create event
     event = Event(
         tenant_id=test_tenant.id,
@@ -279,8 +330,8 @@ async def test_event_immutability_enforcement(test_db, test_subject, test_tenant
     test_db.add(event)
     await test_db.commit()
 
-    # Try to update event (should raise ValueError from ORM listener)
+    # Try to update event (should be rejected by the event_no_update trigger)
     event.payload = {"modified": "value"}
 
-    with pytest.raises(ValueError, match="Events are immutable"):
+    with pytest.raises(DBAPIError, match="Events are immutable"):
         await test_db.flush()
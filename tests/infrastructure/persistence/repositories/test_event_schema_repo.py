@@ -0,0 +1,47 @@
+"""Test event schema repository"""
+
+import pytest
+
+from src.infrastructure.persistence.repositories.event_schema_repo import \
+    EventSchemaRepository
+
+SCHEMA_DEFINITION = {"type": "object", "properties": {"step": {"type": "integer"}}}
+
+
+@pytest.fixture
+async def schema_repo(test_db):
+    """Event schema repository fixture"""
+    return EventSchemaRepository(test_db)
+
+
+@pytest.mark.asyncio
+async def test_create_next_version_supersedes_active_version(schema_repo, test_db, test_tenant):
+    """Test that a new active version deactivates the previous one"""
+    v1 = await schema_repo.create_next_version(test_tenant.id, "test", SCHEMA_DEFINITION)
+    v2 = await schema_repo.create_next_version(test_tenant.id, "test", SCHEMA_DEFINITION)
+    await test_db.commit()
+
+    assert (v1.version, v2.version) == (1, 2)
+    await test_db.refresh(v1)
+    assert v1.is_active is False
+    assert v2.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_activate_schema_reactivates_superseded_version(schema_repo, test_db, test_tenant):
+    """Test that re-activating an older version deactivates the current one"""
+    v1 = await schema_repo.create_next_version(test_tenant.id, "test", SCHEMA_DEFINITION)
+    v2 = await schema_repo.create_next_version(test_tenant.id, "test", SCHEMA_DEFINITION)
+    await test_db.commit()
+
+    activated = await schema_repo.activate_schema(v1.id)
+    await test_db.commit()
+
+    assert activated is not None
+    assert activated.is_active is True
+    await test_db.refresh(v2)
+    assert v2.is_active is False
+
+    active = await schema_repo.get_active_schema(test_tenant.id, "test")
+    assert active is not None
+    assert active.id == v1.id
@@ -0,0 +1,85 @@
+"""Test OAuth provider config repository"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from src.infrastructure.persistence.models.oauth_provider_config import OAuthState
+from src.infrastructure.persistence.repositories.oauth_provider_config_repo import (
+    OAuthProviderConfigRepository, OAuthStateRepository)
+from src.shared.utils import utc_now
+
+
+@pytest.fixture
+async def config_repo(test_db):
+    """OAuth provider config repository fixture"""
+    return OAuthProviderConfigRepository(test_db)
+
+
+async def _create_version(config_repo, tenant_id):
+    return await config_repo.create_new_version(
+        tenant_id=tenant_id,
+        provider_type="gmail",
+        client_id_encrypted="client-id",
+        client_secret_encrypted="client-secret",
+        encryption_key_id="key-1",
+        redirect_uri="https://example.com/callback",
+        scopes=["mail-r"],
+        created_by="test-user-id",
+    )
+
+
+@pytest.mark.asyncio
+async def test_activate_config_reactivates_superseded_version(config_repo, test_db, test_tenant):
+    """Test that re-activating a rotated-out version deactivates the current one"""
+    first = await _create_version(config_repo, test_tenant.id)
+    second = await _create_version(config_repo, test_tenant.id)
+    await test_db.commit()
+
+    activated = await config_repo.activate_config(first.id)
+    await test_db.commit()
+
+    assert activated is not None
+    assert activated.is_active is True
+    await test_db.refresh(second)
+    assert second.is_active is False
+
+    active = await config_repo.get_active_config(test_tenant.id, "gmail")
+    assert active is not None
+    assert active.id == first.id
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_states_counts_deleted_rows(test_db, test_tenant, test_user):
+    """Test that only expired, consumed states are deleted and counted"""
+    now = utc_now()
+
+    def _state(state_id, expires_at, consumed):
+        return OAuthState(
+            id=state_id,
+            tenant_id=test_tenant.id,
+            user_id=test_user.id,
+            provider_config_id="config-id",
+            nonce="nonce",
+            signature="signature",
+            created_at=now - timedelta(hours=2),
+            expires_at=expires_at,
+            consumed=consumed,
+        )
+
+    test_db.add_all(
+        [
+            _state("expired-consumed-1", now - timedelta(hours=1), True),
+            _state("expired-consumed-2", now - timedelta(minutes=5), True),
+            _state("expired-unconsumed", now - timedelta(hours=1), False),
+            _state("live-consumed", now + timedelta(hours=1), True),
+        ]
+    )
+    await test_db.commit()
+
+    deleted = await OAuthStateRepository(test_db).cleanup_expired_states()
+
+    assert deleted == 2
+    remaining = await test_db.scalars(select(OAuthState.id).order_by(OAuthState.id))
+    assert list(remaining) == ["expired-unconsumed", "live-consumed"]
@@ -0,0 +1,43 @@
+"""Unit tests for PermissionRepository role assignment audit events"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.persistence.repositories.permission_repo import \
+    PermissionRepository
+from src.shared.enums import AuditAction
+
+
+def _repo(result: MagicMock) -> tuple[PermissionRepository, AsyncMock]:
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    audit_service = MagicMock()
+    audit_service.emit_audit_event = AsyncMock()
+    return PermissionRepository(db, audit_service), audit_service.emit_audit_event
+
+
+@pytest.mark.asyncio
+async def test_assign_permissions_to_role_audits_each_new_assignment():
+    """Each newly inserted permission emits an ASSIGNED audit event"""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = ["perm-1", "perm-2"]
+    repo, emit = _repo(result)
+
+    assigned = await repo.assign_permissions_to_role("role-1", ["perm-1", "perm-2"], "tenant-1")
+
+    assert assigned == ["perm-1", "perm-2"]
+    assert emit.await_count == 2
+    assert {call.kwargs["action"] for call in emit.await_args_list} == {AuditAction.ASSIGNED}
+
+
+@pytest.mark.asyncio
+async def test_remove_role_from_user_audits_unassignment():
+    """Removing a granted role emits an UNASSIGNED audit event"""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = "tenant-1"
+    repo, emit = _repo(result)
+
+    assert await repo.remove_role_from_user("user-1", "role-1") is True
+    emit.assert_awaited_once()
+    assert emit.await_args.kwargs["action"] is AuditAction.UNASSIGNED
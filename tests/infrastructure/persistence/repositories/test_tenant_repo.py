@@ -0,0 +1,23 @@
+"""Unit tests for TenantRepository lookups"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.persistence.models.tenant import Tenant
+from src.infrastructure.persistence.repositories.tenant_repo import \
+    TenantRepository
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_with_for_update_locks_the_row():
+    """with_for_update=True bypasses the caches and locks the row"""
+    tenant = Tenant(id="tenant-1", code="ACME", name="Acme")
+    db = MagicMock()
+    db.get = AsyncMock(return_value=tenant)
+    cache = MagicMock()
+    repo = TenantRepository(db, cache, enable_audit=False)
+
+    assert await repo.get_by_id("tenant-1", with_for_update=True) is tenant
+    db.get.assert_awaited_once_with(Tenant, "tenant-1", with_for_update=True)
+    cache.get.assert_not_called()
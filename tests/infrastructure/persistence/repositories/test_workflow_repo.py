@@ -0,0 +1,94 @@
+"""Test workflow repository"""
+
+import pytest
+from sqlalchemy import inspect
+
+from src.infrastructure.persistence.models.workflow import (Workflow,
+                                                            WorkflowExecution)
+from src.infrastructure.persistence.repositories.workflow_repo import (
+    WorkflowExecutionRepository, WorkflowRepository)
+from src.shared.utils import utc_now
+
+
+@pytest.fixture
+async def workflow_repo(test_db):
+    """Workflow repository fixture (audit disabled)"""
+    return WorkflowRepository(test_db, enable_audit=False)
+
+
+@pytest.fixture
+async def test_workflow(test_db, test_tenant):
+    """Create test workflow"""
+    workflow = Workflow(
+        tenant_id=test_tenant.id,
+        name="Escalate",
+        trigger_event_type="issue_created",
+        actions=[{"type": "notify", "params": {}}],
+    )
+    test_db.add(workflow)
+    await test_db.commit()
+    return workflow
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_scopes_to_tenant(workflow_repo, test_workflow, test_tenant):
+    """Test that get_by_id returns the workflow only for its own tenant"""
+    found = await workflow_repo.get_by_id(test_workflow.id, test_tenant.id)
+    assert found is not None
+    assert found.id == test_workflow.id
+
+    assert await workflow_repo.get_by_id(test_workflow.id, "other-tenant-id") is None
+    assert await workflow_repo.get_by_id("missing-id", test_tenant.id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_skips_soft_deleted(workflow_repo, test_db, test_workflow, test_tenant):
+    """Test that a soft-deleted workflow is not returned"""
+    test_workflow.deleted_at = utc_now()
+    await test_db.commit()
+
+    assert await workflow_repo.get_by_id(test_workflow.id, test_tenant.id) is None
+
+
+@pytest.mark.asyncio
+async def test_activate_and_soft_delete_use_tenant_lookup(
+    workflow_repo, test_db, test_workflow, test_tenant
+):
+    """Test that the lookup-based write paths find the workflow"""
+    test_workflow.is_active = False
+    await test_db.commit()
+
+    activated = await workflow_repo.activate(test_workflow.id, test_tenant.id)
+    assert activated is not None
+    assert activated.is_active is True
+
+    assert await workflow_repo.soft_delete(test_workflow.id, test_tenant.id) is True
+    assert await workflow_repo.get_by_id(test_workflow.id, test_tenant.id) is None
+
+
+@pytest.mark.asyncio
+async def test_execution_get_by_id_uses_partition_key(test_db, test_workflow, test_tenant):
+    """Test that executions are identified by (tenant_id, id) and updates persist"""
+    repo = WorkflowExecutionRepository(test_db)
+    execution = await repo.create(
+        WorkflowExecution(
+            tenant_id=test_tenant.id,
+            workflow_id=test_workflow.id,
+            status="running",
+        )
+    )
+    await test_db.commit()
+
+    assert inspect(WorkflowExecution).identity_key_from_instance(execution)[1] == (
+        test_tenant.id,
+        execution.id,
+    )
+
+    execution.status = "completed"
+    await test_db.commit()
+    test_db.expire_all()
+
+    found = await repo.get_by_id(execution.id, test_tenant.id)
+    assert found is not None
+    assert found.status == "completed"
+    assert await repo.get_by_id(execution.id, "other-tenant-id") is None